@@ -0,0 +1,61 @@
+"""
+Runs the TDQ client-side benchmarks and writes their results as one JSON document, so runs can be compared to catch
+regressions. Run with:
+
+    python -m benchmarks [--benchmarks sql_generation result_assembly end_to_end] [--rule-counts 10 100 1000]
+                         [--output benchmark_results.json]
+
+The sharded execution benchmark generates a large Parquet dataset and is only run if requested explicitly
+(`--benchmarks sharded_execution`).
+"""
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+
+DEFAULT_BENCHMARKS = ["sql_generation", "result_assembly", "end_to_end"]
+
+
+def _run_benchmark(name: str = None, rule_counts: list = None) -> list:
+    if name == "sql_generation":
+        from benchmarks import bench_sql_generation
+        return bench_sql_generation.run(rule_counts=rule_counts)
+    elif name == "result_assembly":
+        from benchmarks import bench_result_assembly
+        return bench_result_assembly.run(rule_counts=rule_counts)
+    elif name == "end_to_end":
+        from benchmarks import bench_end_to_end
+        return bench_end_to_end.run(rule_counts=rule_counts)
+    elif name == "sharded_execution":
+        from benchmarks import bench_sharded_execution
+        return bench_sharded_execution.run()
+    raise Exception(f"Unknown benchmark `{name}`. Available benchmarks: {', '.join(DEFAULT_BENCHMARKS + ['sharded_execution'])}")
+
+
+def run(benchmarks: list = None, rule_counts: list = None) -> dict:
+    results = []
+    for name in benchmarks:
+        results.extend({"suite": name, **result} for result in _run_benchmark(name=name, rule_counts=rule_counts))
+    return {"metadata": {"timestamp": datetime.now(timezone.utc).isoformat(),
+                         "python_version": platform.python_version(),
+                         "platform": platform.platform(),
+                         "benchmarks": benchmarks,
+                         "rule_counts": rule_counts},
+            "results": results}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="TDQ client-side benchmarks")
+    parser.add_argument("--benchmarks", nargs="+", default=DEFAULT_BENCHMARKS)
+    parser.add_argument("--rule-counts", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--output", default=None, help="Output JSON file (default: stdout)")
+    arguments = parser.parse_args()
+
+    benchmark_results = run(benchmarks=arguments.benchmarks, rule_counts=arguments.rule_counts)
+    if arguments.output is None:
+        json.dump(benchmark_results, sys.stdout, indent=2)
+        print()
+    else:
+        with open(arguments.output, "w") as output_file:
+            json.dump(benchmark_results, output_file, indent=2)
@@ -0,0 +1,69 @@
+"""
+Measures the client-side overhead of `TDQEngine.run_data_quality_checks` for growing rule counts: SQL generation,
+result processing and persistence, against an in-process fake BigQuery client answering every TDQ checks query
+instantly. The time spent in BigQuery itself is not part of the measurement.
+
+Run with:
+
+    python -m benchmarks.bench_end_to_end [--rule-counts 10 100 1000 10000] [--repeat 3]
+"""
+import argparse
+import json
+import time
+
+from benchmarks.bench_sql_generation import BASE_QUERY, _prepare_rules
+
+
+def _prepare_engine():
+    import pandas as pd
+    from tdq_engine.tdq_engine import TDQEngine
+    from tdq_engine.tdq_configuration import TDQConfiguration
+    from tdq_engine.tdq_google_cloud_configuration import TDQGoogleCloudConfiguration
+    from tdq_engine.tdq_bigquery_client_pool import TDQBigQueryClientPool
+    from benchmarks.tdq_fake_bigquery_client import TDQFakeBigQueryClient
+
+    def query_handler(query: str = None):
+        # One counter per distinct condition of the fused TDQ checks query
+        predicate_count = query.count("COUNTIF(")
+        return pd.DataFrame({"row_count": [1000000], "predicate_counts": [[index % 10 for index in range(predicate_count)]]})
+
+    client_pool = TDQBigQueryClientPool(client_factory=lambda project_id: TDQFakeBigQueryClient(project=project_id, query_handler=query_handler))
+    return TDQEngine(dq_check_configuration=TDQConfiguration(tdq_check_name="benchmark", tdq_check_description="End-to-end benchmark"),
+                     gcp_configuration=TDQGoogleCloudConfiguration(project_id="benchmark_project",
+                                                                   dataset_id="benchmark_dataset",
+                                                                   tdq_summary_table="tdq_summary",
+                                                                   tdq_results_table="tdq_results"),
+                     client_pool=client_pool)
+
+
+def run(rule_counts: list = None, repeat: int = 3) -> list:
+    # One engine (and fake client) for all rule counts, TDQ tables are provisioned once per process
+    engine = _prepare_engine()
+    results = []
+    for rule_count in rule_counts:
+        tdq_rules = _prepare_rules(rule_count=rule_count)
+        # Warm up (TDQ table provisioning, lazy imports), so only the steady state of a scheduler process is measured
+        engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=tdq_rules)
+
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            run_result = engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=tdq_rules)
+            duration_seconds = time.perf_counter() - start_time
+            if not run_result["success"]:
+                raise Exception(run_result["error"])
+
+            results.append({"benchmark": "run_data_quality_checks",
+                            "rule_count": rule_count,
+                            "duration_seconds": round(duration_seconds, 6),
+                            "per_rule_microseconds": round(duration_seconds / rule_count * 1e6, 3),
+                            "phase_seconds": run_result["tdq_results"].getRunMetrics().getPhaseSeconds()})
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="TDQ end-to-end client-side overhead benchmark")
+    parser.add_argument("--rule-counts", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+    for result in run(rule_counts=arguments.rule_counts, repeat=arguments.repeat):
+        print(json.dumps(result))
@@ -0,0 +1,71 @@
+"""
+Measures the client-side cost of assembling TDQ result DataFrames for growing rule counts.
+
+The per-rule cost of every path should stay flat as the rule count grows. Run with:
+
+    python -m benchmarks.bench_result_assembly [--rule-counts 100 1000 10000]
+"""
+import argparse
+import json
+import time
+
+
+def _prepare_rules(rule_count: int, valid: bool = True) -> list:
+    from rule_definitions import rule_definitions
+    return [rule_definitions.check_NULL(column_name=f"column_{index}" if valid else None) for index in range(rule_count)]
+
+
+def _measure(function: callable, rule_count: int) -> dict:
+    start_time = time.perf_counter()
+    function()
+    duration_seconds = time.perf_counter() - start_time
+    return {"rule_count": rule_count,
+            "duration_seconds": round(duration_seconds, 6),
+            "per_rule_microseconds": round(duration_seconds / rule_count * 1e6, 3)}
+
+
+def run(rule_counts: list = None) -> list:
+    import pandas as pd
+    from tdq_engine.tdq_engine import TDQEngine
+    from tdq_engine.tdq_result import TDQResult
+
+    engine = TDQEngine()
+    results = []
+    for rule_count in rule_counts:
+        valid_rules = _prepare_rules(rule_count=rule_count)
+        invalid_rules = _prepare_rules(rule_count=rule_count, valid=False)
+        fused_results = pd.DataFrame({"row_count": [1000],
+                                      "unexpected_counts": [[index % 10 for index in range(rule_count)]],
+                                      "expected_counts": [[1000 - index % 10 for index in range(rule_count)]]})
+
+        df_invalid_results = None
+        df_fused_results = None
+
+        def generate_invalid_checks_dataset():
+            nonlocal df_invalid_results
+            df_invalid_results = engine._generate_invalid_checks_dataset(invalid_rules=invalid_rules)
+
+        def generate_fused_checks_dataset():
+            nonlocal df_fused_results
+            df_fused_results = engine._generate_fused_checks_dataset(check_uuid="benchmark", tdq_rules=valid_rules, fused_results=fused_results)
+
+        tdq_result = TDQResult()
+
+        def process_check_results():
+            tdq_result.processCheckResults(pd.concat([df_fused_results, df_invalid_results], ignore_index=True))
+
+        for name, function in [("generate_invalid_checks_dataset", generate_invalid_checks_dataset),
+                               ("generate_fused_checks_dataset", generate_fused_checks_dataset),
+                               ("process_check_results", process_check_results),
+                               ("get_results_dataframe", tdq_result.getResultsDataFrame)]:
+            results.append({"benchmark": name, **_measure(function=function, rule_count=rule_count)})
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="TDQ result assembly benchmark")
+    parser.add_argument("--rule-counts", type=int, nargs="+", default=[100, 1000, 10000])
+    arguments = parser.parse_args()
+    for result in run(rule_counts=arguments.rule_counts):
+        print(json.dumps(result))
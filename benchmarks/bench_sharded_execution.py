@@ -0,0 +1,81 @@
+"""
+Measures how TDQShardedExecutionBackend scales with the number of worker processes on a generated partitioned
+Parquet dataset. The speed-up over one worker should grow near-linearly up to the number of physical cores.
+Run with:
+
+    python -m benchmarks.bench_sharded_execution [--file-count 24] [--rows-per-file 500000] [--workers 1 2 4 8]
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+
+def _prepare_dataset(directory: str, file_count: int, rows_per_file: int, row_group_size: int):
+    import numpy as np
+    import pandas as pd
+
+    random = np.random.default_rng(seed=0)
+    for file_index in range(file_count):
+        pd.DataFrame({
+            "id": np.arange(rows_per_file) + file_index * rows_per_file,
+            "amount": np.where(random.random(rows_per_file) < 0.05, np.nan, random.normal(100, 30, rows_per_file)),
+            "country": random.choice(["DE", "NL", "TR", "US", None], rows_per_file),
+            "is_active": random.random(rows_per_file) < 0.9
+        }).to_parquet(os.path.join(directory, f"part-{file_index:05d}.parquet"), row_group_size=row_group_size)
+
+
+def _prepare_rules() -> list:
+    from rule_definitions import rule_definitions
+    return [rule_definitions.check_NOT_NULL(column_name="id"),
+            rule_definitions.check_NULL(column_name="amount", threshold=0.1),
+            rule_definitions.check_BETWEEN(column_name="amount", min_value=0, max_value=200),
+            rule_definitions.check_GREATER_THAN(column_name="amount", value=0),
+            rule_definitions.check_IN(column_name="country", values=["DE", "NL", "TR"]),
+            rule_definitions.check_NOT_NULL(column_name="country"),
+            rule_definitions.check_IS_TRUE(column_name="is_active", threshold=0.2)]
+
+
+def run(file_count: int = 24, rows_per_file: int = 500000, row_group_size: int = 100000, workers: list = None) -> list:
+    from tdq_engine.tdq_sharded_execution_backend import TDQShardedExecutionBackend
+
+    workers = workers if workers is not None else sorted({1, 2, 4, os.cpu_count() or 1})
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        _prepare_dataset(directory=directory, file_count=file_count, rows_per_file=rows_per_file, row_group_size=row_group_size)
+        tdq_rules = _prepare_rules()
+
+        baseline_seconds = None
+        for max_workers in workers:
+            with TDQShardedExecutionBackend(paths=directory, max_workers=max_workers) as backend:
+                # Warm up the worker pool, so process start-up is not measured
+                backend.executeRules(tdq_rules=tdq_rules[:1])
+                start_time = time.perf_counter()
+                execution_results = backend.executeRules(tdq_rules=tdq_rules)
+                duration_seconds = time.perf_counter() - start_time
+
+            if not execution_results["success"]:
+                raise Exception(execution_results["error"])
+            baseline_seconds = duration_seconds if baseline_seconds is None else baseline_seconds
+            row_count = int(execution_results["results"].iloc[0]["row_count"])
+            results.append({"benchmark": "sharded_execution",
+                            "max_workers": max_workers,
+                            "row_count": row_count,
+                            "rule_count": len(tdq_rules),
+                            "duration_seconds": round(duration_seconds, 6),
+                            "rows_per_second": round(row_count / duration_seconds),
+                            "speedup": round(baseline_seconds / duration_seconds, 2)})
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="TDQ sharded execution benchmark")
+    parser.add_argument("--file-count", type=int, default=24)
+    parser.add_argument("--rows-per-file", type=int, default=500000)
+    parser.add_argument("--row-group-size", type=int, default=100000)
+    parser.add_argument("--workers", type=int, nargs="+", default=None)
+    arguments = parser.parse_args()
+    for result in run(file_count=arguments.file_count, rows_per_file=arguments.rows_per_file,
+                      row_group_size=arguments.row_group_size, workers=arguments.workers):
+        print(json.dumps(result))
@@ -0,0 +1,77 @@
+"""
+Measures the client-side cost of generating the TDQ check SQL for growing rule counts: the per-rule SQL
+(`getRuleSQL`) and the complete TDQ checks query (`_prepare_tdq_check_query_config`), plus the size of the
+generated query (BigQuery rejects queries over 1 MB).
+
+The per-rule cost and size should stay flat as the rule count grows. With `--max-bytes-per-rule`, the benchmark
+fails if a generated query is larger than the given bytes per rule. Run with:
+
+    python -m benchmarks.bench_sql_generation [--rule-counts 10 100 1000 10000 50000] [--max-bytes-per-rule 100]
+"""
+import argparse
+import json
+import time
+
+BASE_QUERY = "SELECT * FROM `benchmark_project.benchmark_dataset.benchmark_table`"
+
+
+def _prepare_rules(rule_count: int, column_count: int = None) -> list:
+    # Every rule on its own column by default, so no condition is shared between rules (worst case query size)
+    column_count = rule_count if column_count is None else column_count
+    from rule_definitions import rule_definitions
+    rule_factories = [lambda column_name: rule_definitions.check_NULL(column_name=column_name),
+                      lambda column_name: rule_definitions.check_NOT_NULL(column_name=column_name, threshold=0.1),
+                      lambda column_name: rule_definitions.check_NULL_OR_EMPTY(column_name=column_name, is_trimmed=True),
+                      lambda column_name: rule_definitions.check_GREATER_THAN(column_name=column_name, value=0),
+                      lambda column_name: rule_definitions.check_BETWEEN(column_name=column_name, min_value=0, max_value=100),
+                      lambda column_name: rule_definitions.check_IN(column_name=column_name, values=["A", "B", "C"]),
+                      lambda column_name: rule_definitions.check_IS_TRUE(column_name=column_name),
+                      lambda column_name: rule_definitions.check_STRING_CONTAINS(column_name=column_name, search_value="X")]
+    return [rule_factories[index % len(rule_factories)](f"column_{index % column_count}") for index in range(rule_count)]
+
+
+def _measure(function: callable, rule_count: int) -> dict:
+    start_time = time.perf_counter()
+    result = function()
+    duration_seconds = time.perf_counter() - start_time
+    query_size_bytes = len(result.encode("utf-8"))
+    return {"rule_count": rule_count,
+            "duration_seconds": round(duration_seconds, 6),
+            "per_rule_microseconds": round(duration_seconds / rule_count * 1e6, 3),
+            "query_size_bytes": query_size_bytes,
+            "query_bytes_per_rule": round(query_size_bytes / rule_count, 1)}
+
+
+def run(rule_counts: list = None, max_bytes_per_rule: float = None) -> list:
+    from tdq_engine.tdq_engine import TDQEngine
+
+    engine = TDQEngine()
+    base_query_config = engine._prepare_tdq_base_query(query=BASE_QUERY)
+    results = []
+    for rule_count in rule_counts:
+        tdq_rules = _prepare_rules(rule_count=rule_count)
+
+        def get_rule_sql():
+            return ",".join(tdq_rule.getRuleSQL(check_uuid=base_query_config["check_uuid"]) for tdq_rule in tdq_rules)
+
+        def prepare_check_query():
+            return engine._prepare_tdq_check_query_config(base_query_config=base_query_config, tdq_rules=tdq_rules)["tdq_check_query"]
+
+        for name, function in [("get_rule_sql", get_rule_sql),
+                               ("prepare_check_query", prepare_check_query)]:
+            result = {"benchmark": name, **_measure(function=function, rule_count=rule_count)}
+            if (max_bytes_per_rule is not None) and (result["query_bytes_per_rule"] > max_bytes_per_rule):
+                raise Exception(f"`{name}` generated {result['query_bytes_per_rule']} bytes per rule for {rule_count} rules, "
+                                f"more than the limit of {max_bytes_per_rule} bytes per rule")
+            results.append(result)
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="TDQ SQL generation benchmark")
+    parser.add_argument("--rule-counts", type=int, nargs="+", default=[10, 100, 1000, 10000, 50000])
+    parser.add_argument("--max-bytes-per-rule", type=float, default=None)
+    arguments = parser.parse_args()
+    for result in run(rule_counts=arguments.rule_counts, max_bytes_per_rule=arguments.max_bytes_per_rule):
+        print(json.dumps(result))
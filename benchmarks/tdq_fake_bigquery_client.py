@@ -0,0 +1,119 @@
+class TDQFakeQueryJob:
+
+    def __init__(self, query: str = None, results: any = None, total_bytes_processed: int = None, referenced_tables: list = None,
+                 job_id: str = None):
+        self.query = query
+        self._results = results
+        self.job_id = job_id
+        self.total_bytes_processed = total_bytes_processed
+        self.total_bytes_billed = total_bytes_processed
+        self.slot_millis = 0
+        self.cache_hit = False
+        self.referenced_tables = referenced_tables if referenced_tables is not None else []
+
+    def result(self):
+        return self
+
+    def to_dataframe(self):
+        return self._results
+
+
+class TDQFakeLoadJob:
+
+    def __init__(self, destination: str = None, output_rows: int = 0):
+        self.destination = destination
+        self.output_rows = output_rows
+
+    def result(self):
+        return self
+
+
+class TDQFakeBigQueryClient:
+    """
+    In-process stand-in for `google.cloud.bigquery.Client` covering the calls made by TDQEngine.
+
+    Created tables and inserted rows are kept in memory and every submitted query is recorded. Like BigQuery
+    tables, they may be shared by several clients of the same project (`tables`/`rows`). Query results
+    are produced by `query_handler(query) -> DataFrame` and dry runs by
+    `dry_run_handler(query) -> {"total_bytes_processed": int, "referenced_tables": list}`. Plug it into the engine
+    through the client pool:
+
+        TDQBigQueryClientPool(client_factory=lambda project_id: TDQFakeBigQueryClient(project=project_id))
+    """
+
+    def __init__(self, project: str = None, query_handler: callable = None, dry_run_handler: callable = None,
+                 tables: dict = None, rows: dict = None):
+        self.project = project
+        self._query_handler = query_handler
+        self._dry_run_handler = dry_run_handler
+        self.tables = tables if tables is not None else {}
+        self.rows = rows if rows is not None else {}
+        self.created_tables = []
+        self.queries = []
+        self.dry_run_queries = []
+        self.load_jobs = []
+        self.closed = False
+
+    def _get_table_id(self, table: any = None) -> str:
+        if isinstance(table, str):
+            return table
+        return f"{table.project}.{table.dataset_id}.{table.table_id}"
+
+    def create_table(self, table: any = None, exists_ok: bool = False):
+        table_id = self._get_table_id(table)
+        self.created_tables.append(table_id)
+        if table_id in self.tables:
+            if not exists_ok:
+                raise Exception(f"Already Exists: Table {table_id}")
+        else:
+            self.tables[table_id] = table
+            self.rows[table_id] = []
+        return self.tables[table_id]
+
+    def get_table(self, table: any = None):
+        table_id = self._get_table_id(table)
+        if table_id not in self.tables:
+            raise Exception(f"Not found: Table {table_id}")
+        return self.tables[table_id]
+
+    def update_table(self, table: any = None, fields: list = None):
+        table_id = self._get_table_id(table)
+        if table_id not in self.tables:
+            raise Exception(f"Not found: Table {table_id}")
+        self.tables[table_id] = table
+        return table
+
+    def query(self, query: str = None, project: str = None, job_config: any = None):
+        if (job_config is not None) and getattr(job_config, "dry_run", False):
+            self.dry_run_queries.append(query)
+            dry_run_results = self._dry_run_handler(query) if self._dry_run_handler is not None else {}
+            return TDQFakeQueryJob(query=query,
+                                   total_bytes_processed=dry_run_results.get("total_bytes_processed", 0),
+                                   referenced_tables=dry_run_results.get("referenced_tables", []))
+        self.queries.append(query)
+        results = self._query_handler(query) if self._query_handler is not None else None
+        if results is None:
+            import pandas as pd
+            results = pd.DataFrame()
+        return TDQFakeQueryJob(query=query, results=results, total_bytes_processed=0, job_id=f"fake_job_{len(self.queries)}")
+
+    def insert_rows_from_dataframe(self, table: any = None, dataframe: any = None):
+        table_id = self._get_table_id(table)
+        if table_id not in self.tables:
+            raise Exception(f"Not found: Table {table_id}")
+        self.rows[table_id].extend(dataframe.to_dict(orient="records"))
+        return [[]]
+
+    def load_table_from_json(self, json_rows: list = None, destination: any = None, job_config: any = None):
+        table_id = self._get_table_id(destination)
+        if table_id not in self.tables:
+            raise Exception(f"Not found: Table {table_id}")
+        self.rows[table_id].extend(json_rows)
+        self.load_jobs.append(table_id)
+        return TDQFakeLoadJob(destination=table_id, output_rows=len(json_rows))
+
+    def getRows(self, table_id: str = None):
+        return self.rows.get(table_id, [])
+
+    def close(self):
+        self.closed = True
@@ -2,6 +2,10 @@ from tdq_engine.tdq_engine import TDQEngine
 from rule_definitions import rule_definitions
 from tdq_engine.tdq_configuration import TDQConfiguration
 from tdq_engine.tdq_google_cloud_configuration import TDQGoogleCloudConfiguration
+from tdq_engine.tdq_logging import configure_logging
+
+# TDQ engine logs are JSON lines. Use level=logging.DEBUG to log the generated SQL as well
+configure_logging()
 
 gcp_config = TDQGoogleCloudConfiguration(project_id="trv-data-tenant-df-stage",
                                          dataset_id="otekir",
@@ -1,8 +1,40 @@
-import json
-import uuid
+import operator
 from numbers import Number
 from rule_definitions.tdq_rule_base import TDQRuleBase, RULE_TYPE
 
+# Python equivalents of the SQL comparison operators used by the rules
+_COMPARISON_OPERATORS = {"<": operator.lt,
+                         "<=": operator.le,
+                         ">": operator.gt,
+                         ">=": operator.ge}
+
+
+def _prepare_in_sql_statement(values: list = None) -> str:
+
+    if values is None or len(values) == 0:
+        raise Exception("Values should not be NULL or EMPTY. Please define values and try again")
+
+    # Prepare IN SQL statement
+    if isinstance(values[0], Number) or isinstance(values[0], bool):
+        # Boolean or Number
+        return ','.join(str(x) for x in values)
+    else:
+        # String
+        return ','.join(f"'{x}'" for x in values)
+
+
+def _evaluate_in(values: any = None, in_values: list = None) -> any:
+    import pandas as pd
+    if in_values is None or len(in_values) == 0:
+        raise Exception("Values should not be NULL or EMPTY. Please define values and try again")
+    return pd.Series(values, dtype=object).isin(in_values).to_numpy()
+
+
+def _prepare_string_values(values: any = None, is_trimmed: bool = False) -> any:
+    import pandas as pd
+    string_values = pd.Series(values, dtype=object).astype(str)
+    return string_values.str.strip() if is_trimmed else string_values
+
 
 class check_NULL(TDQRuleBase):
 
@@ -12,29 +44,17 @@ class check_NULL(TDQRuleBase):
                          column_name=column_name,
                          threshold=threshold)
 
-    def _prepare_rule_sql(self):
-        query = f"""
-            cte_check_{str(self.getRuleCheckUUID()).replace('-', '_')} AS (
-                SELECT 
-                    "{str(self.getCheckUUID())}" AS check_uuid,
-                    "{str(self.getRuleCheckUUID())}" AS rule_uuid,
-                    "{str(self.getRuleType().value)}" AS type,
-                    "{self.getRuleCheckType()}" AS check_type,
-                    "{self.getColumnName()}" AS column_name,
-                    '{json.dumps(self.getParameters())}' AS parameters,
-                    {self.getThreshold()} AS threshold,
-                    COUNT(1) AS row_count,
-                    COUNTIF({self.getColumnName()} IS NULL) AS unexpected_count,
-                    COUNTIF({self.getColumnName()} IS NOT NULL) AS expected_count,
-                    ROUND(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} IS NULL), COUNT(1)), 0), 4) AS unexpected_ratio,
-                    ROUND(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} IS NOT NULL), COUNT(1)), 0), 4) AS expected_ratio,
-                    IF(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} IS NULL), COUNT(1)), 0) > {self.getThreshold()}, False, True) AS is_passed,
-                    {self.isValid()} AS is_valid
-                FROM
-                    {self.getBaseCTE()}
-            )
-        """
-        return query
+    def _prepare_unexpected_condition(self):
+        return f"{self.getColumnName()} IS NULL"
+
+    def _prepare_expected_condition(self):
+        return f"{self.getColumnName()} IS NOT NULL"
+
+    def _evaluate_unexpected_condition(self, values: any = None, is_null: any = None):
+        return is_null
+
+    def _evaluate_expected_condition(self, values: any = None, is_null: any = None):
+        return ~is_null
 
 
 class check_NOT_NULL(TDQRuleBase):
@@ -45,29 +65,17 @@ class check_NOT_NULL(TDQRuleBase):
                          column_name=column_name,
                          threshold=threshold)
 
-    def _prepare_rule_sql(self):
-        query = f"""
-                cte_check_{str(self.getRuleCheckUUID()).replace('-', '_')} AS (
-                    SELECT 
-                        "{str(self.getCheckUUID())}" AS check_uuid,
-                        "{str(self.getRuleCheckUUID())}" AS rule_uuid,
-                        "{self.getRuleType().value}" AS type,
-                        "{self.getRuleCheckType()}" AS check_type,
-                        "{self.getColumnName()}" AS column_name,
-                        '{json.dumps(self.getParameters())}' AS parameters,
-                        {self.getThreshold()} AS threshold,
-                        COUNT(1) AS row_count,
-                        COUNTIF({self.getColumnName()} IS NULL) AS unexpected_count,
-                        COUNTIF({self.getColumnName()} IS NOT NULL) AS expected_count,
-                        ROUND(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} IS NULL), COUNT(1)), 0), 4) AS unexpected_ratio,
-                        ROUND(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} IS NOT NULL), COUNT(1)), 0), 4) AS expected_ratio,
-                        IF(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} IS NULL), COUNT(1)), 0) > {self.getThreshold()}, False, True) AS is_passed,
-                        {self.isValid()} AS is_valid
-                    FROM
-                        {self.getBaseCTE()}
-                )
-            """
-        return query
+    def _prepare_unexpected_condition(self):
+        return f"{self.getColumnName()} IS NULL"
+
+    def _prepare_expected_condition(self):
+        return f"{self.getColumnName()} IS NOT NULL"
+
+    def _evaluate_unexpected_condition(self, values: any = None, is_null: any = None):
+        return is_null
+
+    def _evaluate_expected_condition(self, values: any = None, is_null: any = None):
+        return ~is_null
 
 
 class check_NULL_OR_EMPTY(TDQRuleBase):
@@ -80,32 +88,25 @@ class check_NULL_OR_EMPTY(TDQRuleBase):
         # Set rule specific parameter
         self.setParameter(key="is_trimmed", value=is_trimmed)
 
-    def _prepare_rule_sql(self):
+    def _prepare_unexpected_condition(self):
+        trimmed = self.getParameter(key="is_trimmed", default=False)
+        return f"{self.getColumnName()} IS NOT NULL AND {f'TRIM({self.getColumnName()})' if trimmed else self.getColumnName()} != ''"
 
+    def _prepare_expected_condition(self):
+        # Behavior change: expected_ratio used `IS NULL AND ... = ''` (always 0) while expected_count used `OR`.
+        # Both are now derived from this condition, so expected_ratio = expected_count / row_count
         trimmed = self.getParameter(key="is_trimmed", default=False)
+        return f"{self.getColumnName()} IS NULL OR {f'TRIM({self.getColumnName()})' if trimmed else self.getColumnName()} = ''"
 
-        query = f"""
-            cte_check_{str(self.getRuleCheckUUID()).replace('-', '_')} AS (
-                SELECT 
-                    "{str(self.getCheckUUID())}" AS check_uuid,
-                    "{str(self.getRuleCheckUUID())}" AS rule_uuid,
-                    "{self.getRuleType().value}" AS type,
-                    "{self.getRuleCheckType()}" AS check_type,
-                    "{self.getColumnName()}" AS column_name,
-                    '{json.dumps(self.getParameters())}' AS parameters,
-                    {self.getThreshold()} AS threshold,
-                    COUNT(1) AS row_count,
-                    COUNTIF({self.getColumnName()} IS NOT NULL AND {f"TRIM({self.getColumnName()}) != ''" if trimmed else f"{self.getColumnName()} != ''"}) AS unexpected_count,
-                    COUNTIF({self.getColumnName()} IS NULL OR {f"TRIM({self.getColumnName()}) = ''" if trimmed else f"{self.getColumnName()} = ''"}) AS expected_count,
-                    ROUND(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} IS NOT NULL AND {f"TRIM({self.getColumnName()}) != ''" if trimmed else f"{self.getColumnName()} != ''"}), COUNT(1)), 0), 4) AS unexpected_ratio,
-                    ROUND(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} IS NULL AND {f"TRIM({self.getColumnName()}) = ''" if trimmed else f"{self.getColumnName()} = ''"}), COUNT(1)), 0), 4) AS expected_ratio,
-                    IF(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} IS NOT NULL AND {f"TRIM({self.getColumnName()}) != ''" if trimmed else f"{self.getColumnName()} != ''"}), COUNT(1)), 0) > {self.getThreshold()}, False, True) AS is_passed,
-                    {self.isValid()} AS is_valid
-                FROM
-                    {self.getBaseCTE()}
-            )
-        """
-        return query
+    def _evaluate_unexpected_condition(self, values: any = None, is_null: any = None):
+        trimmed = self.getParameter(key="is_trimmed", default=False)
+        return self._evaluate_non_null(values=values, is_null=is_null,
+                                       condition=lambda x: (_prepare_string_values(values=x, is_trimmed=trimmed) != '').to_numpy())
+
+    def _evaluate_expected_condition(self, values: any = None, is_null: any = None):
+        trimmed = self.getParameter(key="is_trimmed", default=False)
+        return is_null | self._evaluate_non_null(values=values, is_null=is_null,
+                                                 condition=lambda x: (_prepare_string_values(values=x, is_trimmed=trimmed) == '').to_numpy())
 
 
 class check_GREATER_THAN(TDQRuleBase):
@@ -119,34 +120,27 @@ class check_GREATER_THAN(TDQRuleBase):
         self.setParameter(key="value", value=value)
         self.setParameter(key="or_equal", value=or_equal)
 
-    def _prepare_rule_sql(self):
+    def _prepare_unexpected_condition(self):
+        # Get rule specific parameters
+        value = self.getParameter(key="value", default=None)
+        or_equal = self.getParameter(key="or_equal", default=False)
+        return f"{self.getColumnName()} {'<' if or_equal else '<='} {value}"
 
+    def _prepare_expected_condition(self):
         # Get rule specific parameters
         value = self.getParameter(key="value", default=None)
         or_equal = self.getParameter(key="or_equal", default=False)
+        return f"{self.getColumnName()} {'>=' if or_equal else '>'} {value}"
+
+    def _evaluate_unexpected_condition(self, values: any = None, is_null: any = None):
+        value = self.getParameter(key="value", default=None)
+        comparison = _COMPARISON_OPERATORS['<' if self.getParameter(key="or_equal", default=False) else '<=']
+        return self._evaluate_non_null(values=values, is_null=is_null, condition=lambda x: comparison(x, value))
 
-        query = f"""
-            cte_check_{str(self.getRuleCheckUUID()).replace('-', '_')} AS (
-                SELECT 
-                    "{str(self.getCheckUUID())}" AS check_uuid,
-                    "{str(self.getRuleCheckUUID())}" AS rule_uuid,
-                    "{self.getRuleType().value}" AS type,
-                    "{self.getRuleCheckType()}" AS check_type,
-                    "{self.getColumnName()}" AS column_name,
-                    '{json.dumps(self.getParameters())}' AS parameters,
-                    {self.getThreshold()} AS threshold,
-                    COUNT(1) AS row_count,
-                    COUNTIF({self.getColumnName()} {"<" if or_equal else "<="} {value}) AS unexpected_count,
-                    COUNTIF({self.getColumnName()} {">=" if or_equal else ">"} {value}) AS expected_count,
-                    ROUND(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} {"<" if or_equal else "<="} {value}), COUNT(1)), 0), 4) AS unexpected_ratio,
-                    ROUND(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} {">=" if or_equal else ">"} {value}), COUNT(1)), 0), 4) AS expected_ratio,
-                    IF(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} {"<" if or_equal else "<="} {value}), COUNT(1)), 0) > {self.getThreshold()}, False, True) AS is_passed,
-                    {self.isValid()} AS is_valid
-                FROM
-                    {self.getBaseCTE()}
-            )
-        """
-        return query
+    def _evaluate_expected_condition(self, values: any = None, is_null: any = None):
+        value = self.getParameter(key="value", default=None)
+        comparison = _COMPARISON_OPERATORS['>=' if self.getParameter(key="or_equal", default=False) else '>']
+        return self._evaluate_non_null(values=values, is_null=is_null, condition=lambda x: comparison(x, value))
 
 
 class check_LESS_THAN(TDQRuleBase):
@@ -160,34 +154,27 @@ class check_LESS_THAN(TDQRuleBase):
         self.setParameter(key="value", value=value)
         self.setParameter(key="or_equal", value=or_equal)
 
-    def _prepare_rule_sql(self):
+    def _prepare_unexpected_condition(self):
+        # Get rule specific parameters
+        value = self.getParameter(key="value", default=None)
+        or_equal = self.getParameter(key="or_equal", default=False)
+        return f"{self.getColumnName()} {'>' if or_equal else '>='} {value}"
 
+    def _prepare_expected_condition(self):
         # Get rule specific parameters
         value = self.getParameter(key="value", default=None)
         or_equal = self.getParameter(key="or_equal", default=False)
+        return f"{self.getColumnName()} {'<=' if or_equal else '<'} {value}"
 
-        query = f"""
-            cte_check_{str(self.getRuleCheckUUID()).replace('-', '_')} AS (
-                SELECT 
-                    "{str(self.getCheckUUID())}" AS check_uuid,
-                    "{str(self.getRuleCheckUUID())}" AS rule_uuid,
-                    "{self.getRuleType().value}" AS type,
-                    "{self.getRuleCheckType()}" AS check_type,
-                    "{self.getColumnName()}" AS column_name,
-                    '{json.dumps(self.getParameters())}' AS parameters,
-                    {self.getThreshold()} AS threshold,
-                    COUNT(1) AS row_count,
-                    COUNTIF({self.getColumnName()} {">" if or_equal else ">="} {value}) AS unexpected_count,
-                    COUNTIF({self.getColumnName()} {"<=" if or_equal else "<"} {value}) AS expected_count,
-                    ROUND(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} {">" if or_equal else ">="} {value}), COUNT(1)), 0), 4) AS unexpected_ratio,
-                    ROUND(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} {"<=" if or_equal else "<"} {value}), COUNT(1)), 0), 4) AS expected_ratio,
-                    IF(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} {">" if or_equal else ">="} {value}), COUNT(1)), 0) > {self.getThreshold()}, False, True) AS is_passed,
-                    {self.isValid()} AS is_valid
-                FROM
-                    {self.getBaseCTE()}
-            )
-        """
-        return query
+    def _evaluate_unexpected_condition(self, values: any = None, is_null: any = None):
+        value = self.getParameter(key="value", default=None)
+        comparison = _COMPARISON_OPERATORS['>' if self.getParameter(key="or_equal", default=False) else '>=']
+        return self._evaluate_non_null(values=values, is_null=is_null, condition=lambda x: comparison(x, value))
+
+    def _evaluate_expected_condition(self, values: any = None, is_null: any = None):
+        value = self.getParameter(key="value", default=None)
+        comparison = _COMPARISON_OPERATORS['<=' if self.getParameter(key="or_equal", default=False) else '<']
+        return self._evaluate_non_null(values=values, is_null=is_null, condition=lambda x: comparison(x, value))
 
 
 class check_BETWEEN(TDQRuleBase):
@@ -204,7 +191,7 @@ class check_BETWEEN(TDQRuleBase):
         self.setParameter(key="strict_min", value=strict_min)
         self.setParameter(key="strict_max", value=strict_max)
 
-    def _prepare_rule_sql(self):
+    def _prepare_between_comparisons(self):
 
         # Get rule specific parameters
         min_value = self.getParameter(key="min_value", default=None)
@@ -215,41 +202,47 @@ class check_BETWEEN(TDQRuleBase):
         if min_value is None and max_value is None:
             raise Exception("At least min_value and/or max_value should be defined. Please check your parameters and try again")
 
-        expected_between_sql_parts = []
-        unexpected_between_sql_parts = []
+        # (operator, value) pairs
+        expected_comparisons = []
+        unexpected_comparisons = []
 
         if min_value is not None:
-            # Prepare min sql parts
-            expected_between_sql_parts.append(f"{self.getColumnName()} >= {min_value}" if strict_min else f"{self.getColumnName()} > {min_value}")
-            unexpected_between_sql_parts.append(f"{self.getColumnName()} < {min_value}" if strict_min else f"{self.getColumnName()} <= {min_value}")
+            # Prepare min comparisons
+            expected_comparisons.append((">=" if strict_min else ">", min_value))
+            unexpected_comparisons.append(("<" if strict_min else "<=", min_value))
 
         if max_value is not None:
-            # Prepare max sql parts
-            expected_between_sql_parts.append(f"{self.getColumnName()} <= {max_value}" if strict_max else f"{self.getColumnName()} < {max_value}")
-            unexpected_between_sql_parts.append(f"{self.getColumnName()} > {max_value}" if strict_max else f"{self.getColumnName()} >= {max_value}")
-
-        query = f"""
-            cte_check_{str(self.getRuleCheckUUID()).replace('-', '_')} AS (
-                SELECT 
-                    "{str(self.getCheckUUID())}" AS check_uuid,
-                    "{str(self.getRuleCheckUUID())}" AS rule_uuid,
-                    "{self.getRuleType().value}" AS type,
-                    "{self.getRuleCheckType()}" AS check_type,
-                    "{self.getColumnName()}" AS column_name,
-                    '{json.dumps(self.getParameters())}' AS parameters,
-                    {self.getThreshold()} AS threshold,
-                    COUNT(1) AS row_count,
-                    {f"COUNTIF({' OR '.join(unexpected_between_sql_parts)})"} AS unexpected_count,
-                    {f"COUNTIF({' AND '.join(expected_between_sql_parts)})"} AS expected_count,
-                    ROUND(COALESCE(SAFE_DIVIDE({f"COUNTIF({' OR '.join(unexpected_between_sql_parts)})"}, COUNT(1)), 0), 4) AS unexpected_ratio,
-                    ROUND(COALESCE(SAFE_DIVIDE({f"COUNTIF({' AND '.join(expected_between_sql_parts)})"}, COUNT(1)), 0), 4) AS expected_ratio,
-                    IF(COALESCE(SAFE_DIVIDE({f"COUNTIF({' OR '.join(unexpected_between_sql_parts)})"}, COUNT(1)), 0) > {self.getThreshold()}, False, True) AS is_passed,
-                    {self.isValid()} AS is_valid
-                FROM
-                    {self.getBaseCTE()}
-            )
-        """
-        return query
+            # Prepare max comparisons
+            expected_comparisons.append(("<=" if strict_max else "<", max_value))
+            unexpected_comparisons.append((">" if strict_max else ">=", max_value))
+
+        return expected_comparisons, unexpected_comparisons
+
+    def _prepare_between_sql_parts(self):
+        expected_comparisons, unexpected_comparisons = self._prepare_between_comparisons()
+        expected_between_sql_parts = [f"{self.getColumnName()} {comparison} {value}" for comparison, value in expected_comparisons]
+        unexpected_between_sql_parts = [f"{self.getColumnName()} {comparison} {value}" for comparison, value in unexpected_comparisons]
+        return expected_between_sql_parts, unexpected_between_sql_parts
+
+    def _prepare_unexpected_condition(self):
+        _, unexpected_between_sql_parts = self._prepare_between_sql_parts()
+        return ' OR '.join(unexpected_between_sql_parts)
+
+    def _prepare_expected_condition(self):
+        expected_between_sql_parts, _ = self._prepare_between_sql_parts()
+        return ' AND '.join(expected_between_sql_parts)
+
+    def _evaluate_unexpected_condition(self, values: any = None, is_null: any = None):
+        import numpy as np
+        _, unexpected_comparisons = self._prepare_between_comparisons()
+        return self._evaluate_non_null(values=values, is_null=is_null,
+                                       condition=lambda x: np.logical_or.reduce([_COMPARISON_OPERATORS[comparison](x, value) for comparison, value in unexpected_comparisons]))
+
+    def _evaluate_expected_condition(self, values: any = None, is_null: any = None):
+        import numpy as np
+        expected_comparisons, _ = self._prepare_between_comparisons()
+        return self._evaluate_non_null(values=values, is_null=is_null,
+                                       condition=lambda x: np.logical_and.reduce([_COMPARISON_OPERATORS[comparison](x, value) for comparison, value in expected_comparisons]))
 
 
 class check_IN(TDQRuleBase):
@@ -263,49 +256,21 @@ class check_IN(TDQRuleBase):
         # Get rule specific parameter
         self.setParameter(key="values", value=values)
 
-    def _prepare_rule_sql(self):
+    def _prepare_unexpected_condition(self):
+        in_sql_statement = _prepare_in_sql_statement(values=self.getParameter(key="values", default=[]))
+        return f"{self.getColumnName()} NOT IN({in_sql_statement})"
 
-        # Get rule specific parameter
-        values = self.getParameter(key="values", default=[])
-
-        if values is None or len(values) == 0:
-            raise Exception("Values should not be NULL or EMPTY. Please define values and try again")
-
-        # Prepare IN SQL statement
-        in_sql_statement = ""
-        if isinstance(values[0], Number) or isinstance(values[0], bool):
-            # Boolean or Number
-            in_sql_statement = ','.join(str(x) for x in values)
-        else:
-            # String
-            in_sql_statement = ','.join(f"'{x}'" for x in values)
-
-        for value in values:
-            if isinstance(value, Number):
-                ','.join(str(x) for x in values)
-
-        query = f"""
-            cte_check_{str(self.getRuleCheckUUID()).replace('-', '_')} AS (
-                SELECT 
-                    "{str(self.getCheckUUID())}" AS check_uuid,
-                    "{str(self.getRuleCheckUUID())}" AS rule_uuid,
-                    "{self.getRuleType().value}" AS type,
-                    "{self.getRuleCheckType()}" AS check_type,
-                    "{self.getColumnName()}" AS column_name,
-                    '{json.dumps(self.getParameters())}' AS parameters,
-                    {self.getThreshold()} AS threshold,
-                    COUNT(1) AS row_count,
-                    COUNTIF({self.getColumnName()} NOT IN({in_sql_statement})) AS unexpected_count,
-                    COUNTIF({self.getColumnName()} IN({in_sql_statement})) AS expected_count,
-                    ROUND(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} NOT IN({in_sql_statement})), COUNT(1)), 0), 4) AS unexpected_ratio,
-                    ROUND(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} IN({in_sql_statement})), COUNT(1)), 0), 4) AS expected_ratio,
-                    IF(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} NOT IN({in_sql_statement})), COUNT(1)), 0) > {self.getThreshold()}, False, True) AS is_passed,
-                    {self.isValid()} AS is_valid
-                FROM
-                    {self.getBaseCTE()}
-            )
-        """
-        return query
+    def _prepare_expected_condition(self):
+        in_sql_statement = _prepare_in_sql_statement(values=self.getParameter(key="values", default=[]))
+        return f"{self.getColumnName()} IN({in_sql_statement})"
+
+    def _evaluate_unexpected_condition(self, values: any = None, is_null: any = None):
+        in_values = self.getParameter(key="values", default=[])
+        return self._evaluate_non_null(values=values, is_null=is_null, condition=lambda x: ~_evaluate_in(values=x, in_values=in_values))
+
+    def _evaluate_expected_condition(self, values: any = None, is_null: any = None):
+        in_values = self.getParameter(key="values", default=[])
+        return self._evaluate_non_null(values=values, is_null=is_null, condition=lambda x: _evaluate_in(values=x, in_values=in_values))
 
 
 class check_NOT_IN(TDQRuleBase):
@@ -319,49 +284,21 @@ class check_NOT_IN(TDQRuleBase):
         # Get rule specific parameter
         self.setParameter(key="values", value=values)
 
-    def _prepare_rule_sql(self):
+    def _prepare_unexpected_condition(self):
+        in_sql_statement = _prepare_in_sql_statement(values=self.getParameter(key="values", default=[]))
+        return f"{self.getColumnName()} IN({in_sql_statement})"
 
-        # Get rule specific parameter
-        values = self.getParameter(key="values", default=[])
-
-        if values is None or len(values) == 0:
-            raise Exception("Values should not be NULL or EMPTY. Please define values and try again")
-
-        # Prepare IN SQL statement
-        in_sql_statement = ""
-        if isinstance(values[0], Number) or isinstance(values[0], bool):
-            # Boolean or Number
-            in_sql_statement = ','.join(str(x) for x in values)
-        else:
-            # String
-            in_sql_statement = ','.join(f"'{x}'" for x in values)
-
-        for value in values:
-            if isinstance(value, Number):
-                ','.join(str(x) for x in values)
-
-        query = f"""
-            cte_check_{str(self.getRuleCheckUUID()).replace('-', '_')} AS (
-                SELECT 
-                    "{str(self.getCheckUUID())}" AS check_uuid,
-                    "{str(self.getRuleCheckUUID())}" AS rule_uuid,
-                    "{self.getRuleType().value}" AS type,
-                    "{self.getRuleCheckType()}" AS check_type,
-                    "{self.getColumnName()}" AS column_name,
-                    '{json.dumps(self.getParameters())}' AS parameters,
-                    {self.getThreshold()} AS threshold,
-                    COUNT(1) AS row_count,
-                    COUNTIF({self.getColumnName()} IN({in_sql_statement})) AS unexpected_count,
-                    COUNTIF({self.getColumnName()} NOT IN({in_sql_statement})) AS expected_count,
-                    ROUND(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} IN({in_sql_statement})), COUNT(1)), 0), 4) AS unexpected_ratio,
-                    ROUND(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} NOT IN({in_sql_statement})), COUNT(1)), 0), 4) AS expected_ratio,
-                    IF(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} IN({in_sql_statement})), COUNT(1)), 0) > {self.getThreshold()}, False, True) AS is_passed,
-                    {self.isValid()} AS is_valid
-                FROM
-                    {self.getBaseCTE()}
-            )
-        """
-        return query
+    def _prepare_expected_condition(self):
+        in_sql_statement = _prepare_in_sql_statement(values=self.getParameter(key="values", default=[]))
+        return f"{self.getColumnName()} NOT IN({in_sql_statement})"
+
+    def _evaluate_unexpected_condition(self, values: any = None, is_null: any = None):
+        in_values = self.getParameter(key="values", default=[])
+        return self._evaluate_non_null(values=values, is_null=is_null, condition=lambda x: _evaluate_in(values=x, in_values=in_values))
+
+    def _evaluate_expected_condition(self, values: any = None, is_null: any = None):
+        in_values = self.getParameter(key="values", default=[])
+        return self._evaluate_non_null(values=values, is_null=is_null, condition=lambda x: ~_evaluate_in(values=x, in_values=in_values))
 
 
 class check_IS_TRUE(TDQRuleBase):
@@ -372,30 +309,17 @@ class check_IS_TRUE(TDQRuleBase):
                          column_name=column_name,
                          threshold=threshold)
 
-    def _prepare_rule_sql(self):
-
-        query = f"""
-            cte_check_{str(self.getRuleCheckUUID()).replace('-', '_')} AS (
-                SELECT 
-                    "{str(self.getCheckUUID())}" AS check_uuid,
-                    "{str(self.getRuleCheckUUID())}" AS rule_uuid,
-                    "{self.getRuleType().value}" AS type,
-                    "{self.getRuleCheckType()}" AS check_type,
-                    "{self.getColumnName()}" AS column_name,
-                    '{json.dumps(self.getParameters())}' AS parameters,
-                    {self.getThreshold()} AS threshold,
-                    COUNT(1) AS row_count,
-                    COUNTIF({self.getColumnName()} IS NOT TRUE) AS unexpected_count,
-                    COUNTIF({self.getColumnName()} IS TRUE) AS expected_count,
-                    ROUND(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} IS NOT TRUE), COUNT(1)), 0), 4) AS unexpected_ratio,
-                    ROUND(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} IS TRUE), COUNT(1)), 0), 4) AS expected_ratio,
-                    IF(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} IS NOT TRUE), COUNT(1)), 0) > {self.getThreshold()}, False, True) AS is_passed,
-                    {self.isValid()} AS is_valid
-                FROM
-                    {self.getBaseCTE()}
-            )
-        """
-        return query
+    def _prepare_unexpected_condition(self):
+        return f"{self.getColumnName()} IS NOT TRUE"
+
+    def _prepare_expected_condition(self):
+        return f"{self.getColumnName()} IS TRUE"
+
+    def _evaluate_unexpected_condition(self, values: any = None, is_null: any = None):
+        return ~self._evaluate_expected_condition(values=values, is_null=is_null)
+
+    def _evaluate_expected_condition(self, values: any = None, is_null: any = None):
+        return self._evaluate_non_null(values=values, is_null=is_null, condition=lambda x: x == True)
 
 
 class check_IS_FALSE(TDQRuleBase):
@@ -406,30 +330,17 @@ class check_IS_FALSE(TDQRuleBase):
                          column_name=column_name,
                          threshold=threshold)
 
-    def _prepare_rule_sql(self):
-
-        query = f"""
-            cte_check_{str(self.getRuleCheckUUID()).replace('-', '_')} AS (
-                SELECT 
-                    "{str(self.getCheckUUID())}" AS check_uuid,
-                    "{str(self.getRuleCheckUUID())}" AS rule_uuid,
-                    "{self.getRuleType().value}" AS type,
-                    "{self.getRuleCheckType()}" AS check_type,
-                    "{self.getColumnName()}" AS column_name,
-                    '{json.dumps(self.getParameters())}' AS parameters,
-                    {self.getThreshold()} AS threshold,
-                    COUNT(1) AS row_count,
-                    COUNTIF({self.getColumnName()} IS NOT FALSE) AS unexpected_count,
-                    COUNTIF({self.getColumnName()} IS FALSE) AS expected_count,
-                    ROUND(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} IS NOT FALSE), COUNT(1)), 0), 4) AS unexpected_ratio,
-                    ROUND(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} IS FALSE), COUNT(1)), 0), 4) AS expected_ratio,
-                    IF(COALESCE(SAFE_DIVIDE(COUNTIF({self.getColumnName()} IS NOT FALSE), COUNT(1)), 0) > {self.getThreshold()}, False, True) AS is_passed,
-                    {self.isValid()} AS is_valid
-                FROM
-                    {self.getBaseCTE()}
-            )
-        """
-        return query
+    def _prepare_unexpected_condition(self):
+        return f"{self.getColumnName()} IS NOT FALSE"
+
+    def _prepare_expected_condition(self):
+        return f"{self.getColumnName()} IS FALSE"
+
+    def _evaluate_unexpected_condition(self, values: any = None, is_null: any = None):
+        return ~self._evaluate_expected_condition(values=values, is_null=is_null)
+
+    def _evaluate_expected_condition(self, values: any = None, is_null: any = None):
+        return self._evaluate_non_null(values=values, is_null=is_null, condition=lambda x: x == False)
 
 
 class check_STRING_CONTAINS(TDQRuleBase):
@@ -445,40 +356,26 @@ class check_STRING_CONTAINS(TDQRuleBase):
         self.setParameter(key="search_value", value=search_value)
         self.setParameter(key="case_sensitive", value=case_sensitive)
 
-
-    def _prepare_rule_sql(self):
-
+    def _prepare_search_sql_statement(self):
         # Get rule specific parameters
         search_value = self.getParameter(key="search_value", default=None)
         case_sensitive = self.getParameter(key="case_sensitive", default=True)
 
         # Prepare search SQL statement
-        sql_statement = search_value if case_sensitive else f"(?i){search_value}"
-
-        query = f"""
-            cte_check_{str(self.getRuleCheckUUID()).replace('-', '_')} AS (
-                SELECT 
-                    "{str(self.getCheckUUID())}" AS check_uuid,
-                    "{str(self.getRuleCheckUUID())}" AS rule_uuid,
-                    "{self.getRuleType().value}" AS type,
-                    "{self.getRuleCheckType()}" AS check_type,
-                    "{self.getColumnName()}" AS column_name,
-                    '{json.dumps(self.getParameters())}' AS parameters,
-                    {self.getThreshold()} AS threshold,
-                    COUNT(1) AS row_count,
-                    COUNTIF(NOT REGEXP_CONTAINS({self.getColumnName()}, r'{sql_statement}')) AS unexpected_count,
-                    COUNTIF(REGEXP_CONTAINS({self.getColumnName()}, r'{sql_statement}')) AS expected_count,
-                    ROUND(COALESCE(SAFE_DIVIDE(COUNTIF(NOT REGEXP_CONTAINS({self.getColumnName()}, r'{sql_statement}')), COUNT(1)), 0), 4) AS unexpected_ratio,
-                    ROUND(COALESCE(SAFE_DIVIDE(COUNTIF(REGEXP_CONTAINS({self.getColumnName()}, r'{sql_statement}')), COUNT(1)), 0), 4) AS expected_ratio,
-                    IF(COALESCE(SAFE_DIVIDE(COUNTIF(NOT REGEXP_CONTAINS({self.getColumnName()}, r'{sql_statement}')), COUNT(1)), 0) > {self.getThreshold()}, False, True) AS is_passed,
-                    {self.isValid()} AS is_valid
-                FROM
-                    {self.getBaseCTE()}
-            )
-        """
-        return query
+        return search_value if case_sensitive else f"(?i){search_value}"
 
+    def _prepare_unexpected_condition(self):
+        return f"NOT REGEXP_CONTAINS({self.getColumnName()}, r'{self._prepare_search_sql_statement()}')"
 
+    def _prepare_expected_condition(self):
+        return f"REGEXP_CONTAINS({self.getColumnName()}, r'{self._prepare_search_sql_statement()}')"
 
+    def _evaluate_search(self, values: any = None) -> any:
+        import pandas as pd
+        return pd.Series(values, dtype=object).astype(str).str.contains(self._prepare_search_sql_statement(), regex=True).to_numpy()
 
+    def _evaluate_unexpected_condition(self, values: any = None, is_null: any = None):
+        return self._evaluate_non_null(values=values, is_null=is_null, condition=lambda x: ~self._evaluate_search(values=x))
 
+    def _evaluate_expected_condition(self, values: any = None, is_null: any = None):
+        return self._evaluate_non_null(values=values, is_null=is_null, condition=lambda x: self._evaluate_search(values=x))
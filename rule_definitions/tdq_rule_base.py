@@ -1,3 +1,5 @@
+import json
+import hashlib
 from enum import Enum
 import uuid
 from abc import abstractmethod
@@ -9,7 +11,6 @@ class RULE_TYPE(Enum):
 
 
 class TDQRuleBase:
-    import json
 
     def __init__(self, rule_type: RULE_TYPE = None,  rule_check_type: str = None, column_name: str = None, threshold: float = 0.0):
         self._initialize()
@@ -31,11 +32,66 @@ class TDQRuleBase:
     # region Abstract Method
 
     @abstractmethod
-    def _prepare_rule_sql(self):
+    def _prepare_unexpected_condition(self) -> str:
+        pass
+
+    @abstractmethod
+    def _prepare_expected_condition(self) -> str:
+        pass
+
+    @abstractmethod
+    def _evaluate_unexpected_condition(self, values: any = None, is_null: any = None) -> any:
+        pass
+
+    @abstractmethod
+    def _evaluate_expected_condition(self, values: any = None, is_null: any = None) -> any:
         pass
 
     # endregion
 
+    # region Private Methods
+
+    def _prepare_rule_sql(self, rule_uuid: uuid.UUID = None):
+        rule_uuid = self.getRuleCheckUUID() if rule_uuid is None else rule_uuid
+        unexpected_condition = self._prepare_unexpected_condition()
+        expected_condition = self._prepare_expected_condition()
+
+        # Conditions are counted once in the inner SELECT, ratios and pass/fail are derived from the counts
+        query = f"""cte_check_{str(rule_uuid).replace('-', '_')} AS (""" \
+                f"""SELECT "{str(self.getCheckUUID())}" AS check_uuid,"{str(rule_uuid)}" AS rule_uuid,"{str(self.getRuleType().value)}" AS type,""" \
+                f""""{self.getRuleCheckType()}" AS check_type,"{self.getColumnName()}" AS column_name,'{json.dumps(self.getParameters())}' AS parameters,""" \
+                f"""{self.getThreshold()} AS threshold,row_count,unexpected_count,expected_count,""" \
+                f"""ROUND(COALESCE(SAFE_DIVIDE(unexpected_count,row_count),0),4) AS unexpected_ratio,""" \
+                f"""ROUND(COALESCE(SAFE_DIVIDE(expected_count,row_count),0),4) AS expected_ratio,""" \
+                f"""IF(COALESCE(SAFE_DIVIDE(unexpected_count,row_count),0)>{self.getThreshold()},False,True) AS is_passed,{self.isValid()} AS is_valid """ \
+                f"""FROM (SELECT COUNT(1) AS row_count,COUNTIF({unexpected_condition}) AS unexpected_count,COUNTIF({expected_condition}) AS expected_count """ \
+                f"""FROM {self.getBaseCTE()}))"""
+        return query
+
+    def _evaluate_non_null(self, values: any = None, is_null: any = None, condition: callable = None) -> any:
+        """
+        Evaluates `condition(non_null_values) -> bool array` on the non-NULL values only. NULL values evaluate to False,
+        as a NULL condition result is not counted by COUNTIF.
+        """
+        import numpy as np
+        mask = np.zeros(len(values), dtype=bool)
+        non_null = ~is_null
+        if non_null.any():
+            mask[non_null] = np.asarray(condition(values[non_null]), dtype=bool)
+        return mask
+
+    # Rules that can not be evaluated with counts only keep their sketches (JSON serializable) in the rule state
+    def _init_state_sketches(self) -> dict:
+        return {}
+
+    def _update_state_sketches(self, sketches: dict = None, values: any = None, is_null: any = None) -> dict:
+        return sketches
+
+    def _merge_state_sketches(self, sketches: dict = None, other_sketches: dict = None) -> dict:
+        return sketches
+
+    # endregion
+
     # region Getters/Setters
 
     def setCheckUUID(self, base_uuid: uuid.UUID):
@@ -76,9 +132,105 @@ class TDQRuleBase:
     def getParameter(self, key: str, default: any = None):
         return self._parameters.get(key, default)
 
-    def getRuleSQL(self, check_uuid: uuid = None):
+    def getRuleSQL(self, check_uuid: uuid = None, rule_uuid: uuid = None):
+        # rule_uuid overrides the UUID written into the SQL (CTE name and rule_uuid column) without changing the rule
         self.setCheckUUID(base_uuid=check_uuid)
-        return self._prepare_rule_sql()
+        return self._prepare_rule_sql(rule_uuid=rule_uuid)
+
+    def getRuleSignature(self) -> str:
+        # Stable textual representation of the rule definition (independent of the rule/check UUIDs)
+        return json.dumps({"type": self.getRuleType().value if self.getRuleType() is not None else None,
+                           "check_type": self.getRuleCheckType(),
+                           "column_name": self.getColumnName(),
+                           "parameters": self.getParameters(),
+                           "threshold": self.getThreshold()}, sort_keys=True, default=str)
+
+    def getRuleHash(self) -> str:
+        return hashlib.sha256(self.getRuleSignature().encode("utf-8")).hexdigest()
+
+    def getUnexpectedConditionSQL(self) -> str:
+        return self._prepare_unexpected_condition()
+
+    def getExpectedConditionSQL(self) -> str:
+        return self._prepare_expected_condition()
+
+    def evaluateCounts(self, values: any = None, is_null: any = None) -> dict:
+        """
+        Evaluates the rule on the values of its column with NumPy, with the same semantics as the SQL conditions.
+
+                Parameters:
+                        values (ndarray): Values of the rule column
+                        is_null (ndarray): NULL mask of the values (computed if not defined)
+
+                Returns:
+                        counts (dict)
+                            row_count (int) : Number of values
+                            unexpected_count (int) : Number of values matching the unexpected condition
+                            expected_count (int) : Number of values matching the expected condition
+        """
+        import numpy as np
+        import pandas as pd
+        values = np.asarray(values)
+        is_null = pd.isna(values) if is_null is None else is_null
+        return {"row_count": len(values),
+                "unexpected_count": int(np.count_nonzero(self._evaluate_unexpected_condition(values=values, is_null=is_null))),
+                "expected_count": int(np.count_nonzero(self._evaluate_expected_condition(values=values, is_null=is_null)))}
+
+    def initState(self):
+        """
+        Returns an empty, mergeable state of the rule (see TDQRuleState).
+        """
+        from rule_definitions.tdq_rule_state import TDQRuleState
+        return TDQRuleState(rule_hash=self.getRuleHash(), sketches=self._init_state_sketches())
+
+    def updateState(self, state: any = None, values: any = None, is_null: any = None):
+        """
+        Evaluates the rule on a chunk of values of its column and adds the counts to the state.
+        """
+        import numpy as np
+        import pandas as pd
+        values = np.asarray(values)
+        # Computed once for the counts and the sketches
+        is_null = pd.isna(values) if is_null is None else is_null
+        rule_counts = self.evaluateCounts(values=values, is_null=is_null)
+        state.update(row_count=rule_counts["row_count"],
+                     unexpected_count=rule_counts["unexpected_count"],
+                     expected_count=rule_counts["expected_count"])
+        state.setSketches(self._update_state_sketches(sketches=state.getSketches(), values=values, is_null=is_null))
+        return state
+
+    def mergeStates(self, state: any = None, other_state: any = None):
+        """
+        Merges another partial state of the rule (e.g. of another partition, shard or day) into the state.
+        """
+        if state.getRuleHash() != other_state.getRuleHash():
+            raise Exception("States of different rule definitions can not be merged")
+        state.update(row_count=other_state.getRowCount(),
+                     unexpected_count=other_state.getUnexpectedCount(),
+                     expected_count=other_state.getExpectedCount())
+        state.setSketches(self._merge_state_sketches(sketches=state.getSketches(), other_sketches=other_state.getSketches()))
+        return state
+
+    def finalizeState(self, state: any = None) -> dict:
+        """
+        Computes the rule result from a state with the same semantics as the TDQ check query.
+
+                Parameters:
+                        state (TDQRuleState): Rule state
+
+                Returns:
+                        rule_result (dict) : row_count, unexpected_count, expected_count, unexpected_ratio, expected_ratio, is_passed
+        """
+        from rule_definitions.tdq_rule_state import round_ratio
+        row_count = state.getRowCount()
+        unexpected_ratio = state.getUnexpectedCount() / row_count if row_count > 0 else 0.0
+        expected_ratio = state.getExpectedCount() / row_count if row_count > 0 else 0.0
+        return {"row_count": row_count,
+                "unexpected_count": state.getUnexpectedCount(),
+                "expected_count": state.getExpectedCount(),
+                "unexpected_ratio": round_ratio(unexpected_ratio),
+                "expected_ratio": round_ratio(expected_ratio),
+                "is_passed": not (unexpected_ratio > self.getThreshold())}
 
     def getColumnName(self):
         return self._columnName
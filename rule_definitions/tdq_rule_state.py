@@ -0,0 +1,72 @@
+import math
+
+
+def round_ratio(ratio: float) -> float:
+    # Same rounding as BigQuery ROUND(x, 4) for non-negative values (half away from zero)
+    return math.floor(ratio * 10000 + 0.5) / 10000
+
+
+class TDQRuleState:
+    """
+    Serializable, mergeable partial result of a rule: row count and unexpected/expected counts, plus optional
+    rule specific sketches (JSON serializable dict) for rules that can not be expressed with counts.
+
+    States are created, updated, merged and finalized through the rule (`TDQRuleBase.initState`, `updateState`,
+    `mergeStates`, `finalizeState`). Only states of the same rule definition (same rule hash) can be merged.
+    """
+
+    def __init__(self, rule_hash: str = None, row_count: int = 0, unexpected_count: int = 0, expected_count: int = 0,
+                 sketches: dict = None):
+        self._ruleHash = rule_hash
+        self._rowCount = row_count
+        self._unexpectedCount = unexpected_count
+        self._expectedCount = expected_count
+        self._sketches = sketches if sketches is not None else {}
+
+    def update(self, row_count: int = 0, unexpected_count: int = 0, expected_count: int = 0):
+        self._rowCount += int(row_count)
+        self._unexpectedCount += int(unexpected_count)
+        self._expectedCount += int(expected_count)
+        return self
+
+    def setSketches(self, sketches: dict = None):
+        self._sketches = sketches if sketches is not None else {}
+
+    def getRuleHash(self) -> str:
+        return self._ruleHash
+
+    def getRowCount(self) -> int:
+        return self._rowCount
+
+    def getUnexpectedCount(self) -> int:
+        return self._unexpectedCount
+
+    def getExpectedCount(self) -> int:
+        return self._expectedCount
+
+    def getSketches(self) -> dict:
+        return self._sketches
+
+    def toDict(self) -> dict:
+        return {"rule_hash": self._ruleHash,
+                "row_count": self._rowCount,
+                "unexpected_count": self._unexpectedCount,
+                "expected_count": self._expectedCount,
+                "sketches": self._sketches}
+
+    def toJSON(self) -> str:
+        import json
+        return json.dumps(self.toDict(), sort_keys=True)
+
+    @staticmethod
+    def fromDict(state: dict = None):
+        return TDQRuleState(rule_hash=state.get("rule_hash", None),
+                            row_count=state.get("row_count", 0),
+                            unexpected_count=state.get("unexpected_count", 0),
+                            expected_count=state.get("expected_count", 0),
+                            sketches=state.get("sketches", None))
+
+    @staticmethod
+    def fromJSON(state: str = None):
+        import json
+        return TDQRuleState.fromDict(state=json.loads(state))
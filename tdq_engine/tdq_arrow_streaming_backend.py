@@ -0,0 +1,166 @@
+from tdq_engine.tdq_execution_backend import TDQExecutionBackend
+
+
+class TDQArrowStreamingBackend(TDQExecutionBackend):
+    """
+    Evaluates ROW_BASED rules on local Parquet and Arrow IPC files in bounded memory.
+
+    Files are streamed record batch by record batch (memory-mapped unless disabled) and only the columns referenced
+    by the rules are read. Every batch is evaluated with the vectorized rule evaluators and accumulated into
+    TDQRuleCounters, so memory use depends on the batch size, not on the dataset size:
+
+        backend = TDQArrowStreamingBackend(paths=["/data/impression/ymd=2023-12-01/"], batch_size=65536)
+        engine = TDQEngine(dq_check_configuration=tdq_config, execution_backend=backend)
+        engine.run_data_quality_checks(base_query=None, tdq_rules=rules)
+
+    Paths can be files, directories (all Parquet/Arrow files below them) or glob patterns. The base query is not used.
+    """
+
+    _PARQUET_EXTENSIONS = (".parquet", ".parq")
+    _ARROW_EXTENSIONS = (".arrow", ".arrows", ".feather", ".ipc")
+
+    def __init__(self, paths: any = None, batch_size: int = 65536, memory_map: bool = True):
+        self._paths = [paths] if isinstance(paths, str) else list(paths or [])
+        self._batch_size = batch_size
+        self._memory_map = memory_map
+
+    # region Private Methods
+
+    def _is_parquet_file(self, path: str) -> bool:
+        return path.lower().endswith(self._PARQUET_EXTENSIONS)
+
+    def _is_arrow_file(self, path: str) -> bool:
+        return path.lower().endswith(self._ARROW_EXTENSIONS)
+
+    def _resolve_paths(self) -> list:
+        import os
+        import glob
+
+        resolved_paths = []
+        for path in self._paths:
+            if os.path.isdir(path):
+                for directory, _, file_names in sorted(os.walk(path)):
+                    resolved_paths.extend(os.path.join(directory, file_name) for file_name in sorted(file_names)
+                                          if self._is_parquet_file(file_name) or self._is_arrow_file(file_name))
+            elif glob.has_magic(path):
+                resolved_paths.extend(sorted(glob.glob(path, recursive=True)))
+            else:
+                resolved_paths.append(path)
+
+        if len(resolved_paths) == 0:
+            raise Exception("No input files found. Please check the paths and try again")
+        for path in resolved_paths:
+            if not (self._is_parquet_file(path) or self._is_arrow_file(path)):
+                raise Exception(f"Unsupported input file `{path}`. Supported file types: {', '.join(self._PARQUET_EXTENSIONS + self._ARROW_EXTENSIONS)}")
+        return resolved_paths
+
+    def _check_columns(self, path: str, schema_names: list, columns: list):
+        missing_columns = [column for column in columns if column not in schema_names]
+        if len(missing_columns) > 0:
+            raise Exception(f"Column(s) {', '.join(f'`{column}`' for column in missing_columns)} not found in `{path}`")
+
+    def _iter_parquet_batches(self, path: str, columns: list, row_groups: list = None):
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path, memory_map=self._memory_map)
+        self._check_columns(path=path, schema_names=parquet_file.schema_arrow.names, columns=columns)
+        yield from parquet_file.iter_batches(batch_size=self._batch_size, columns=columns, row_groups=row_groups)
+
+    def _iter_arrow_batches(self, path: str, columns: list):
+        import pyarrow as pa
+
+        with (pa.memory_map(path, "r") if self._memory_map else pa.OSFile(path, "r")) as source:
+            try:
+                reader = pa.ipc.open_file(source)
+                batches = (reader.get_batch(batch_index) for batch_index in range(reader.num_record_batches))
+            except pa.ArrowInvalid:
+                # Arrow IPC stream format
+                source.seek(0)
+                reader = pa.ipc.open_stream(source)
+                batches = iter(reader)
+            self._check_columns(path=path, schema_names=reader.schema.names, columns=columns)
+
+            for batch in batches:
+                # Batches of memory-mapped files are zero-copy views, slicing them does not copy either
+                for offset in range(0, batch.num_rows, self._batch_size):
+                    yield batch.slice(offset, self._batch_size)
+
+    def _iter_batches(self, path: str, columns: list, row_groups: list = None):
+        if self._is_parquet_file(path):
+            return self._iter_parquet_batches(path=path, columns=columns, row_groups=row_groups)
+        else:
+            return self._iter_arrow_batches(path=path, columns=columns)
+
+    def _evaluate_batch(self, batch: any = None, tdq_rules: list = None, rule_indexes_by_column: dict = None):
+        unexpected_counts = [0] * len(tdq_rules)
+        expected_counts = [0] * len(tdq_rules)
+        for column_name, rule_indexes in rule_indexes_by_column.items():
+            column = batch.column(batch.schema.get_field_index(column_name))
+            self._evaluate_column_rules(values=column.to_numpy(zero_copy_only=False),
+                                        is_null=column.is_null().to_numpy(zero_copy_only=False),
+                                        tdq_rules=tdq_rules, rule_indexes=rule_indexes,
+                                        unexpected_counts=unexpected_counts, expected_counts=expected_counts)
+        return unexpected_counts, expected_counts
+
+    def _evaluate_file(self, path: str, tdq_rules: list = None, row_groups: list = None, row_limit: int = None):
+        """
+        Streams a file (or the given Parquet row groups of it) and returns the accumulated TDQRuleCounters.
+        """
+        from tdq_engine.tdq_rule_counters import TDQRuleCounters
+
+        rule_counters = TDQRuleCounters(rule_count=len(tdq_rules))
+        rule_indexes_by_column = self._group_rules_by_column(tdq_rules=tdq_rules)
+        for batch in self._iter_batches(path=path, columns=list(rule_indexes_by_column), row_groups=row_groups):
+            if row_limit is not None:
+                if rule_counters.getRowCount() >= row_limit:
+                    break
+                batch = batch.slice(0, row_limit - rule_counters.getRowCount())
+            unexpected_counts, expected_counts = self._evaluate_batch(batch=batch, tdq_rules=tdq_rules, rule_indexes_by_column=rule_indexes_by_column)
+            rule_counters.update(row_count=batch.num_rows, unexpected_counts=unexpected_counts, expected_counts=expected_counts)
+        return rule_counters
+
+    # endregion
+
+    # region Public Methods
+
+    def setPaths(self, paths: any = None):
+        self._paths = [paths] if isinstance(paths, str) else list(paths or [])
+
+    def getPaths(self) -> list:
+        return self._paths
+
+    def setBatchSize(self, batch_size: int = 65536):
+        self._batch_size = batch_size
+
+    def getBatchSize(self) -> int:
+        return self._batch_size
+
+    def setMemoryMap(self, memory_map: bool = True):
+        self._memory_map = memory_map
+
+    def isMemoryMap(self) -> bool:
+        return self._memory_map
+
+    def executeRules(self, tdq_rules: list = None, row_limit: int = None) -> dict:
+        from tdq_engine.tdq_rule_counters import TDQRuleCounters
+
+        try:
+            rule_counters = TDQRuleCounters(rule_count=len(tdq_rules))
+            for path in self._resolve_paths():
+                if (row_limit is not None) and (rule_counters.getRowCount() >= row_limit):
+                    break
+                rule_counters.merge(self._evaluate_file(path=path, tdq_rules=tdq_rules,
+                                                        row_limit=row_limit - rule_counters.getRowCount() if row_limit is not None else None))
+            return {"success": True, "results": self._prepare_counters_results(row_count=rule_counters.getRowCount(),
+                                                                               unexpected_counts=rule_counters.getUnexpectedCounts(),
+                                                                               expected_counts=rule_counters.getExpectedCounts())}
+        except Exception as ex:
+            return {"success": False, "error": str(ex)}
+
+    def isQueryBackend(self) -> bool:
+        return False
+
+    def isLocal(self) -> bool:
+        return True
+
+    # endregion
@@ -0,0 +1,99 @@
+import queue
+import threading
+
+
+class TDQBackgroundWriter:
+    """
+    Write-behind persistence of TDQ results on a background thread.
+
+    Results are handed over through a bounded queue (submitting blocks while the queue is full) and saved with
+    `save_function(tdq_result, **save_arguments) -> dict`, with the keyword arguments given to `submit` (e.g. the
+    log fields of the check, captured when the result is queued). While the queue is idle, `idle_function()` is called every
+    `idle_interval_seconds` seconds, e.g. to flush time based buffers.
+    """
+
+    _STOP = object()
+
+    def __init__(self, save_function: callable = None, queue_size: int = 100,
+                 idle_function: callable = None, idle_interval_seconds: float = 1.0):
+        self._save_function = save_function
+        self._idle_function = idle_function
+        self._idle_interval_seconds = idle_interval_seconds
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._errors = []
+        self._errors_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="TDQBackgroundWriter", daemon=True)
+        self._thread.start()
+
+    # region Private Methods
+
+    def _add_error(self, tdq_result: any = None, error: any = None):
+        with self._errors_lock:
+            self._errors.append({"check_uuid": tdq_result.getCheckUUID() if tdq_result is not None else None, "error": error})
+
+    def _run(self):
+        while True:
+            try:
+                queued_item = self._queue.get(timeout=self._idle_interval_seconds)
+            except queue.Empty:
+                if self._idle_function is not None:
+                    try:
+                        self._idle_function()
+                    except Exception as ex:
+                        self._add_error(error=str(ex))
+                continue
+
+            tdq_result = None
+            try:
+                if queued_item is self._STOP:
+                    return
+                tdq_result, save_arguments = queued_item
+                save_result = self._save_function(tdq_result, **save_arguments)
+                if not save_result["success"]:
+                    self._add_error(tdq_result=tdq_result, error=save_result.get("error", "Unknown error"))
+            except Exception as ex:
+                self._add_error(tdq_result=tdq_result, error=str(ex))
+            finally:
+                self._queue.task_done()
+
+    # endregion
+
+    # region Public Methods
+
+    def submit(self, tdq_result: any = None, **save_arguments):
+        if not self._thread.is_alive():
+            raise Exception("TDQ background writer is closed")
+        self._queue.put((tdq_result, save_arguments))
+
+    def getPendingCount(self) -> int:
+        return self._queue.unfinished_tasks
+
+    def isAlive(self) -> bool:
+        return self._thread.is_alive()
+
+    def flush(self) -> dict:
+        """
+        Waits until every submitted result has been saved.
+
+                Returns:
+                        flush_result (dict)
+                            success (bool) : True if all results submitted since the last flush were saved
+                            error (list) : Errors of the failed saves (only if not successful)
+        """
+        self._queue.join()
+        with self._errors_lock:
+            errors = self._errors
+            self._errors = []
+        if len(errors) == 0:
+            return {"success": True}
+        else:
+            return {"success": False, "error": errors}
+
+    def close(self) -> dict:
+        flush_result = self.flush()
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+        return flush_result
+
+    # endregion
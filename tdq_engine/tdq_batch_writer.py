@@ -0,0 +1,150 @@
+import threading
+import time
+
+
+class TDQBatchWriter:
+    """
+    Buffers TDQ summary/results rows per destination table and writes them with BigQuery load jobs
+    (one load job per table and flush) instead of streaming inserts.
+
+    The buffer is flushed when it holds at least `max_rows` rows or its oldest row is older than `max_seconds`
+    seconds. Load jobs of all buffered tables are submitted together and awaited afterwards. The rows of a table
+    whose load job failed are kept in the buffer and written with the next flush (load jobs are atomic).
+    """
+
+    def __init__(self, client_getter: callable = None, max_rows: int = 10000, max_seconds: float = 60.0):
+        self._client_getter = client_getter
+        self._max_rows = max_rows
+        self._max_seconds = max_seconds
+        self._buffers = {}
+        self._buffered_row_count = 0
+        self._buffer_start_time = None
+        self._lock = threading.RLock()
+
+    # region Private Methods
+
+    def _prepare_json_rows(self, dataframe: any = None, schema: list = None) -> list:
+        import json
+        import pandas as pd
+
+        json_fields = {field.name for field in schema if field.field_type == "JSON"}
+        schema_fields = {field.name for field in schema}
+
+        json_rows = []
+        for record in dataframe.to_dict(orient="records"):
+            json_row = {}
+            for key, value in record.items():
+                if key not in schema_fields:
+                    continue
+                if (not isinstance(value, (list, dict))) and pd.isna(value):
+                    value = None
+                elif hasattr(value, "isoformat"):
+                    value = value.isoformat()
+                elif hasattr(value, "item"):
+                    # NumPy scalar
+                    value = value.item()
+                elif (key in json_fields) and isinstance(value, str):
+                    value = json.loads(value)
+                json_row[key] = value
+            json_rows.append(json_row)
+        return json_rows
+
+    def _restore_buffers(self, buffers: dict = None, buffer_start_time: float = None):
+        # Failed rows go back before the rows appended since the flush started
+        with self._lock:
+            for table_id, buffer in buffers.items():
+                if table_id in self._buffers:
+                    self._buffers[table_id]["rows"] = buffer["rows"] + self._buffers[table_id]["rows"]
+                else:
+                    self._buffers[table_id] = buffer
+                self._buffered_row_count += len(buffer["rows"])
+            if len(buffers) > 0:
+                self._buffer_start_time = buffer_start_time if self._buffer_start_time is None else min(buffer_start_time, self._buffer_start_time)
+
+    # endregion
+
+    # region Public Methods
+
+    def append(self, project_id: str = None, table_id: str = None, dataframe: any = None, schema: list = None):
+        if dataframe is None or len(dataframe) == 0:
+            return
+        with self._lock:
+            if table_id not in self._buffers:
+                self._buffers[table_id] = {"project_id": project_id, "schema": schema, "rows": []}
+            self._buffers[table_id]["rows"].extend(self._prepare_json_rows(dataframe=dataframe, schema=schema))
+            self._buffered_row_count += len(dataframe)
+            if self._buffer_start_time is None:
+                self._buffer_start_time = time.monotonic()
+
+    def setMaxRows(self, max_rows: int = 10000):
+        self._max_rows = max_rows
+
+    def setMaxSeconds(self, max_seconds: float = 60.0):
+        self._max_seconds = max_seconds
+
+    def getBufferedRowCount(self) -> int:
+        return self._buffered_row_count
+
+    def isFlushRequired(self) -> bool:
+        with self._lock:
+            if self._buffered_row_count == 0:
+                return False
+            if (self._max_rows is not None) and (self._buffered_row_count >= self._max_rows):
+                return True
+            if (self._max_seconds is not None) and (time.monotonic() - self._buffer_start_time >= self._max_seconds):
+                return True
+            return False
+
+    def flush(self) -> dict:
+        """
+        Writes all buffered rows with one load job per destination table. The rows of the failed load jobs stay
+        in the buffer.
+
+                Returns:
+                        flush_result (dict)
+                            success (bool) : True if all load jobs finished successfully
+                            row_count (int) : Number of rows written
+                            error (list) : Load job errors (only if not successful)
+        """
+        from google.cloud import bigquery
+
+        with self._lock:
+            buffers = self._buffers
+            row_count = self._buffered_row_count
+            buffer_start_time = self._buffer_start_time
+            self._buffers = {}
+            self._buffered_row_count = 0
+            self._buffer_start_time = None
+
+        if row_count == 0:
+            return {"success": True, "row_count": 0}
+
+        errors = []
+        failed_table_ids = []
+        load_jobs = []
+        for table_id, buffer in buffers.items():
+            try:
+                job_config = bigquery.LoadJobConfig(schema=buffer["schema"],
+                                                    source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+                                                    write_disposition=bigquery.WriteDisposition.WRITE_APPEND)
+                client = self._client_getter(buffer["project_id"])
+                load_jobs.append((table_id, client.load_table_from_json(json_rows=buffer["rows"], destination=table_id, job_config=job_config)))
+            except Exception as ex:
+                errors.append([f"{table_id}: {str(ex)}"])
+                failed_table_ids.append(table_id)
+
+        for table_id, load_job in load_jobs:
+            try:
+                load_job.result()
+            except Exception as ex:
+                errors.append([f"{table_id}: {str(ex)}"])
+                failed_table_ids.append(table_id)
+
+        self._restore_buffers(buffers={table_id: buffers[table_id] for table_id in failed_table_ids}, buffer_start_time=buffer_start_time)
+        row_count -= sum(len(buffers[table_id]["rows"]) for table_id in failed_table_ids)
+        if len(errors) == 0:
+            return {"success": True, "row_count": row_count}
+        else:
+            return {"success": False, "row_count": row_count, "error": errors}
+
+    # endregion
@@ -0,0 +1,54 @@
+import threading
+
+
+class TDQBigQueryClientPool:
+    """
+    Thread-safe pool of BigQuery clients keyed by project id.
+
+    Clients are created lazily on first use and reused until the pool is closed, so auth and transport setup
+    is paid once per project and process instead of once per operation. A custom client factory (e.g. a fake
+    in-process client for tests) can be plugged in instead of `google.cloud.bigquery.Client`.
+    """
+
+    def __init__(self, client_factory: callable = None):
+        self._client_factory = client_factory
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def _create_client(self, project_id: str = None):
+        if self._client_factory is not None:
+            return self._client_factory(project_id)
+        from google.cloud import bigquery
+        return bigquery.Client(project=project_id)
+
+    def setClientFactory(self, client_factory: callable = None):
+        self._client_factory = client_factory
+
+    def setClient(self, project_id: str = None, client: any = None):
+        with self._lock:
+            self._clients[project_id] = client
+
+    def getClient(self, project_id: str = None):
+        with self._lock:
+            client = self._clients.get(project_id, None)
+            if client is None:
+                client = self._create_client(project_id=project_id)
+                self._clients[project_id] = client
+            return client
+
+    def getClientCount(self):
+        with self._lock:
+            return len(self._clients)
+
+    def close(self):
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients = {}
+        for client in clients:
+            client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -1,9 +1,32 @@
+from enum import Enum
+
+
+class BUDGET_ACTION(Enum):
+    REFUSE = "REFUSE"
+    SAMPLE = "SAMPLE"
+
+
 class TDQConfiguration:
 
-    def __init__(self, tdq_check_name: str = "", tdq_check_description: str = "", tdq_check_parameters: dict = {}):
+    def __init__(self, tdq_check_name: str = "", tdq_check_description: str = "", tdq_check_parameters: dict = {},
+                 deterministic_sql: bool = False, incremental_column: str = None, incremental_column_type: str = "DATE",
+                 result_cache: bool = False, result_cache_days: int = 7, sample_percent: float = None, confidence_level: float = 0.95,
+                 adaptive_sample_percent: float = None, adaptive_margin: float = 0.05,
+                 maximum_bytes_billed: int = None, budget_action: BUDGET_ACTION = BUDGET_ACTION.REFUSE):
         self._tdq_check_name = tdq_check_name
         self._tdq_check_description = tdq_check_description
         self._tdq_check_parameters = tdq_check_parameters
+        self._deterministic_sql = deterministic_sql
+        self._incremental_column = incremental_column
+        self._incremental_column_type = incremental_column_type
+        self._result_cache = result_cache
+        self._result_cache_days = result_cache_days
+        self._sample_percent = sample_percent
+        self._confidence_level = confidence_level
+        self._adaptive_sample_percent = adaptive_sample_percent
+        self._adaptive_margin = adaptive_margin
+        self._maximum_bytes_billed = maximum_bytes_billed
+        self._budget_action = budget_action
 
     def setTDQCheckName(self, tdq_check_name: str):
         self._tdq_check_name = tdq_check_name
@@ -14,6 +37,85 @@ class TDQConfiguration:
     def addTDQCheckParameter(self, key: str, value: any = None):
         self._tdq_check_parameters[key] = value
 
+    def setDeterministicSQL(self, deterministic_sql: bool = True):
+        """
+        If True, the generated TDQ check query is a pure function of the base query and the rule definitions,
+        so re-runs of an unchanged suite can be served from BigQuery's query result cache.
+        Check and rule UUIDs are attached client-side once the results come back.
+        """
+        self._deterministic_sql = deterministic_sql
+
+    def setIncrementalColumn(self, incremental_column: str = None, incremental_column_type: str = "DATE"):
+        """
+        Enables incremental TDQ checks. Rule counters are stored per partition of the incremental column (per day
+        for DATE, DATETIME and TIMESTAMP columns, per value otherwise). Every run re-checks the watermark partition
+        (the greatest checked partition, rows may arrive late) and the NULL partition, checks the newer partitions
+        and rolls the counters up with the stored counters of the older partitions. Set to None to disable.
+
+                Parameters:
+                        incremental_column (str): Partition or timestamp column of the base query
+                        incremental_column_type (str): BigQuery type of the column (DATE, DATETIME, TIMESTAMP, INT64 or STRING)
+        """
+        self._incremental_column = incremental_column
+        self._incremental_column_type = incremental_column_type
+
+    def setResultCache(self, result_cache: bool = True, result_cache_days: int = 7):
+        """
+        If True, the last modified time of the tables referenced by the base query (found with a dry run) and the
+        rule set hash are recorded with every run in the TDQ summary table. If neither has changed since the last
+        full (not sampled) run, the stored TDQ check results are returned instead of re-executing the checks (cache hit).
+        Only enable it for base queries that are deterministic for unchanged tables (e.g. no CURRENT_DATE()).
+
+                Parameters:
+                        result_cache (bool): Enables the result cache
+                        result_cache_days (int): Only runs of the last days are looked up (bounds the scanned check_date partitions)
+        """
+        self._result_cache = result_cache
+        self._result_cache_days = result_cache_days
+
+    def setSampling(self, sample_percent: float = None, confidence_level: float = 0.95):
+        """
+        Enables sampled TDQ checks. The driving table of the base query (the first table of its FROM clause, see
+        `TDQQueryRewriter.sample`) is read with `TABLESAMPLE SYSTEM (sample_percent PERCENT)`, joined tables are read
+        in full. Unexpected ratios are reported with a confidence interval and a check only passes/fails if the
+        interval is clear of the threshold (otherwise it is inconclusive). Set sample_percent to None to disable.
+
+                Parameters:
+                        sample_percent (float): Percentage of the driving table blocks to read (0-100]
+                        confidence_level (float): Confidence level of the unexpected ratio intervals
+        """
+        self._sample_percent = sample_percent
+        self._confidence_level = confidence_level
+
+    def setAdaptiveExecution(self, sample_percent: float = None, margin: float = 0.05):
+        """
+        Enables adaptive two-phase TDQ checks. All rules are checked on a TABLESAMPLE of the driving table first,
+        then only the rules that did not clearly pass (failed, inconclusive or unexpected ratio within `margin` of the
+        threshold) are checked again on all rows. Ignored if sampling (`setSampling`) or incremental checks are enabled.
+        Set sample_percent to None to disable.
+
+                Parameters:
+                        sample_percent (float): Percentage of the driving table blocks read in the first phase (0-100]
+                        margin (float): Rules with a sampled unexpected ratio within this distance of the threshold are re-checked
+        """
+        self._adaptive_sample_percent = sample_percent
+        self._adaptive_margin = margin
+
+    def setMaximumBytesBilled(self, maximum_bytes_billed: int = None, budget_action: BUDGET_ACTION = BUDGET_ACTION.REFUSE):
+        """
+        Sets the per-run bytes budget of the TDQ check query on BigQuery. The bytes processed by the query are
+        estimated with a dry run before it is executed. If the estimate exceeds the budget, the run is refused
+        (REFUSE) or the driving table is sampled down to the budget (SAMPLE, see `setSampling`). The budget is also
+        set as `maximum_bytes_billed` of the query job, so the query still runs (and fails instead of billing more
+        than the budget) if the dry run fails. Set to None to disable (no dry run is made).
+
+                Parameters:
+                        maximum_bytes_billed (int): Bytes budget of the TDQ check query
+                        budget_action (BUDGET_ACTION): Action if the estimated bytes exceed the budget
+        """
+        self._maximum_bytes_billed = maximum_bytes_billed
+        self._budget_action = budget_action
+
     def getTDQCheckName(self):
         return self._tdq_check_name
 
@@ -25,3 +127,45 @@ class TDQConfiguration:
 
     def getTDQParameters(self):
         return self._tdq_check_parameters
+
+    def isDeterministicSQL(self):
+        return self._deterministic_sql
+
+    def getIncrementalColumn(self):
+        return self._incremental_column
+
+    def getIncrementalColumnType(self):
+        return self._incremental_column_type
+
+    def isIncremental(self):
+        return self._incremental_column is not None
+
+    def isResultCache(self):
+        return self._result_cache
+
+    def getResultCacheDays(self):
+        return self._result_cache_days
+
+    def getSamplePercent(self):
+        return self._sample_percent
+
+    def getConfidenceLevel(self):
+        return self._confidence_level
+
+    def isSampling(self):
+        return self._sample_percent is not None
+
+    def getAdaptiveSamplePercent(self):
+        return self._adaptive_sample_percent
+
+    def getAdaptiveMargin(self):
+        return self._adaptive_margin
+
+    def isAdaptive(self):
+        return (self._adaptive_sample_percent is not None) and (not self.isSampling()) and (not self.isIncremental())
+
+    def getMaximumBytesBilled(self):
+        return self._maximum_bytes_billed
+
+    def getBudgetAction(self):
+        return self._budget_action
@@ -0,0 +1,130 @@
+import threading
+from tdq_engine.tdq_execution_backend import TDQExecutionBackend
+
+
+class TDQDuckDBBackend(TDQExecutionBackend):
+    """
+    Runs TDQ check queries locally on DuckDB, e.g. against Parquet/CSV/JSON extracts or in-memory DataFrames.
+
+    The base query addresses its sources by name. Sources are registered as DuckDB views:
+
+        backend = TDQDuckDBBackend(sources={"impression": "/data/impression/*.parquet"})
+        engine = TDQEngine(dq_check_configuration=tdq_config, execution_backend=backend)
+        engine.run_data_quality_checks(base_query="SELECT * FROM impression", tdq_rules=rules)
+
+    Queries are translated from BigQuery Standard SQL to DuckDB SQL before execution (see `translateQuery`).
+    """
+
+    _FILE_READERS = {".parquet": "read_parquet",
+                     ".csv": "read_csv_auto",
+                     ".tsv": "read_csv_auto",
+                     ".json": "read_json_auto",
+                     ".jsonl": "read_json_auto",
+                     ".ndjson": "read_json_auto"}
+
+    def __init__(self, sources: dict = None, database: str = ":memory:", connection: any = None):
+        self._database = database
+        self._connection = connection
+        self._lock = threading.Lock()
+        self._sources = {}
+        for source_name, source in (sources or {}).items():
+            self.registerSource(source_name=source_name, source=source)
+
+    # region Private Methods
+
+    def _get_connection(self):
+        import duckdb
+        if self._connection is None:
+            self._connection = duckdb.connect(database=self._database)
+            # Re-create the source views of a closed connection
+            for source_name, source in self._sources.items():
+                self._create_source_view(source_name=source_name, source=source)
+        return self._connection
+
+    def _quote_identifier(self, identifier: str) -> str:
+        return '"' + identifier.replace('"', '""') + '"'
+
+    def _quote_literal(self, value: str) -> str:
+        return "'" + value.replace("'", "''") + "'"
+
+    def _get_file_reader(self, path: str) -> str:
+        for extension, file_reader in self._FILE_READERS.items():
+            if path.lower().endswith(extension):
+                return file_reader
+        raise Exception(f"Unsupported source file `{path}`. Supported file types: {', '.join(self._FILE_READERS)}")
+
+    def _create_source_view(self, source_name: str, source: any = None):
+        connection = self._get_connection()
+        if isinstance(source, (str, list, tuple)):
+            paths = [source] if isinstance(source, str) else list(source)
+            if len(paths) == 0:
+                raise Exception(f"Source `{source_name}` has no files")
+            file_reader = self._get_file_reader(paths[0])
+            connection.execute(f"CREATE OR REPLACE VIEW {self._quote_identifier(source_name)} AS "
+                               f"SELECT * FROM {file_reader}([{', '.join(self._quote_literal(path) for path in paths)}])")
+        else:
+            # DataFrame, Arrow table or any other object DuckDB can scan
+            connection.register(source_name, source)
+
+    # endregion
+
+    # region Public Methods
+
+    def registerSource(self, source_name: str = None, source: any = None):
+        """
+        Registers a source the base query can select from.
+
+                Parameters:
+                        source_name (str): Name of the source in the base query (e.g. `project.dataset.table`)
+                        source (str/list/DataFrame): Parquet/CSV/JSON file path, glob pattern or list of paths,
+                                                     or an in-memory DataFrame/Arrow table
+        """
+        with self._lock:
+            self._create_source_view(source_name=source_name, source=source)
+            self._sources[source_name] = source
+
+    def getSources(self) -> dict:
+        return self._sources
+
+    def translateQuery(self, query: str = None) -> str:
+        """
+        Translates a TDQ check query from BigQuery Standard SQL to DuckDB SQL with sqlglot (e.g. SAFE_DIVIDE returns
+        NULL for a zero divisor, raw/double quoted strings become single quoted strings). COUNTIF becomes
+        `COUNT(CASE WHEN ... THEN 1 END)`: like BigQuery COUNTIF it counts 0 rows of an empty input, DuckDB COUNT_IF
+        returns NULL.
+
+        Sources are registered under their full name, so a multi-part table name (`project.dataset.table`)
+        becomes a single quoted identifier instead of a catalog/schema/table reference.
+        """
+        from sqlglot import exp
+        from tdq_engine.tdq_query_rewriter import TDQQueryRewriter
+
+        expression = TDQQueryRewriter(dialect="bigquery").parseQuery(query=query)
+        for table in expression.find_all(exp.Table):
+            if table.args.get("db") is not None:
+                table.set("this", exp.to_identifier(".".join(part.name for part in table.parts), quoted=True))
+                table.set("db", None)
+                table.set("catalog", None)
+        expression = expression.transform(lambda node: exp.Count(this=exp.If(this=node.this, true=exp.Literal.number(1)))
+                                          if isinstance(node, exp.CountIf) else node)
+        return expression.sql(dialect="duckdb")
+
+    def executeQuery(self, query: str = None) -> dict:
+        try:
+            translated_query = self.translateQuery(query=query)
+            with self._lock:
+                execution_results = self._get_connection().execute(translated_query).df()
+            return {"success": True, "results": execution_results}
+        except Exception as ex:
+            return {"success": False, "error": str(ex)}
+
+    def isLocal(self) -> bool:
+        return True
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    # endregion
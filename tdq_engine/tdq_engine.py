@@ -3,30 +3,204 @@ class TDQEngine:
     from tdq_engine.tdq_configuration import TDQConfiguration
     from tdq_engine.tdq_result import TDQResult
     from tdq_engine.tdq_google_cloud_configuration import TDQGoogleCloudConfiguration
-
-    def __init__(self, dq_check_configuration: TDQConfiguration = None, gcp_configuration: TDQGoogleCloudConfiguration = None):
+    from tdq_engine.tdq_bigquery_client_pool import TDQBigQueryClientPool
+    from tdq_engine.tdq_provisioning_cache import TDQProvisioningCache
+    from tdq_engine.tdq_execution_backend import TDQExecutionBackend
+    from tdq_engine.tdq_tracer import TDQTracer
+
+    # BigQuery query length limit (unresolved Standard SQL query text)
+    MAX_QUERY_LENGTH = 1024 * 1024
+
+    def __init__(self, dq_check_configuration: TDQConfiguration = None, gcp_configuration: TDQGoogleCloudConfiguration = None,
+                 client_pool: TDQBigQueryClientPool = None, provisioning_cache: TDQProvisioningCache = None,
+                 execution_backend: TDQExecutionBackend = None, tracer: TDQTracer = None):
+        from tdq_engine.tdq_bigquery_client_pool import TDQBigQueryClientPool
+        from tdq_engine.tdq_provisioning_cache import default_provisioning_cache
+        from tdq_engine.tdq_tracer import TDQTracer
+        import threading
         self._tdq_configuration = dq_check_configuration
         self._gcp_configuration = gcp_configuration
+        self._client_pool = client_pool if client_pool is not None else TDQBigQueryClientPool()
+        # Client pools passed in by the caller may be shared with other engines and are not closed by the engine
+        self._is_client_pool_owned = client_pool is None
+        self._provisioning_cache = provisioning_cache if provisioning_cache is not None else default_provisioning_cache
+        self._execution_backend = execution_backend
+        self._batch_writer = None
+        # The batch writer is created lazily by the caller thread or the background writer thread
+        self._batch_writer_lock = threading.Lock()
+        self._background_writer = None
+        self._exit_flush = None
+        # Log fields of the check run or the TDQ result saved by the current thread (see _use_log_fields)
+        self._log_context = threading.local()
+        self._tracer = tracer if tracer is not None else TDQTracer()
 
     # region Private Methods
 
-    def _get_printable_log_time(self):
-        from datetime import datetime
-        return datetime.now().strftime("%d.%m.%Y %H:%M:%S")
+    def _log(self, level: int = None, message: str = "", *args, **fields):
+        # Messages are formatted lazily by the logging module, and only if the level is enabled
+        from tdq_engine.tdq_logging import get_logger, FIELDS_ATTRIBUTE
+        logger = get_logger()
+        if logger.isEnabledFor(level):
+            log_fields = getattr(self._log_context, "fields", None) or {}
+            logger.log(level, message, *args, extra={FIELDS_ATTRIBUTE: {**log_fields, **fields}})
+
+    def _use_log_fields(self, fields: dict = None):
+        # Log fields of the current thread. Each check run and each saved TDQ result (e.g. in the background writer) uses its own fields
+        from contextlib import contextmanager
+
+        @contextmanager
+        def use_log_fields():
+            previous_fields = getattr(self._log_context, "fields", None)
+            self._log_context.fields = fields
+            try:
+                yield
+            finally:
+                self._log_context.fields = previous_fields
+
+        return use_log_fields()
+
+    def _set_log_field(self, name: str = None, value: any = None):
+        # Added to the log fields of the current thread, so concurrent check runs of the engine do not share them
+        fields = getattr(self._log_context, "fields", None)
+        if fields is None:
+            fields = {}
+            self._log_context.fields = fields
+        fields[name] = value
+
+    def _log_debug(self, message: str = "", *args, **fields):
+        import logging
+        self._log(logging.DEBUG, message, *args, **fields)
+
+    def _log_info(self, message: str = "", *args, **fields):
+        import logging
+        self._log(logging.INFO, message, *args, **fields)
+
+    def _log_error(self, message: str = "", *args, **fields):
+        import logging
+        self._log(logging.ERROR, message, *args, **fields)
+
+    def _log_warn(self, message: str = "", *args, **fields):
+        import logging
+        self._log(logging.WARNING, message, *args, **fields)
+
+    def _get_bq_client(self, project_id: str = None):
+        return self._client_pool.getClient(project_id=project_id)
+
+    def _register_exit_flush(self):
+        # Buffered and queued TDQ results are written at interpreter exit if the caller never flushes/closes the engine.
+        # The exit hook only holds a weak reference, so it does not keep the engine alive
+        import atexit
+        import weakref
+        if self._exit_flush is None:
+            engine_ref = weakref.ref(self)
+
+            def exit_flush():
+                engine = engine_ref()
+                if engine is not None:
+                    engine.flush_results()
+
+            self._exit_flush = exit_flush
+            atexit.register(self._exit_flush)
+
+    def _unregister_exit_flush(self):
+        import atexit
+        if self._exit_flush is not None:
+            atexit.unregister(self._exit_flush)
+            self._exit_flush = None
+
+    def _get_batch_writer(self):
+        from tdq_engine.tdq_batch_writer import TDQBatchWriter
+        with self._batch_writer_lock:
+            if self._batch_writer is None:
+                self._batch_writer = TDQBatchWriter(client_getter=self._get_bq_client)
+            self._register_exit_flush()
+        # Flush thresholds always follow the current GCP configuration
+        self._batch_writer.setMaxRows(max_rows=self._gcp_configuration.getPersistenceBatchMaxRows())
+        self._batch_writer.setMaxSeconds(max_seconds=self._gcp_configuration.getPersistenceBatchMaxSeconds())
+        return self._batch_writer
+
+    def _get_background_writer(self):
+        from tdq_engine.tdq_background_writer import TDQBackgroundWriter
+        if (self._background_writer is None) or (not self._background_writer.isAlive()):
+            self._background_writer = TDQBackgroundWriter(save_function=self._save_tdq_result,
+                                                          queue_size=self._gcp_configuration.getAsyncPersistenceQueueSize(),
+                                                          idle_function=self._flush_batch_writer_if_required)
+            self._register_exit_flush()
+        return self._background_writer
+
+    def _flush_batch_writer_if_required(self):
+        # Called by the idle background writer. The buffer holds the results of several checks, no check fields
+        with self._use_log_fields(fields={}):
+            if (self._batch_writer is not None) and self._batch_writer.isFlushRequired():
+                self._flush_batch_writer()
+
+    def _flush_batch_writer(self) -> dict:
+        if self._batch_writer is None:
+            return {"success": True, "row_count": 0}
+
+        flush_result = self._batch_writer.flush()
+        if flush_result["success"]:
+            if flush_result["row_count"] > 0:
+                self._log_info("%s TDQ summary and check result rows saved with load jobs successfully", flush_result['row_count'])
+        else:
+            self._log_error("Error saving TDQ summary and check results with load jobs. Error message: %s", flush_result['error'])
+        return flush_result
 
-    def _log_info(self, message: str = ""):
-        print(f"{self._get_printable_log_time()} [INFO] : {message}")
+    def _measure(self, phase: str = None, run_metrics: any = None):
+        # Measures a phase of the run (see TDQRunMetrics). No-op without run metrics (e.g. test_rule)
+        from contextlib import nullcontext
+        return run_metrics.measure(phase=phase) if run_metrics is not None else nullcontext()
 
-    def _log_error(self, message: str = ""):
-        print(f"{self._get_printable_log_time()} [ERROR] : {message}")
+    def _trace(self, name: str = None, **attributes):
+        # Span of the tracer around an engine hot path (see TDQTracer)
+        return self._tracer.span(name=name, **attributes)
 
-    def _log_warn(self, message: str = ""):
-        print(f"{self._get_printable_log_time()} [WARN] : {message}")
+    def _get_job_statistics(self, query_job: any = None) -> dict:
+        return {"job_id": getattr(query_job, "job_id", None),
+                "total_bytes_processed": getattr(query_job, "total_bytes_processed", None),
+                "total_bytes_billed": getattr(query_job, "total_bytes_billed", None),
+                "slot_millis": getattr(query_job, "slot_millis", None),
+                "cache_hit": getattr(query_job, "cache_hit", None)}
 
     def _get_uuid(self) -> any:
         import uuid
         return uuid.uuid4()
 
+    def _get_content_uuid(self, content: str) -> any:
+        import uuid
+        import hashlib
+        return uuid.UUID(hex=hashlib.sha256(content.encode("utf-8")).hexdigest()[:32])
+
+    def _is_offline_execution(self) -> bool:
+        # Local execution backend without GCP configuration. TDQ tables are not provisioned and results are not saved
+        return (self._execution_backend is not None) and self._execution_backend.isLocal() and (self._gcp_configuration is None)
+
+    def _is_local_execution(self) -> bool:
+        # TDQ check queries are executed in process (e.g. DuckDB), independent of the GCP configuration
+        return (self._execution_backend is not None) and self._execution_backend.isLocal()
+
+    def _is_bigquery_execution(self) -> bool:
+        # TDQ check queries are executed on BigQuery (no execution backend)
+        return self._execution_backend is None
+
+    def _is_rule_execution(self) -> bool:
+        # Execution backend evaluating the rules directly instead of executing the TDQ check query
+        return (self._execution_backend is not None) and (not self._execution_backend.isQueryBackend())
+
+    def _is_incremental_execution(self, row_limit: int = None, sample_percent: float = None) -> bool:
+        # Incremental checks need the partition states table. Rule tests (row limit) and sampled checks always check the base query
+        return (self._tdq_configuration is not None) and self._tdq_configuration.isIncremental() and (row_limit is None) and (sample_percent is None) and \
+            (not self._is_offline_execution()) and (not self._is_rule_execution())
+
+    def _is_result_cache_execution(self, row_limit: int = None, sample_percent: float = None) -> bool:
+        # Source freshness is read from BigQuery table metadata, so only full BigQuery runs are cached.
+        # Incremental checks already skip the unchanged partitions
+        return (self._tdq_configuration is not None) and self._tdq_configuration.isResultCache() and (row_limit is None) and (sample_percent is None) and \
+            (self._execution_backend is None) and (not self._tdq_configuration.isIncremental())
+
+    def _is_deterministic_sql(self) -> bool:
+        return (self._tdq_configuration is not None) and self._tdq_configuration.isDeterministicSQL()
+
     def _is_cte_exists(self, query: str) -> bool:
         """
         Analyse the SQL script and returns True if query contains CTE blocks.
@@ -37,43 +211,39 @@ class TDQEngine:
                 Returns:
                         True/False
         """
+        from tdq_engine.tdq_query_rewriter import TDQQueryRewriter
+        return TDQQueryRewriter().hasCTE(query=query)
 
-        import re
-        # Define regex pattern for CTE blocks
-        cte_pattern = re.compile(r'\bWITH\b\s+\b\w+\b\s+AS\s+\(', re.IGNORECASE)
-
-        # Find all matches of the pattern in the SQL script
-        cte_blocks = cte_pattern.findall(query)
-
-        return True if len(cte_blocks) == 1 else False
-
-    def _prepare_tdq_base_query(self, query: str, row_limit: int = None) -> dict:
+    def _prepare_tdq_base_query(self, query: str, row_limit: int = None, deterministic: bool = False, sample_percent: float = None,
+                                columns: list = None, condition: str = None) -> dict:
         """
-        Analyse and prepare DQ base script using the query of the data source.
+        Analyse and prepare DQ base script using the query of the data source. The final query of the data source
+        (after its CTE chain, if any) becomes the base CTE the DQ checks are applied to.
 
                 Parameters:
                         query (str): SQL query of the data source
+                        row_limit (int): Optional row limit applied to the base query
+                        deterministic (bool): If True, CTE names are derived from a content hash of the query
+                        sample_percent (float): Optional TABLESAMPLE percentage applied to the driving table
+                        columns (list<str>): Optional projection of the base query (see `_get_projection_columns`)
+                        condition (str): Optional condition selecting the rows of the base query to check
 
                 Returns:
                         base_query_result (dict)
                             base_uuid (str) : Base DQ UUID. This UUID will be used to define DQ check session
                             base_query (str) : Prepared base query of the DQ SQL script
+                            base_cte (str) : Name of the base CTE the DQ checks are applied to
         """
 
-        import re
-        base_query = ""
-        check_uuid = self._get_uuid()
-        query_base_cte = f"cte_query_base_{str(check_uuid).replace('-', '_')}"
-        if self._is_cte_exists(query):
-            pattern = re.compile(r'\)\s*SELECT(?!.*FROM)([\s\S]*)', re.IGNORECASE)
-            matches = pattern.search(query)
-            if matches:
-                base_query = f"{query[:matches.start(0)]}), {query_base_cte} AS (SELECT {query[matches.start(1):]} {f'LIMIT {row_limit}' if row_limit is not None else ''})"
-            else:
-                raise Exception("Invalid SQL script. Please check the SQL script and try again")
-        else:
-            base_query = f"WITH {query_base_cte} AS ( {query} )"
-        return {"check_uuid": str(check_uuid), "base_query": base_query}
+        from tdq_engine.tdq_query_rewriter import TDQQueryRewriter
+
+        with self._trace(name="prepare_tdq_base_query", row_limit=row_limit, sample_percent=sample_percent):
+            check_uuid = self._get_uuid()
+            query_uuid = self._get_content_uuid(f"{query}|{row_limit}|{sample_percent}|{columns}|{condition}") if deterministic else check_uuid
+            query_base_cte = f"cte_query_base_{str(query_uuid).replace('-', '_')}"
+            base_query = TDQQueryRewriter().prepareBaseQuery(query=query, base_cte=query_base_cte, row_limit=row_limit, columns=columns,
+                                                             condition=condition, sample_percent=sample_percent)
+            return {"check_uuid": str(check_uuid), "base_query": base_query, "base_cte": query_base_cte, "query_uuid": str(query_uuid)}
 
     def _print_prepared_tdq_query(self, tdq_prep_result: dict):
         """
@@ -99,6 +269,11 @@ class TDQEngine:
         """
         Prepare the final SQL query for DQ check by appending DQ check blocks to base query .
 
+        ROW_BASED rules are fused into a single aggregation over the base CTE, so the base is scanned and
+        aggregated exactly once regardless of the rule count. If any other rule type is requested (the bundled
+        rules are all ROW_BASED, TABLE_BASED rules are custom TDQRuleBase subclasses overriding `_prepare_rule_sql`),
+        every rule falls back to its own check CTE glued with UNION ALL.
+
                 Parameters:
                         base_query_config (dict): Base query configuration
                         tdq_rules (list<dict>) : List of DQ checks that will be applied to base query
@@ -106,23 +281,267 @@ class TDQEngine:
                 Returns:
                         dq_config (dict) : Final configuration for DQ checks includes base information and DQ checks
         """
+        from rule_definitions.tdq_rule_base import RULE_TYPE
+
+        if len(tdq_rules) == 0:
+            raise Exception("TDQ check query can not be prepared without valid rules")
+
+        with self._trace(name="prepare_tdq_check_query_config", rule_count=len(tdq_rules)):
+            if all(tdq_check.getRuleType() == RULE_TYPE.ROW_BASED for tdq_check in tdq_rules):
+                return self._prepare_tdq_fused_check_query_config(base_query_config=base_query_config, tdq_rules=tdq_rules)
+
+            query = base_query_config["base_query"]
+            query_uuid = base_query_config["query_uuid"]
+
+            # Rule UUIDs written into the SQL. In deterministic mode they are derived from the rule definitions
+            # and mapped back to the rule UUIDs once the results come back
+            if query_uuid != base_query_config["check_uuid"]:
+                query_rule_uuids = [self._get_content_uuid(f"{query_uuid}|{index}|{tdq_check.getRuleSignature()}") for index, tdq_check in enumerate(tdq_rules)]
+            else:
+                query_rule_uuids = [tdq_check.getRuleCheckUUID() for tdq_check in tdq_rules]
+
+            # Append DQ check queries
+            query = f"""{query},{','.join(tdq_check.getRuleSQL(check_uuid=query_uuid, rule_uuid=rule_uuid) for tdq_check, rule_uuid in zip(tdq_rules, query_rule_uuids))}"""
+
+            # Prepare final SQL statement
+            query = f"""{query} {' UNION ALL '.join(f"SELECT * FROM cte_check_{str(rule_uuid).replace('-', '_')}" for rule_uuid in query_rule_uuids)}"""
+
+            return {"base_uuid": base_query_config["check_uuid"],
+                    "tdq_check_query": query,
+                    "tdq_rules": tdq_rules,
+                    "is_fused": False,
+                    "rule_uuids": {str(rule_uuid): str(tdq_check.getRuleCheckUUID()) for tdq_check, rule_uuid in zip(tdq_rules, query_rule_uuids)}}
+
+    def _get_projection_columns(self, tdq_rules: list[TDQRuleBase], extra_columns: list = []) -> list:
+        """
+        Returns the columns of the base query referenced by the rules and the extra (e.g. partition) columns.
+        Struct field paths (e.g. `payload.country`) reference their top level column.
+
+        The base query is only projected on local execution backends and for ROW_BASED rules (TABLE_BASED rules
+        may read any column of the base CTE), so only the referenced columns are materialized even if the base
+        query selects `*`. BigQuery already prunes the unreferenced columns of the base CTE (the dry run
+        estimates the same bytes processed with or without the projection), so BigQuery base queries are not projected.
+
+                Parameters:
+                        tdq_rules (list<TDQRuleBase>) : Rules applied to the base query
+                        extra_columns (list<str>) : Other referenced columns (None values are ignored)
+
+                Returns:
+                        projection_columns (list<str>) : Referenced columns in first use order, None if the base query
+                                                         is not projected or a column name is not a plain identifier
+                                                         (e.g. an expression or quoted name)
+        """
+        import re
+        from rule_definitions.tdq_rule_base import RULE_TYPE
+
+        if (not self._is_local_execution()) or any(tdq_rule.getRuleType() != RULE_TYPE.ROW_BASED for tdq_rule in tdq_rules):
+            return None
+
+        identifier_pattern = re.compile(r'^[A-Za-z_]\w*(\.[A-Za-z_]\w*)*$')
+        projection_columns = {}
+        for column_name in [tdq_rule.getColumnName() for tdq_rule in tdq_rules] + [column for column in extra_columns if column is not None]:
+            if (not isinstance(column_name, str)) or (identifier_pattern.match(column_name.strip()) is None):
+                return None
+            root_column = column_name.strip().split(".")[0]
+            # Column names are case-insensitive in BigQuery
+            projection_columns.setdefault(root_column.lower(), root_column)
+        return list(projection_columns.values()) if len(projection_columns) > 0 else None
+
+    def _prepare_tdq_fused_check_query_config(self, base_query_config: dict, tdq_rules: list[TDQRuleBase],
+                                              partition_column: str = None, partition_expression: str = None) -> dict:
+        """
+        Prepare a single-pass DQ check query. All rules are compiled into one aggregation returning a single row
+        with the row count and one unexpected/expected counter per rule (in rule order). The counters are unpivoted
+        into the DQ results schema by `_generate_fused_checks_dataset`.
+
+        The query is emitted without indentation and every distinct condition is counted once (`predicate_counts`),
+        e.g. the `IS NULL` condition of a NULL and a NOT_NULL rule on the same column. `_expand_fused_results` maps
+        the predicate counters back to the unexpected/expected counters of the rules.
+
+                Parameters:
+                        base_query_config (dict): Base query configuration
+                        tdq_rules (list<dict>) : List of ROW_BASED DQ checks that will be applied to base query
+                        partition_column (str) : If defined, one row is returned per partition of the column (`partition_value`)
+                        partition_expression (str) : Partition of a row (e.g. `DATE(partition_column)`). Default: the column value
+
+                Returns:
+                        dq_config (dict) : Final configuration for DQ checks includes base information and DQ checks
+        """
+        # An empty counter array is untyped (`[]`), which BigQuery rejects
+        if len(tdq_rules) == 0:
+            raise Exception("TDQ check query can not be prepared without valid rules")
 
-        query = base_query_config["base_query"]
         check_uuid = base_query_config["check_uuid"]
+        fused_cte = f"cte_check_{str(base_query_config['query_uuid']).replace('-', '_')}"
+        source_cte = base_query_config["base_cte"]
+        base_query = base_query_config["base_query"]
+
+        for tdq_check in tdq_rules:
+            tdq_check.setCheckUUID(base_uuid=check_uuid)
 
-        # Append DQ check queries
-        query = f"""{query},{','.join(tdq_check.getRuleSQL(check_uuid=check_uuid) for tdq_check in tdq_rules)}"""
+        # Index of the counter of each distinct condition, in first use order
+        predicate_indexes = {}
+        unexpected_indexes = [predicate_indexes.setdefault(tdq_check.getUnexpectedConditionSQL(), len(predicate_indexes)) for tdq_check in tdq_rules]
+        expected_indexes = [predicate_indexes.setdefault(tdq_check.getExpectedConditionSQL(), len(predicate_indexes)) for tdq_check in tdq_rules]
 
-        # Prepare final SQL statement
-        query = f"""{query} {' UNION ALL '.join(f"SELECT * FROM cte_check_{str(dq_check.getRuleCheckUUID()).replace('-', '_')}" for dq_check in tdq_rules)}"""
+        partition_select = f"CAST({partition_expression or partition_column} AS STRING) AS partition_value," if partition_column is not None else ""
+        partition_group_by = " GROUP BY partition_value" if partition_column is not None else ""
+
+        query = f"""{base_query},{fused_cte} AS (SELECT {partition_select}COUNT(1) AS row_count,""" \
+                f"""[{','.join(f"COUNTIF({predicate})" for predicate in predicate_indexes)}] AS predicate_counts """ \
+                f"""FROM {source_cte}{partition_group_by}) SELECT * FROM {fused_cte}"""
 
         return {"base_uuid": base_query_config["check_uuid"],
                 "tdq_check_query": query,
-                "tdq_rules": tdq_rules}
+                "tdq_rules": tdq_rules,
+                "is_fused": True,
+                "unexpected_indexes": unexpected_indexes,
+                "expected_indexes": expected_indexes}
+
+    def _expand_fused_results(self, fused_results: any = None, tdq_query_config: dict = None):
+        """
+        Maps the predicate counters of the fused TDQ check query results to the unexpected_counts and
+        expected_counts of the rules (in rule order).
+        """
+        unexpected_indexes = tdq_query_config["unexpected_indexes"]
+        expected_indexes = tdq_query_config["expected_indexes"]
+        fused_results = fused_results.copy()
+        fused_results["unexpected_counts"] = fused_results["predicate_counts"].map(lambda counts: [counts[index] for index in unexpected_indexes])
+        fused_results["expected_counts"] = fused_results["predicate_counts"].map(lambda counts: [counts[index] for index in expected_indexes])
+        return fused_results.drop(columns=["predicate_counts"])
+
+    def _get_tdq_summary_schema(self) -> list:
+        from google.cloud import bigquery
+        return [
+            bigquery.SchemaField(name="check_date", field_type="DATE", description="TDQ data quality check date"),
+            bigquery.SchemaField(name="check_uuid", field_type="STRING", description="TDQ data quality check unique UUID"),
+            bigquery.SchemaField(name="check_name", field_type="STRING", description="TDQ data quality check name"),
+            bigquery.SchemaField(name="check_description", field_type="STRING", description="TDQ data quality check description"),
+            bigquery.SchemaField(name="rule_count", field_type="INT64", description="TDQ expectations count"),
+            bigquery.SchemaField(name="valid_rule_count", field_type="INT64", description="TDQ valid expectations count"),
+            bigquery.SchemaField(name="invalid_rule_count", field_type="INT64", description="TDQ invalid expectations count"),
+            bigquery.SchemaField(name="success_count", field_type="INT64", description="TDQ success expectations count"),
+            bigquery.SchemaField(name="failed_count", field_type="INT64", description="TDQ failed expectations count"),
+            bigquery.SchemaField(name="execution_start_time", field_type="TIMESTAMP", description="TDQ data quality check execution start timestamp"),
+            bigquery.SchemaField(name="execution_end_time", field_type="TIMESTAMP", description="TDQ data quality check execution end timestamp"),
+            bigquery.SchemaField(name="is_success", field_type="BOOLEAN", description="TDQ data quality check success/failed flag"),
+            bigquery.SchemaField(name="execution_parameters", field_type="JSON", description="TDQ data quality check execution parameters"),
+            bigquery.SchemaField(name="execution_message", field_type="STRING", description="TDQ data quality check execution message."),
+            bigquery.SchemaField(name="rule_set_hash", field_type="STRING", description="Hash of the valid rule definitions of the check"),
+            bigquery.SchemaField(name="source_last_modified", field_type="JSON", description="Last modified time of the tables referenced by the base query"),
+            bigquery.SchemaField(name="source_fingerprint", field_type="STRING", description="Hash of the last modified times of the tables referenced by the base query"),
+            bigquery.SchemaField(name="is_cache_hit", field_type="BOOLEAN", description="True if the stored results of an earlier run were returned"),
+            bigquery.SchemaField(name="inconclusive_count", field_type="INT64", description="TDQ inconclusive (sampled) expectations count"),
+            bigquery.SchemaField(name="sample_percent", field_type="FLOAT64", description="TABLESAMPLE percentage of the source tables (NULL if not sampled)"),
+            bigquery.SchemaField(name="confidence_level", field_type="FLOAT64", description="Confidence level of the sampled unexpected ratio intervals"),
+            bigquery.SchemaField(name="estimated_bytes_processed", field_type="INT64", description="Bytes processed by the TDQ checks query estimated with a dry run"),
+            bigquery.SchemaField(name="maximum_bytes_billed", field_type="INT64", description="Bytes budget of the TDQ checks query"),
+            bigquery.SchemaField(name="execution_duration_seconds", field_type="FLOAT64", description="TDQ data quality check execution duration in seconds"),
+            bigquery.SchemaField(name="phase_seconds", field_type="JSON", description="Duration of the execution phases in seconds"),
+            bigquery.SchemaField(name="job_id", field_type="STRING", description="BigQuery job ID(s) of the TDQ checks query (comma separated)"),
+            bigquery.SchemaField(name="total_bytes_processed", field_type="INT64", description="Bytes processed by the TDQ checks query"),
+            bigquery.SchemaField(name="total_bytes_billed", field_type="INT64", description="Bytes billed for the TDQ checks query"),
+            bigquery.SchemaField(name="slot_millis", field_type="INT64", description="Slot milliseconds consumed by the TDQ checks query"),
+            bigquery.SchemaField(name="query_cache_hit", field_type="BOOLEAN", description="True if the TDQ checks query results came from the BigQuery query cache")
+        ]
+
+    def _get_tdq_results_schema(self) -> list:
+        from google.cloud import bigquery
+        return [
+            bigquery.SchemaField(name="check_date", field_type="DATE", description="TDQ check date"),
+            bigquery.SchemaField(name="check_uuid", field_type="STRING", description="TDQ check unique UUID"),
+            bigquery.SchemaField(name="rule_uuid", field_type="STRING", description="TDQ rule unique UUID"),
+            bigquery.SchemaField(name="type", field_type="STRING", description="TDQ type"),
+            bigquery.SchemaField(name="check_type", field_type="STRING", description="TDQ rule check type"),
+            bigquery.SchemaField(name="column_name", field_type="STRING", description="TDQ rule check column name"),
+            bigquery.SchemaField(name="parameters", field_type="JSON", description="TDQ rule check parameters"),
+            bigquery.SchemaField(name="threshold", field_type="FLOAT64", description="TDQ rule check validation threshold"),
+            bigquery.SchemaField(name="row_count", field_type="INT64", description="Total rows"),
+            bigquery.SchemaField(name="unexpected_count", field_type="INT64", description="Unexpected rows count"),
+            bigquery.SchemaField(name="expected_count", field_type="INT64", description="Expected rows count"),
+            bigquery.SchemaField(name="unexpected_ratio", field_type="FLOAT64", description="Unexpected results ratio"),
+            bigquery.SchemaField(name="expected_ratio", field_type="FLOAT64", description="Expected results ratio"),
+            bigquery.SchemaField(name="is_valid", field_type="BOOLEAN", description="True if rule check definition is valid"),
+            bigquery.SchemaField(name="is_passed", field_type="BOOLEAN", description="True if unexpected ratio is less than threshold else False. NULL if a sampled check is inconclusive"),
+            bigquery.SchemaField(name="rule_hash", field_type="STRING", description="Hash of the rule definition"),
+            bigquery.SchemaField(name="unexpected_ratio_lower", field_type="FLOAT64", description="Lower bound of the unexpected ratio confidence interval (sampled checks)"),
+            bigquery.SchemaField(name="unexpected_ratio_upper", field_type="FLOAT64", description="Upper bound of the unexpected ratio confidence interval (sampled checks)"),
+            bigquery.SchemaField(name="sample_percent", field_type="FLOAT64", description="TABLESAMPLE percentage the rule was checked on (NULL if checked on all rows)"),
+            bigquery.SchemaField(name="confidence_level", field_type="FLOAT64", description="Confidence level of the unexpected ratio interval (sampled checks)")
+        ]
+
+    def _get_tdq_partition_states_schema(self) -> list:
+        from google.cloud import bigquery
+        return [
+            bigquery.SchemaField(name="check_date", field_type="DATE", description="TDQ check date"),
+            bigquery.SchemaField(name="check_uuid", field_type="STRING", description="TDQ check unique UUID"),
+            bigquery.SchemaField(name="check_name", field_type="STRING", description="TDQ data quality check name"),
+            bigquery.SchemaField(name="rule_set_hash", field_type="STRING", description="Hash of the valid rule definitions of the check"),
+            bigquery.SchemaField(name="rule_hash", field_type="STRING", description="Hash of the rule definition"),
+            bigquery.SchemaField(name="partition_column", field_type="STRING", description="Incremental (partition) column"),
+            bigquery.SchemaField(name="partition_value", field_type="STRING", description="Value of the incremental (partition) column"),
+            bigquery.SchemaField(name="row_count", field_type="INT64", description="Total rows of the partition"),
+            bigquery.SchemaField(name="unexpected_count", field_type="INT64", description="Unexpected rows count of the partition"),
+            bigquery.SchemaField(name="expected_count", field_type="INT64", description="Expected rows count of the partition"),
+            bigquery.SchemaField(name="sketches", field_type="JSON", description="Rule specific state sketches"),
+            bigquery.SchemaField(name="checked_at", field_type="TIMESTAMP", description="Check time. The latest state of a partition replaces the earlier ones")
+        ]
+
+    def _get_schema_hash(self, schema: list) -> str:
+        import json
+        import hashlib
+        schema_definition = [[field.name, field.field_type, field.mode] for field in schema]
+        return hashlib.sha256(json.dumps(schema_definition).encode("utf-8")).hexdigest()
+
+    def _ensure_tdq_table(self, table_name: str, schema: list) -> bool:
+        """
+        Creates the TDQ table if not exists and adds the missing columns of the schema to an existing table. Tables already ensured with the same schema (in this process or, if the
+        provisioning cache has a cache directory, in an earlier one) are skipped without any BigQuery API call.
+
+                Parameters:
+                        table_name (str): TDQ table name in the TDQ dataset
+                        schema (list<SchemaField>): TDQ table schema
+
+                Returns:
+                        True if the table has been created/checked, False if it was skipped using the provisioning cache
+        """
+        from google.cloud import bigquery
+
+        project_id = self._gcp_configuration.getProjectId()
+        dataset_id = self._gcp_configuration.getDatasetId()
+        provisioning_key = self._provisioning_cache.getKey(project_id=project_id,
+                                                           dataset_id=dataset_id,
+                                                           table_name=table_name,
+                                                           schema_hash=self._get_schema_hash(schema=schema))
+        if self._provisioning_cache.isProvisioned(key=provisioning_key):
+            self._log_info("TDQ table `%s`.`%s.%s` already provisioned, skipping", project_id, dataset_id, table_name)
+            return False
+
+        client = self._get_bq_client(project_id=project_id)
+
+        # Prepare dataset reference
+        dataset_ref = bigquery.DatasetReference(project=project_id, dataset_id=dataset_id)
+        # Prepare table reference
+        table_ref = bigquery.TableReference(table_id=table_name, dataset_ref=dataset_ref)
+        table = bigquery.Table(table_ref=table_ref, schema=schema)
+        # Prepare partitioning
+        table_partition = bigquery.table.TimePartitioning(type_=bigquery.table.TimePartitioningType.DAY, field="check_date")
+        table.time_partitioning = table_partition
+        # Create table if not exists
+        self._log_info("Creating TDQ table `%s`.`%s.%s`", project_id, dataset_id, table_name)
+        table = client.create_table(table=table, exists_ok=True)
+        # Additive schema migration of tables created by earlier versions
+        existing_field_names = {field.name for field in table.schema}
+        missing_fields = [field for field in schema if field.name not in existing_field_names]
+        if len(missing_fields) > 0:
+            self._log_info("Adding column(s) %s to TDQ table `%s`.`%s.%s`", ', '.join(field.name for field in missing_fields), project_id, dataset_id, table_name)
+            table.schema = list(table.schema) + missing_fields
+            client.update_table(table=table, fields=["schema"])
+        self._provisioning_cache.markProvisioned(key=provisioning_key)
+        return True
 
     def _prepare_tdq_tables(self) -> dict:
         try:
-            from google.cloud import bigquery
             self._log_info("Preparing TDQ tables")
 
             # If GCP and/or TDQ configuration not defined, raise exception
@@ -130,68 +549,10 @@ class TDQEngine:
                 raise Exception("Error executing TDQ checks. GCP configuration and TDQ configuration should be defined. Please check the configuration and try again!")
 
             # region Create TDQ tables
-            with bigquery.Client(project=self._gcp_configuration.getProjectId()) as client:
-
-                # region Prepare TDQ summary table
-                self._log_info("Preparing TDQ summary schema")
-                schema = [
-                    bigquery.SchemaField(name="check_date", field_type="DATE", description="TDQ data quality check date"),
-                    bigquery.SchemaField(name="check_uuid", field_type="STRING", description="TDQ data quality check unique UUID"),
-                    bigquery.SchemaField(name="check_name", field_type="STRING", description="TDQ data quality check name"),
-                    bigquery.SchemaField(name="check_description", field_type="STRING", description="TDQ data quality check description"),
-                    bigquery.SchemaField(name="rule_count", field_type="INT64", description="TDQ expectations count"),
-                    bigquery.SchemaField(name="valid_rule_count", field_type="INT64", description="TDQ valid expectations count"),
-                    bigquery.SchemaField(name="invalid_rule_count", field_type="INT64", description="TDQ invalid expectations count"),
-                    bigquery.SchemaField(name="success_count", field_type="INT64", description="TDQ success expectations count"),
-                    bigquery.SchemaField(name="failed_count", field_type="INT64", description="TDQ failed expectations count"),
-                    bigquery.SchemaField(name="execution_start_time", field_type="TIMESTAMP", description="TDQ data quality check execution start timestamp"),
-                    bigquery.SchemaField(name="execution_end_time", field_type="TIMESTAMP", description="TDQ data quality check execution end timestamp"),
-                    bigquery.SchemaField(name="is_success", field_type="BOOLEAN", description="TDQ data quality check success/failed flag"),
-                    bigquery.SchemaField(name="execution_parameters", field_type="JSON", description="TDQ data quality check execution parameters"),
-                    bigquery.SchemaField(name="execution_message", field_type="STRING", description="TDQ data quality check execution message.")
-                ]
-                # Prepare dataset reference
-                dataset_ref = bigquery.DatasetReference(project=self.get_GCPConfiguration().getProjectId(), dataset_id=self._gcp_configuration.getDatasetId())
-                # Prepare summary table reference
-                table_ref = bigquery.TableReference(table_id=self._gcp_configuration.getTDQSummaryTable(), dataset_ref=dataset_ref)
-                table = bigquery.Table(table_ref=table_ref, schema=schema)
-                # Prapare partitioning
-                table_partition = bigquery.table.TimePartitioning(type_=bigquery.table.TimePartitioningType.DAY, field="check_date")
-                table.time_partitioning = table_partition
-                # Create table if not exists
-                self._log_info(f"Creating TDQ summary table `{self._gcp_configuration.getProjectId()}`.`{self._gcp_configuration.getDatasetId()}.{self._gcp_configuration.getTDQSummaryTable()}`")
-                client.create_table(table=table, exists_ok=True)
-                # endregion
-
-                # region Prepare TDQ results table
-                schema = [
-                    bigquery.SchemaField(name="check_date", field_type="DATE", description="TDQ check date"),
-                    bigquery.SchemaField(name="check_uuid", field_type="STRING", description="TDQ check unique UUID"),
-                    bigquery.SchemaField(name="rule_uuid", field_type="STRING", description="TDQ rule unique UUID"),
-                    bigquery.SchemaField(name="type", field_type="STRING", description="TDQ type"),
-                    bigquery.SchemaField(name="check_type", field_type="STRING", description="TDQ rule check type"),
-                    bigquery.SchemaField(name="column_name", field_type="STRING", description="TDQ rule check column name"),
-                    bigquery.SchemaField(name="parameters", field_type="JSON", description="TDQ rule check parameters"),
-                    bigquery.SchemaField(name="threshold", field_type="FLOAT64", description="TDQ rule check validation threshold"),
-                    bigquery.SchemaField(name="row_count", field_type="INT64", description="Total rows"),
-                    bigquery.SchemaField(name="unexpected_count", field_type="INT64", description="Unexpected rows count"),
-                    bigquery.SchemaField(name="expected_count", field_type="INT64", description="Expected rows count"),
-                    bigquery.SchemaField(name="unexpected_ratio", field_type="FLOAT64", description="Unexpected results ratio"),
-                    bigquery.SchemaField(name="expected_ratio", field_type="FLOAT64", description="Expected results ratio"),
-                    bigquery.SchemaField(name="is_valid", field_type="BOOLEAN", description="True if rule check definition is valid"),
-                    bigquery.SchemaField(name="is_passed", field_type="BOOLEAN", description="True if unexpected ratio is less than threshold else False")
-                ]
-                # Prepare table reference
-                table_ref = bigquery.TableReference(table_id=self._gcp_configuration.getTDQResultsTable(), dataset_ref=dataset_ref)
-                table = bigquery.Table(table_ref=table_ref, schema=schema)
-                # Prepare partitioning
-                table_partition = bigquery.table.TimePartitioning(type_=bigquery.table.TimePartitioningType.DAY, field="check_date")
-                table.time_partitioning = table_partition
-                # Create table if not exists
-                self._log_info(f"Creating TDQ results table `{self._gcp_configuration.getProjectId()}`.`{self._gcp_configuration.getDatasetId()}.{self._gcp_configuration.getTDQResultsTable()}`")
-                client.create_table(table=table, exists_ok=True)
-                # endregion
-
+            self._ensure_tdq_table(table_name=self._gcp_configuration.getTDQSummaryTable(), schema=self._get_tdq_summary_schema())
+            self._ensure_tdq_table(table_name=self._gcp_configuration.getTDQResultsTable(), schema=self._get_tdq_results_schema())
+            if self._tdq_configuration.isIncremental():
+                self._ensure_tdq_table(table_name=self._gcp_configuration.getTDQPartitionStatesTable(), schema=self._get_tdq_partition_states_schema())
             # endregion
 
             self._log_info("TDQ tables created successfully")
@@ -203,27 +564,447 @@ class TDQEngine:
                     "tdq_results_table": self._gcp_configuration.getTDQResultsTable()}
 
         except Exception as ex:
-            self._log_error(f"Error creating TDQ tables. Error Message: {str(ex)}")
+            self._log_error("Error creating TDQ tables. Error Message: %s", ex)
             return {"success": False, "error": str(ex)}
 
-    def _execute_bq_query(self, project_id: str = None, query: str = None) -> dict:
-        try:
+    def _execute_bq_query(self, project_id: str = None, query: str = None, job_config: any = None) -> dict:
+        import time
+        with self._trace(name="execute_bq_query", project_id=project_id, query_size=len(query)):
+            try:
+                execution_results = None
+                client = self._get_bq_client(project_id=self._gcp_configuration.getProjectId())
+                submit_time = time.perf_counter()
+                query_job = client.query(query=query, project=project_id, job_config=job_config)
+                wait_time = time.perf_counter()
+                query_rows = query_job.result()
+                fetch_time = time.perf_counter()
+                execution_results = query_rows.to_dataframe()
+
+                if execution_results is not None:
+                    return {"success": True,
+                            "results": execution_results,
+                            "phase_seconds": {"query_submit": wait_time - submit_time,
+                                              "query_wait": fetch_time - wait_time,
+                                              "fetch": time.perf_counter() - fetch_time},
+                            "job_statistics": self._get_job_statistics(query_job=query_job)}
+                else:
+                    raise Exception("Error executing BigQuery script")
+
+            except Exception as ex:
+                self._log_error("Error execution BigQuery script. Error message: %s", ex)
+                return {"success": False, "error": str(ex)}
+
+    def _execute_tdq_query(self, query: str = None, run_metrics: any = None) -> dict:
+        if self._execution_backend is None:
             from google.cloud import bigquery
+            job_config = None
+            if (self._tdq_configuration is not None) and (self._tdq_configuration.getMaximumBytesBilled() is not None):
+                # BigQuery fails the job instead of billing more than the budget
+                job_config = bigquery.QueryJobConfig(maximum_bytes_billed=self._tdq_configuration.getMaximumBytesBilled())
+            execution_results = self._execute_bq_query(project_id=self.get_GCPConfiguration().getProjectId(), query=query, job_config=job_config)
+            if execution_results["success"] and (run_metrics is not None):
+                for phase, seconds in execution_results["phase_seconds"].items():
+                    run_metrics.addPhaseSeconds(phase=phase, seconds=seconds)
+                run_metrics.addJobStatistics(**execution_results["job_statistics"])
+            return execution_results
+
+        with self._measure(phase="query_wait", run_metrics=run_metrics):
+            execution_results = self._execution_backend.executeQuery(query=query)
+        if not execution_results["success"]:
+            self._log_error("Error executing TDQ checks query on %s. Error message: %s", type(self._execution_backend).__name__, execution_results.get('error', 'Unknown error'))
+        return execution_results
+
+    def _estimate_tdq_query(self, query: str = None, run_metrics: any = None) -> dict:
+        """
+        Estimates the bytes processed by the TDQ check query with a BigQuery dry run (nothing is billed) and checks
+        it against the bytes budget of the TDQ configuration. Without a bytes budget, no dry run is made. If the
+        dry run fails, the estimate is unknown and the query is not refused (BigQuery still fails the job instead of
+        billing more than the budget, see `_execute_tdq_query`).
 
-            execution_results = None
-            with bigquery.Client(project=self._gcp_configuration.getProjectId()) as client:
-                query_job = client.query(query=query, project=project_id)
-                execution_results = query_job.result().to_dataframe()
+                Parameters:
+                        query (str): TDQ check query
+                        run_metrics (TDQRunMetrics): Metrics of the run (optional)
 
-            if execution_results is not None:
-                return {"success": True, "results": execution_results}
-            else:
-                raise Exception("Error executing BigQuery script")
+                Returns:
+                        estimation_result (dict)
+                            success (bool) : Always True
+                            estimated_bytes_processed (int) : Estimated bytes processed by the query (None if unknown)
+                            is_within_budget (bool) : False if the estimate exceeds the bytes budget
+        """
+        from google.cloud import bigquery
+
+        maximum_bytes_billed = self._tdq_configuration.getMaximumBytesBilled() if self._tdq_configuration is not None else None
+        if maximum_bytes_billed is None:
+            return {"success": True, "estimated_bytes_processed": None, "is_within_budget": True}
+
+        try:
+            project_id = self._gcp_configuration.getProjectId()
+            with self._measure(phase="cost_estimation", run_metrics=run_metrics):
+                query_job = self._get_bq_client(project_id=project_id).query(query=query, project=project_id,
+                                                                             job_config=bigquery.QueryJobConfig(dry_run=True, use_query_cache=False))
+            estimated_bytes_processed = int(query_job.total_bytes_processed or 0)
+        except Exception as ex:
+            self._log_warn("Error estimating the TDQ checks query cost, the estimate is unknown. Error message: %s", ex)
+            return {"success": True, "estimated_bytes_processed": None, "is_within_budget": True}
+
+        is_within_budget = estimated_bytes_processed <= maximum_bytes_billed
+        self._log_info("TDQ checks query estimated to process %s bytes", estimated_bytes_processed, phase="cost_estimation",
+                       estimated_bytes_processed=estimated_bytes_processed, maximum_bytes_billed=maximum_bytes_billed)
+        return {"success": True, "estimated_bytes_processed": estimated_bytes_processed, "is_within_budget": is_within_budget}
+
+    def _get_budget_sample_percent(self, estimated_bytes_processed: int = None) -> float:
+        """
+        Returns the TABLESAMPLE percentage bringing the estimated bytes processed under the bytes budget, with 10%
+        headroom as TABLESAMPLE SYSTEM samples whole storage blocks. None if no meaningful sample fits the budget.
+        """
+        import math
+        sample_percent = math.floor(self._tdq_configuration.getMaximumBytesBilled() / estimated_bytes_processed * 90 * 100) / 100
+        return sample_percent if sample_percent >= 0.01 else None
+
+    def _enforce_tdq_bytes_budget(self, tdq_base_config: dict = None, tdq_query_config: dict = None, prepare_sampled_query_configs: callable = None,
+                                  run_metrics: any = None) -> dict:
+        """
+        Estimates the TDQ checks query with a dry run before it is executed on BigQuery and enforces the bytes budget
+        of the TDQ configuration. If the estimate exceeds the budget and the budget action is SAMPLE, the query configs
+        are prepared again on a sample of the driving table that fits the budget. A query still over the budget is
+        refused.
+
+                Parameters:
+                        tdq_base_config (dict): TDQ base query config
+                        tdq_query_config (dict): TDQ checks query config
+                        prepare_sampled_query_configs (callable): Prepares the (base, checks) query configs for a
+                                                                  `sample_percent`. None if the query may not be sampled
+                        run_metrics (TDQRunMetrics): Metrics of the run (optional)
+
+                Returns:
+                        budget_result (dict)
+                            success (bool) : False if the query is refused
+                            tdq_base_config (dict) : TDQ base query config to execute
+                            tdq_query_config (dict) : TDQ checks query config to execute
+                            sample_percent (float) : Budget sample percentage (None if not sampled)
+                            estimated_bytes_processed (int) : Estimated bytes processed (None if unknown)
+                            check_uuid (str), error (str) : Only if not successful
+        """
+        from tdq_engine.tdq_configuration import BUDGET_ACTION
+
+        budget_result = {"success": True, "tdq_base_config": tdq_base_config, "tdq_query_config": tdq_query_config,
+                         "sample_percent": None, "estimated_bytes_processed": None}
+        if not self._is_bigquery_execution():
+            return budget_result
+
+        tdq_query_estimate = self._estimate_tdq_query(query=tdq_query_config['tdq_check_query'], run_metrics=run_metrics)
+        if (not tdq_query_estimate["is_within_budget"]) and (prepare_sampled_query_configs is not None) and \
+                (self._tdq_configuration.getBudgetAction() == BUDGET_ACTION.SAMPLE):
+            budget_sample_percent = self._get_budget_sample_percent(estimated_bytes_processed=tdq_query_estimate["estimated_bytes_processed"])
+            if budget_sample_percent is not None:
+                self._log_warn("TDQ checks query exceeds the bytes budget. Falling back to a %s%% sample of the driving table", budget_sample_percent)
+                tdq_base_config, tdq_query_config = prepare_sampled_query_configs(sample_percent=budget_sample_percent)
+                tdq_query_estimate = self._estimate_tdq_query(query=tdq_query_config['tdq_check_query'], run_metrics=run_metrics)
+                budget_result.update({"tdq_base_config": tdq_base_config, "tdq_query_config": tdq_query_config, "sample_percent": budget_sample_percent})
+
+        estimated_bytes_processed = tdq_query_estimate["estimated_bytes_processed"]
+        if not tdq_query_estimate["is_within_budget"]:
+            error = f"TDQ checks query refused. Estimated {estimated_bytes_processed:,} bytes exceed the budget of {self._tdq_configuration.getMaximumBytesBilled():,} bytes"
+            self._log_error(error)
+            return {"success": False, "check_uuid": tdq_base_config['check_uuid'], "error": error}
+
+        budget_result["estimated_bytes_processed"] = estimated_bytes_processed
+        return budget_result
+
+    def _prepare_tdq_query_configs(self, base_query: str, tdq_rules: list[TDQRuleBase] = [], row_limit: int = None, sample_percent: float = None,
+                                   run_metrics: any = None):
+        # Prepare TDQ base config
+        self._log_info("Preparing TDQ base query config")
+        with self._measure(phase="sql_build", run_metrics=run_metrics):
+            tdq_base_config = self._prepare_tdq_base_query(query=base_query, row_limit=row_limit, deterministic=self._is_deterministic_sql(),
+                                                           sample_percent=sample_percent, columns=self._get_projection_columns(tdq_rules=tdq_rules))
+        self._set_log_field(name="check_uuid", value=str(tdq_base_config['check_uuid']))
+        self._log_info("TDQ Check UUID: %s", tdq_base_config['check_uuid'])
+        self._log_debug("TDQ Base Query\n%s", tdq_base_config['base_query'], phase="sql_build")
+
+        # Prepare TDQ checks query for valid rules
+        self._log_info("Preparing TDQ query config (Only for valid rules)")
+        with self._measure(phase="sql_build", run_metrics=run_metrics):
+            tdq_query_config = self._prepare_tdq_check_query_config(base_query_config=tdq_base_config, tdq_rules=tdq_rules)
+        self._log_tdq_check_query(tdq_query_config=tdq_query_config)
+        return tdq_base_config, tdq_query_config
+
+    def _execute_tdq_check_query(self, tdq_query_config: dict = None, run_metrics: any = None) -> dict:
+        execution_results = self._execute_tdq_query(query=tdq_query_config['tdq_check_query'], run_metrics=run_metrics)
+        if execution_results["success"] and tdq_query_config.get("is_fused", False):
+            execution_results["results"] = self._expand_fused_results(fused_results=execution_results["results"], tdq_query_config=tdq_query_config)
+        return execution_results
+
+    def _log_tdq_check_query(self, tdq_query_config: dict = None):
+        query_size = len(tdq_query_config['tdq_check_query'].encode("utf-8"))
+        self._log_debug("TDQ Checks Query\n%s", tdq_query_config['tdq_check_query'], phase="sql_build", query_size=query_size)
+        if self._is_bigquery_execution() and (query_size > self.MAX_QUERY_LENGTH):
+            self._log_warn("TDQ checks query is %s bytes, BigQuery rejects queries over %s bytes. Split the TDQ rules into smaller rule sets",
+                           query_size, self.MAX_QUERY_LENGTH, phase="sql_build", query_size=query_size)
+
+    def _execute_tdq_rules(self, check_uuid: str = None, tdq_rules: list[TDQRuleBase] = [], row_limit: int = None, run_metrics: any = None) -> dict:
+        from rule_definitions.tdq_rule_base import RULE_TYPE
+
+        if any(tdq_rule.getRuleType() != RULE_TYPE.ROW_BASED for tdq_rule in tdq_rules):
+            error = f"{type(self._execution_backend).__name__} only supports ROW_BASED rules"
+            self._log_error("Error evaluating TDQ rules. Error message: %s", error)
+            return {"success": False, "error": error}
+
+        for tdq_rule in tdq_rules:
+            tdq_rule.setCheckUUID(base_uuid=check_uuid)
+
+        with self._measure(phase="query_wait", run_metrics=run_metrics):
+            execution_results = self._execution_backend.executeRules(tdq_rules=tdq_rules, row_limit=row_limit)
+        if not execution_results["success"]:
+            self._log_error("Error evaluating TDQ rules on %s. Error message: %s", type(self._execution_backend).__name__, execution_results.get('error', 'Unknown error'))
+        return execution_results
+
+    def _get_rule_set_hash(self, tdq_rules: list[TDQRuleBase] = []) -> str:
+        import hashlib
+        return hashlib.sha256('|'.join(tdq_rule.getRuleHash() for tdq_rule in tdq_rules).encode("utf-8")).hexdigest()
+
+    def _quote_sql_string(self, value: str) -> str:
+        return "'" + str(value).replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+    def _get_incremental_partition_type(self) -> str:
+        # DATETIME/TIMESTAMP columns are checked per day, other column types per value
+        column_type = self._tdq_configuration.getIncrementalColumnType().upper()
+        return "DATE" if column_type in ("DATE", "DATETIME", "TIMESTAMP") else column_type
+
+    def _prepare_incremental_partition_expression(self) -> str:
+        """
+        Prepares the SQL expression of the partition of a row (the grain of the stored partition states), e.g.
+        DATE(event_time) for a TIMESTAMP incremental column.
+        """
+        incremental_column = self._tdq_configuration.getIncrementalColumn()
+        if self._tdq_configuration.getIncrementalColumnType().upper() in ("DATETIME", "TIMESTAMP"):
+            return f"DATE({incremental_column})"
+        return incremental_column
+
+    def _prepare_incremental_filter(self, watermark: any = None) -> str:
+        """
+        Prepares the condition selecting the rows of the partitions to check: the watermark partition (re-checked,
+        rows may arrive late), every newer partition and the NULL partition. All partitions are checked if there
+        is no watermark yet.
+        """
+        if watermark is None:
+            return None
+        return f"({self._prepare_incremental_partition_expression()} >= {self._prepare_incremental_literal(value=watermark)} " \
+               f"OR {self._tdq_configuration.getIncrementalColumn()} IS NULL)"
+
+    def _prepare_incremental_literal(self, value: any = None) -> str:
+        """
+        Prepares the SQL literal of a partition value (e.g. DATE '2023-12-01') using the partition type of the
+        incremental column.
+        """
+        partition_type = self._get_incremental_partition_type()
+        if partition_type in ("INT64", "INTEGER", "NUMERIC", "BIGNUMERIC", "FLOAT64"):
+            return str(value)
+        if (partition_type == "DATE") and hasattr(value, "date"):
+            # datetime/Timestamp returned for a DATE value
+            value = value.date()
+        value = value.isoformat() if hasattr(value, "isoformat") else str(value)
+        if partition_type == "STRING":
+            return self._quote_sql_string(value)
+        return f"{partition_type} {self._quote_sql_string(value)}"
+
+    def _get_tdq_partition_states(self, rule_set_hash: str = None, tdq_rules: list[TDQRuleBase] = []) -> dict:
+        """
+        Reads the watermark of the incremental check (greatest stored partition) and the rule states rolled up over
+        the stored partitions below it. The watermark partition and the NULL partition are re-checked by every run,
+        their stored states are replaced by the states of the latest check.
 
+                Parameters:
+                        rule_set_hash (str): Hash of the valid rule definitions
+                        tdq_rules (list<TDQRuleBase>) : Valid rules (their sketches are merged with the rules)
+
+                Returns:
+                        partition_states (dict)
+                            success (bool) : True if the partition states were read successfully
+                            rule_states (dict) : Rolled up TDQRuleState by rule hash
+                            watermark (any) : Greatest stored partition value (None if no partition is stored yet)
+        """
+        import json
+        import pandas as pd
+        from rule_definitions.tdq_rule_state import TDQRuleState
+
+        project_id = self._gcp_configuration.getProjectId()
+        # Latest state of every partition and rule, and the watermark
+        partition_states_query = f"""
+            WITH partition_states AS (
+                SELECT
+                    rule_hash,
+                    row_count,
+                    unexpected_count,
+                    expected_count,
+                    sketches,
+                    SAFE_CAST(partition_value AS {self._get_incremental_partition_type()}) AS partition_key
+                FROM
+                    `{project_id}.{self._gcp_configuration.getDatasetId()}.{self._gcp_configuration.getTDQPartitionStatesTable()}`
+                WHERE
+                    check_name = {self._quote_sql_string(self._tdq_configuration.getTDQCheckName())}
+                    AND rule_set_hash = {self._quote_sql_string(rule_set_hash)}
+                    AND partition_column = {self._quote_sql_string(self._tdq_configuration.getIncrementalColumn())}
+                QUALIFY ROW_NUMBER() OVER (PARTITION BY rule_hash, partition_value ORDER BY checked_at DESC NULLS LAST) = 1
+            ),
+            partition_watermark AS (
+                SELECT MAX(partition_key) AS watermark FROM partition_states
+            )
+        """
+        query = f"""
+            {partition_states_query}
+            SELECT
+                rule_hash,
+                ANY_VALUE(watermark) AS watermark,
+                SUM(IF(partition_key < watermark, row_count, 0)) AS row_count,
+                SUM(IF(partition_key < watermark, unexpected_count, 0)) AS unexpected_count,
+                SUM(IF(partition_key < watermark, expected_count, 0)) AS expected_count
+            FROM
+                partition_states CROSS JOIN partition_watermark
+            GROUP BY
+                rule_hash
+        """
+        execution_results = self._execute_bq_query(project_id=project_id, query=query)
+        if not execution_results["success"]:
+            return execution_results
+
+        rule_states = {}
+        watermark = None
+        for partition_state in execution_results["results"].to_dict(orient="records"):
+            rule_states[partition_state["rule_hash"]] = TDQRuleState(rule_hash=partition_state["rule_hash"],
+                                                                     row_count=int(partition_state["row_count"]),
+                                                                     unexpected_count=int(partition_state["unexpected_count"]),
+                                                                     expected_count=int(partition_state["expected_count"]))
+            watermark = partition_state["watermark"] if not pd.isna(partition_state["watermark"]) else None
+
+        # Sketches can not be rolled up in SQL. They are only read for the rules keeping sketches (none of the bundled rules)
+        sketch_rules = {tdq_rule.getRuleHash(): tdq_rule for tdq_rule in tdq_rules
+                        if (tdq_rule.getRuleHash() in rule_states) and (len(tdq_rule.initState().getSketches()) > 0)}
+        if len(sketch_rules) > 0:
+            sketch_query = f"""
+                {partition_states_query}
+                SELECT
+                    rule_hash,
+                    TO_JSON_STRING(sketches) AS sketches
+                FROM
+                    partition_states CROSS JOIN partition_watermark
+                WHERE
+                    partition_key < watermark
+                    AND rule_hash IN ({','.join(self._quote_sql_string(rule_hash) for rule_hash in sketch_rules)})
+            """
+            sketch_results = self._execute_bq_query(project_id=project_id, query=sketch_query)
+            if not sketch_results["success"]:
+                return sketch_results
+            for rule_hash, tdq_rule in sketch_rules.items():
+                rule_states[rule_hash].setSketches(tdq_rule.initState().getSketches())
+            for partition_sketches in sketch_results["results"].to_dict(orient="records"):
+                rule_state = rule_states[partition_sketches["rule_hash"]]
+                rule_state.setSketches(sketch_rules[partition_sketches["rule_hash"]]._merge_state_sketches(sketches=rule_state.getSketches(),
+                                                                                                          other_sketches=json.loads(partition_sketches["sketches"] or "{}")))
+
+        return {"success": True, "rule_states": rule_states, "watermark": watermark}
+
+    def _get_source_freshness(self, base_query: str = None) -> dict:
+        """
+        Finds the tables referenced by the base query with a dry run (nothing is billed) and reads their last
+        modified time from the table metadata.
+
+                Parameters:
+                        base_query (str): SQL query of the data source
+
+                Returns:
+                        source_freshness (dict)
+                            success (bool) : True if the source freshness was read successfully
+                            last_modified (dict) : Last modified time (ISO format) by table id
+                            fingerprint (str) : Hash of the last modified times. None if the sources can not be fingerprinted
+        """
+        import json
+        import hashlib
+        from google.cloud import bigquery
+
+        try:
+            project_id = self._gcp_configuration.getProjectId()
+            client = self._get_bq_client(project_id=project_id)
+            query_job = client.query(query=base_query, project=project_id,
+                                     job_config=bigquery.QueryJobConfig(dry_run=True, use_query_cache=False))
+
+            last_modified = {}
+            for table_ref in query_job.referenced_tables:
+                table_id = f"{table_ref.project}.{table_ref.dataset_id}.{table_ref.table_id}"
+                table = client.get_table(table=table_id)
+                if (table.modified is None) or (table.streaming_buffer is not None):
+                    # Rows in the streaming buffer do not change the last modified time
+                    self._log_warn("Last modified time of `%s` is not reliable (streaming buffer). TDQ results will not be cached", table_id)
+                    return {"success": True, "last_modified": None, "fingerprint": None}
+                last_modified[table_id] = table.modified.isoformat()
+
+            if len(last_modified) == 0:
+                self._log_warn("Base query does not reference any table. TDQ results will not be cached")
+                return {"success": True, "last_modified": None, "fingerprint": None}
+
+            fingerprint = hashlib.sha256(json.dumps(last_modified, sort_keys=True).encode("utf-8")).hexdigest()
+            return {"success": True, "last_modified": last_modified, "fingerprint": fingerprint}
         except Exception as ex:
-            self._log_error(f"Error execution BigQuery script. Error message: {str(ex)}")
+            self._log_error("Error reading the freshness of the base query tables. Error message: %s", ex)
             return {"success": False, "error": str(ex)}
 
+    def _get_cached_tdq_results(self, rule_set_hash: str = None, source_fingerprint: str = None, rule_hashes: list = []) -> dict:
+        """
+        Reads the stored TDQ check results of the last full (not sampled) run with the same rule set and source
+        fingerprint. Only the check_date partitions of the last `getResultCacheDays()` days are scanned. The stored
+        results are only returned if they contain a valid, executed result for every rule hash (e.g. not if the
+        results of the run were not completely saved).
+
+                Parameters:
+                        rule_set_hash (str): Hash of the valid rule definitions
+                        source_fingerprint (str): Hash of the last modified times of the base query tables
+                        rule_hashes (list<str>): Rule hashes the stored results should cover
+
+                Returns:
+                        cached_results (dict)
+                            success (bool) : True if the stored results were read successfully
+                            results (DataFrame) : Stored results of the valid rules (None if there is no cache hit)
+        """
+        from datetime import datetime, timedelta
+
+        project_id = self._gcp_configuration.getProjectId()
+        dataset_id = self._gcp_configuration.getDatasetId()
+        # check_date is written with the client date (see TDQResult), both tables are partitioned by it
+        minimum_check_date = self._quote_sql_string((datetime.now().date() - timedelta(days=self._tdq_configuration.getResultCacheDays())).isoformat())
+        query = f"""
+            SELECT
+                results.*
+            FROM
+                `{project_id}.{dataset_id}.{self._gcp_configuration.getTDQResultsTable()}` AS results
+            WHERE
+                results.check_date >= DATE {minimum_check_date}
+                AND results.is_valid
+                AND results.row_count IS NOT NULL
+                AND results.check_uuid = (
+                    SELECT
+                        check_uuid
+                    FROM
+                        `{project_id}.{dataset_id}.{self._gcp_configuration.getTDQSummaryTable()}`
+                    WHERE
+                        check_date >= DATE {minimum_check_date}
+                        AND check_name = {self._quote_sql_string(self._tdq_configuration.getTDQCheckName())}
+                        AND rule_set_hash = {self._quote_sql_string(rule_set_hash)}
+                        AND source_fingerprint = {self._quote_sql_string(source_fingerprint)}
+                        AND sample_percent IS NULL
+                    ORDER BY
+                        execution_end_time DESC
+                    LIMIT 1
+                )
+        """
+        execution_results = self._execute_bq_query(project_id=project_id, query=query)
+        if not execution_results["success"]:
+            return execution_results
+
+        cached_results = execution_results["results"]
+        if (len(cached_results) == 0) or (not set(rule_hashes).issubset(set(cached_results["rule_hash"]))):
+            return {"success": True, "results": None}
+        return {"success": True, "results": cached_results}
+
     def _validate_rules(self, tdq_rules: list[TDQRuleBase]):
 
         valid_rules = []
@@ -241,121 +1022,522 @@ class TDQEngine:
         import pandas as pd
         import json
 
-        df = pd.DataFrame(columns=["check_uuid",
-                                   "rule_uuid",
-                                   "type",
-                                   "check_type",
-                                   "column_name",
-                                   "parameters",
-                                   "threshold",
-                                   "row_count",
-                                   "unexpected_count",
-                                   "expected_count",
-                                   "unexpected_ratio",
-                                   "expected_ratio",
-                                   "is_passed",
-                                   "is_valid"])
-        for invalid_rule in invalid_rules:
-            df = pd.concat([df, pd.DataFrame({
-                "check_uuid": [str(invalid_rule.getCheckUUID())],
-                "rule_uuid": [str(invalid_rule.getRuleCheckUUID())],
-                "type": [invalid_rule.getRuleType().value],
-                "check_type": [invalid_rule.getRuleCheckType()],
-                "column_name": [invalid_rule.getColumnName()],
-                "parameters": [json.dumps(invalid_rule.getParameters())],
-                "threshold": [invalid_rule.getThreshold()],
-                "row_count": [None],
-                "unexpected_count": [None],
-                "expected_count": [None],
-                "unexpected_ratio": [None],
-                "expected_ratio": [None],
-                "is_passed": [False],
-                "is_valid": [False]
-            })], ignore_index=True)
-
-        return df
+        # Build the columns first and create the DataFrame once (appending row by row is quadratic in rule count)
+        return pd.DataFrame({
+            "check_uuid": [str(invalid_rule.getCheckUUID()) for invalid_rule in invalid_rules],
+            "rule_uuid": [str(invalid_rule.getRuleCheckUUID()) for invalid_rule in invalid_rules],
+            "type": [invalid_rule.getRuleType().value if invalid_rule.getRuleType() is not None else None for invalid_rule in invalid_rules],
+            "check_type": [invalid_rule.getRuleCheckType() for invalid_rule in invalid_rules],
+            "column_name": [invalid_rule.getColumnName() for invalid_rule in invalid_rules],
+            "parameters": [json.dumps(invalid_rule.getParameters()) for invalid_rule in invalid_rules],
+            "threshold": [invalid_rule.getThreshold() for invalid_rule in invalid_rules],
+            "row_count": [None] * len(invalid_rules),
+            "unexpected_count": [None] * len(invalid_rules),
+            "expected_count": [None] * len(invalid_rules),
+            # Ratios are typed like the ratios of the valid check results, so both concatenate without a dtype change
+            "unexpected_ratio": pd.Series([None] * len(invalid_rules), dtype="float64"),
+            "expected_ratio": pd.Series([None] * len(invalid_rules), dtype="float64"),
+            "is_passed": [False] * len(invalid_rules),
+            "is_valid": [False] * len(invalid_rules)
+        }, columns=["check_uuid",
+                    "rule_uuid",
+                    "type",
+                    "check_type",
+                    "column_name",
+                    "parameters",
+                    "threshold",
+                    "row_count",
+                    "unexpected_count",
+                    "expected_count",
+                    "unexpected_ratio",
+                    "expected_ratio",
+                    "is_passed",
+                    "is_valid"])
+
+    def _generate_fused_checks_dataset(self, check_uuid: str, tdq_rules: list[TDQRuleBase] = [], fused_results: any = None):
+        """
+        Unpivot the single row returned by a fused DQ check query into one row per rule in the DQ results schema.
+
+                Parameters:
+                        check_uuid (str): DQ check UUID
+                        tdq_rules (list<TDQRuleBase>) : Rules in the order they were compiled into the fused query
+                        fused_results (DataFrame) : Fused query results with row_count, unexpected_counts and expected_counts
+
+                Returns:
+                        df (DataFrame) : DQ check results, one row per rule
+        """
+        import pandas as pd
+        import json
+        from rule_definitions.tdq_rule_state import round_ratio
+
+        fused_row = fused_results.iloc[0]
+        row_count = int(fused_row["row_count"])
+        unexpected_counts = [int(x) for x in fused_row["unexpected_counts"]]
+        expected_counts = [int(x) for x in fused_row["expected_counts"]]
+        unexpected_ratios = [x / row_count if row_count > 0 else 0.0 for x in unexpected_counts]
+        expected_ratios = [x / row_count if row_count > 0 else 0.0 for x in expected_counts]
+
+        return pd.DataFrame({
+            "check_uuid": [str(check_uuid)] * len(tdq_rules),
+            "rule_uuid": [str(tdq_rule.getRuleCheckUUID()) for tdq_rule in tdq_rules],
+            "type": [tdq_rule.getRuleType().value for tdq_rule in tdq_rules],
+            "check_type": [tdq_rule.getRuleCheckType() for tdq_rule in tdq_rules],
+            "column_name": [tdq_rule.getColumnName() for tdq_rule in tdq_rules],
+            "parameters": [json.dumps(tdq_rule.getParameters()) for tdq_rule in tdq_rules],
+            "threshold": [tdq_rule.getThreshold() for tdq_rule in tdq_rules],
+            "row_count": [row_count] * len(tdq_rules),
+            "unexpected_count": unexpected_counts,
+            "expected_count": expected_counts,
+            "unexpected_ratio": [round_ratio(x) for x in unexpected_ratios],
+            "expected_ratio": [round_ratio(x) for x in expected_ratios],
+            "is_passed": [not (ratio > tdq_rule.getThreshold()) for ratio, tdq_rule in zip(unexpected_ratios, tdq_rules)],
+            "is_valid": [tdq_rule.isValid() for tdq_rule in tdq_rules]
+        })
+
+    def _apply_sampling_confidence(self, df_tdq_results: any = None, confidence_level: float = 0.95):
+        """
+        Adds the confidence interval of the unexpected ratio to sampled DQ check results and decides pass/fail only
+        if the interval is clear of the threshold (`is_passed` is None if the check is inconclusive).
+
+                Parameters:
+                        df_tdq_results (DataFrame): DQ check results of the valid rules on the sample
+                        confidence_level (float) : Confidence level of the intervals
+
+                Returns:
+                        df (DataFrame) : DQ check results with unexpected_ratio_lower/unexpected_ratio_upper
+        """
+        import pandas as pd
+        from rule_definitions.tdq_rule_state import round_ratio
+        from tdq_engine.tdq_statistics import wilson_interval, decide_passed
+
+        lower, upper = wilson_interval(counts=df_tdq_results["unexpected_count"].to_numpy(dtype=float),
+                                       row_counts=df_tdq_results["row_count"].to_numpy(dtype=float),
+                                       confidence_level=confidence_level)
+        df_tdq_results["unexpected_ratio_lower"] = [round_ratio(x) for x in lower.tolist()]
+        df_tdq_results["unexpected_ratio_upper"] = [round_ratio(x) for x in upper.tolist()]
+        # Object column, so inconclusive checks stay None
+        df_tdq_results["is_passed"] = pd.Series(decide_passed(lower=lower, upper=upper, thresholds=df_tdq_results["threshold"].to_numpy(dtype=float)),
+                                                index=df_tdq_results.index, dtype=object)
+        return df_tdq_results
+
+    def _generate_cached_checks_dataset(self, check_uuid: str, tdq_rules: list[TDQRuleBase] = [], cached_results: any = None):
+        """
+        Maps the stored results of an earlier run to the rules of this run (by rule hash).
+
+                Parameters:
+                        check_uuid (str): DQ check UUID
+                        tdq_rules (list<TDQRuleBase>) : Valid rules
+                        cached_results (DataFrame) : Stored results of the earlier run
+
+                Returns:
+                        df (DataFrame) : DQ check results, one row per rule
+        """
+        import pandas as pd
+        import json
+
+        cached_rows = {}
+        for cached_row in cached_results.to_dict(orient="records"):
+            cached_rows.setdefault(cached_row["rule_hash"], cached_row)
+        rule_rows = [cached_rows[tdq_rule.getRuleHash()] for tdq_rule in tdq_rules]
+
+        return pd.DataFrame({
+            "check_uuid": [str(check_uuid)] * len(tdq_rules),
+            "rule_uuid": [str(tdq_rule.getRuleCheckUUID()) for tdq_rule in tdq_rules],
+            "type": [tdq_rule.getRuleType().value for tdq_rule in tdq_rules],
+            "check_type": [tdq_rule.getRuleCheckType() for tdq_rule in tdq_rules],
+            "column_name": [tdq_rule.getColumnName() for tdq_rule in tdq_rules],
+            "parameters": [json.dumps(tdq_rule.getParameters()) for tdq_rule in tdq_rules],
+            "threshold": [tdq_rule.getThreshold() for tdq_rule in tdq_rules],
+            **{column: [rule_row[column] for rule_row in rule_rows] for column in ["row_count",
+                                                                                   "unexpected_count",
+                                                                                   "expected_count",
+                                                                                   "unexpected_ratio",
+                                                                                   "expected_ratio",
+                                                                                   "is_passed"]},
+            "is_valid": [tdq_rule.isValid() for tdq_rule in tdq_rules]
+        })
+
+    def _generate_incremental_checks_dataset(self, check_uuid: str, tdq_rules: list[TDQRuleBase] = [], partition_results: any = None,
+                                             rule_set_hash: str = None, stored_rule_states: dict = None):
+        """
+        Rolls the counters of the newly checked partitions up with the stored rule states.
+
+                Parameters:
+                        check_uuid (str): DQ check UUID
+                        tdq_rules (list<TDQRuleBase>) : Rules in the order they were compiled into the fused query
+                        partition_results (DataFrame) : Fused query results, one row per checked partition
+                        rule_set_hash (str) : Hash of the valid rule definitions
+                        stored_rule_states (dict) : Rolled up TDQRuleState of the stored partitions by rule hash
+
+                Returns:
+                        df (DataFrame) : DQ check results, one row per rule
+                        df_partition_states (DataFrame) : Rule states of the checked partitions, one row per partition and rule
+        """
+        import pandas as pd
+        import json
+        import copy
+        from datetime import datetime
+
+        checked_at = datetime.utcnow()
+        rule_hashes = [tdq_rule.getRuleHash() for tdq_rule in tdq_rules]
+        # Copies, rules with the same definition share the stored state
+        rule_states = [copy.deepcopy(stored_rule_states[rule_hash]) if rule_hash in stored_rule_states else tdq_rule.initState()
+                       for tdq_rule, rule_hash in zip(tdq_rules, rule_hashes)]
+
+        partition_states = {column: [] for column in ["partition_value", "rule_hash", "row_count", "unexpected_count", "expected_count", "sketches"]}
+        for partition_row in partition_results.to_dict(orient="records"):
+            for rule_index, (unexpected_count, expected_count) in enumerate(zip(partition_row["unexpected_counts"], partition_row["expected_counts"])):
+                partition_state = tdq_rules[rule_index].initState().update(row_count=partition_row["row_count"],
+                                                                           unexpected_count=unexpected_count,
+                                                                           expected_count=expected_count)
+                tdq_rules[rule_index].mergeStates(state=rule_states[rule_index], other_state=partition_state)
+                partition_states["partition_value"].append(partition_row["partition_value"])
+                partition_states["rule_hash"].append(rule_hashes[rule_index])
+                partition_states["row_count"].append(partition_state.getRowCount())
+                partition_states["unexpected_count"].append(partition_state.getUnexpectedCount())
+                partition_states["expected_count"].append(partition_state.getExpectedCount())
+                partition_states["sketches"].append(json.dumps(partition_state.getSketches(), sort_keys=True))
+
+        rule_results = [tdq_rule.finalizeState(state=rule_state) for tdq_rule, rule_state in zip(tdq_rules, rule_states)]
+        df_results = pd.DataFrame({
+            "check_uuid": [str(check_uuid)] * len(tdq_rules),
+            "rule_uuid": [str(tdq_rule.getRuleCheckUUID()) for tdq_rule in tdq_rules],
+            "type": [tdq_rule.getRuleType().value for tdq_rule in tdq_rules],
+            "check_type": [tdq_rule.getRuleCheckType() for tdq_rule in tdq_rules],
+            "column_name": [tdq_rule.getColumnName() for tdq_rule in tdq_rules],
+            "parameters": [json.dumps(tdq_rule.getParameters()) for tdq_rule in tdq_rules],
+            "threshold": [tdq_rule.getThreshold() for tdq_rule in tdq_rules],
+            **{column: [rule_result[column] for rule_result in rule_results] for column in ["row_count",
+                                                                                            "unexpected_count",
+                                                                                            "expected_count",
+                                                                                            "unexpected_ratio",
+                                                                                            "expected_ratio",
+                                                                                            "is_passed"]},
+            "is_valid": [tdq_rule.isValid() for tdq_rule in tdq_rules]
+        })
+
+        partition_state_count = len(partition_states["rule_hash"])
+        df_partition_states = pd.DataFrame({
+            "check_date": [datetime.now().date()] * partition_state_count,
+            "check_uuid": [str(check_uuid)] * partition_state_count,
+            "check_name": [self._tdq_configuration.getTDQCheckName()] * partition_state_count,
+            "rule_set_hash": [rule_set_hash] * partition_state_count,
+            "partition_column": [self._tdq_configuration.getIncrementalColumn()] * partition_state_count,
+            **partition_states,
+            "checked_at": [checked_at] * partition_state_count
+        })
+        return df_results, df_partition_states
+
+    def _save_tdq_partition_states(self, df_partition_states: any = None) -> dict:
+        """
+        Saves the partition states of an incremental check using the persistence mode of the GCP configuration.
+        The next incremental run depends on them, so they are never buffered: LOAD_JOB and BUFFERED modes write
+        them with a load job right away (without flushing buffered TDQ summary and check results).
+
+                Parameters:
+                        df_partition_states (DataFrame): Rule states of the checked partitions
+
+                Returns:
+                        save_result (dict) : `success` flag and `error` if not successful
+        """
+        from tdq_engine.tdq_batch_writer import TDQBatchWriter
+        from tdq_engine.tdq_google_cloud_configuration import PERSISTENCE_MODE
+
+        with self._trace(name="save_tdq_partition_states"):
+            try:
+                if df_partition_states is None or len(df_partition_states) == 0:
+                    return {"success": True}
+                project_id = self._gcp_configuration.getProjectId()
+                table_id = f"{project_id}.{self._gcp_configuration.getDatasetId()}.{self._gcp_configuration.getTDQPartitionStatesTable()}"
+                if self._gcp_configuration.getPersistenceMode() in (PERSISTENCE_MODE.LOAD_JOB, PERSISTENCE_MODE.BUFFERED):
+                    batch_writer = TDQBatchWriter(client_getter=self._get_bq_client)
+                    batch_writer.append(project_id=project_id, table_id=table_id, dataframe=df_partition_states, schema=self._get_tdq_partition_states_schema())
+                    flush_result = batch_writer.flush()
+                    errors = flush_result.get("error", [])
+                else:
+                    client = self._get_bq_client(project_id=project_id)
+                    errors = client.insert_rows_from_dataframe(table=client.get_table(table=table_id), dataframe=df_partition_states)
+                if not any(errors):
+                    self._log_info("TDQ partition states of %s partition(s) saved to `%s`.`%s.%s` successfully", df_partition_states['partition_value'].nunique(dropna=False), project_id, self._gcp_configuration.getDatasetId(), self._gcp_configuration.getTDQPartitionStatesTable())
+                    return {"success": True}
+                else:
+                    return {"success": False, "error": errors}
+            except Exception as ex:
+                self._log_error("Error saving TDQ partition states. Error message: %s", ex)
+                return {"success": False, "error": [[str(ex)]]}
 
     def _save_summary(self, tdq_result: TDQResult = None) -> dict:
-        try:
-            from google.cloud import bigquery
-            with bigquery.Client(project=tdq_result.getGCPProjectId()) as client:
+        with self._trace(name="save_summary"):
+            try:
+                client = self._get_bq_client(project_id=tdq_result.getGCPProjectId())
                 table_id = f"{tdq_result.getGCPProjectId()}.{tdq_result.getGCPDatasetId()}.{tdq_result.getGCPSummaryTable()}"
                 table = client.get_table(table=table_id)
                 df_summary_row = tdq_result.getSummaryDataFrame()
                 errors = client.insert_rows_from_dataframe(table=table, dataframe=df_summary_row)
                 if not any(errors):
-                    self._log_info(f"TDQ summary results saved to `{tdq_result.getGCPProjectId()}`.`{tdq_result.getGCPDatasetId()}.{tdq_result.getGCPSummaryTable()}` successfully")
+                    self._log_info("TDQ summary results saved to `%s`.`%s.%s` successfully", tdq_result.getGCPProjectId(), tdq_result.getGCPDatasetId(), tdq_result.getGCPSummaryTable())
                     return {"success": True}
                 else:
                     return {"success": False, "error": errors}
-        except Exception as ex:
-            self._log_error(f"Error saving TDQ summary. Error message: {str(ex)}")
-            return {"success": False, "error": [[str(ex)]]}
+            except Exception as ex:
+                self._log_error("Error saving TDQ summary. Error message: %s", ex)
+                return {"success": False, "error": [[str(ex)]]}
 
     def _save_tdq_check_results(self, tdq_result: TDQResult = None) -> dict:
-        try:
-            from google.cloud import bigquery
-            with bigquery.Client(project=tdq_result.getGCPProjectId()) as client:
+        with self._trace(name="save_tdq_check_results"):
+            try:
+                client = self._get_bq_client(project_id=tdq_result.getGCPProjectId())
                 table_id = f"{tdq_result.getGCPProjectId()}.{tdq_result.getGCPDatasetId()}.{tdq_result.getGCPResultsTable()}"
                 table = client.get_table(table=table_id)
                 df_check_results = tdq_result.getResultsDataFrame()
                 errors = client.insert_rows_from_dataframe(table=table, dataframe=df_check_results)
                 if not any(errors):
-                    self._log_info(f"TDQ check results saved to `{tdq_result.getGCPProjectId()}`.`{tdq_result.getGCPDatasetId()}.{tdq_result.getGCPResultsTable()}` successfully")
+                    self._log_info("TDQ check results saved to `%s`.`%s.%s` successfully", tdq_result.getGCPProjectId(), tdq_result.getGCPDatasetId(), tdq_result.getGCPResultsTable())
                     return {"success": True}
                 else:
                     return {"success": False, "error": errors}
 
-        except Exception as ex:
-            self._log_error(f"Error saving TDQ check results. Error message: {str(ex)}")
-            return {"success": False, "error": [[str(ex)]]}
+            except Exception as ex:
+                self._log_error("Error saving TDQ check results. Error message: %s", ex)
+                return {"success": False, "error": [[str(ex)]]}
+
+    def _save_tdq_result_batch(self, tdq_result: TDQResult = None, flush: bool = True) -> dict:
+        with self._trace(name="save_tdq_result_batch", flush=flush):
+            try:
+                batch_writer = self._get_batch_writer()
+                batch_writer.append(project_id=tdq_result.getGCPProjectId(),
+                                    table_id=f"{tdq_result.getGCPProjectId()}.{tdq_result.getGCPDatasetId()}.{tdq_result.getGCPSummaryTable()}",
+                                    dataframe=tdq_result.getSummaryDataFrame(),
+                                    schema=self._get_tdq_summary_schema())
+                batch_writer.append(project_id=tdq_result.getGCPProjectId(),
+                                    table_id=f"{tdq_result.getGCPProjectId()}.{tdq_result.getGCPDatasetId()}.{tdq_result.getGCPResultsTable()}",
+                                    dataframe=tdq_result.getResultsDataFrame(),
+                                    schema=self._get_tdq_results_schema())
+            except Exception as ex:
+                self._log_error("Error buffering TDQ summary and check results. Error message: %s", ex)
+                return {"success": False, "error": [[str(ex)]]}
+
+            if flush or batch_writer.isFlushRequired():
+                return self._flush_batch_writer()
+            else:
+                self._log_info("TDQ summary and check results buffered. %s rows waiting for the next flush", batch_writer.getBufferedRowCount())
+                return {"success": True, "buffered": True}
+
+    def _save_tdq_result(self, tdq_result: TDQResult = None, log_fields: dict = None) -> dict:
+        """
+        Saves TDQ summary and check results using the persistence mode of the GCP configuration.
+
+                Parameters:
+                        tdq_result (TDQResult): TDQ check result
+                        log_fields (dict): Log fields of the check (captured when the result was queued for the
+                                           background writer). If not defined, the fields of the running check are used
+
+                Returns:
+                        save_result (dict) : `success` flag and `error` if not successful
+        """
+        from tdq_engine.tdq_google_cloud_configuration import PERSISTENCE_MODE
+
+        if log_fields is not None:
+            with self._use_log_fields(fields=log_fields):
+                return self._save_tdq_result(tdq_result=tdq_result)
+
+        with self._trace(name="save_tdq_result"):
+            persistence_mode = self.get_GCPConfiguration().getPersistenceMode()
+            if persistence_mode == PERSISTENCE_MODE.LOAD_JOB:
+                return self._save_tdq_result_batch(tdq_result=tdq_result, flush=True)
+            elif persistence_mode == PERSISTENCE_MODE.BUFFERED:
+                return self._save_tdq_result_batch(tdq_result=tdq_result, flush=False)
+
+            self._log_info("Saving TDQ checks summary to `%s`.`%s.%s`", tdq_result.getGCPProjectId(), tdq_result.getGCPDatasetId(), tdq_result.getGCPSummaryTable())
+            summary_save_result = self._save_summary(tdq_result=tdq_result)
+            if summary_save_result["success"]:
+                self._log_info("Saving TDQ check results summary to `%s`.`%s.%s`", tdq_result.getGCPProjectId(), tdq_result.getGCPDatasetId(), tdq_result.getGCPResultsTable())
+                return self._save_tdq_check_results(tdq_result=tdq_result)
+            else:
+                return summary_save_result
 
     # endregion
 
     # region Public Methods
 
-    def _execute_tdq_checks(self, base_query: str, tdq_rules: list[TDQRuleBase] = [], row_limit: int = None):
+    def _execute_tdq_checks(self, base_query: str, tdq_rules: list[TDQRuleBase] = [], row_limit: int = None, sample_percent: float = None,
+                            result_cache: bool = True, budget_sample: bool = True, run_metrics: any = None):
+        # result_cache/budget_sample: False to always check all rows (e.g. the full re-check of adaptive TDQ checks)
+        # run_metrics: TDQRunMetrics of the run, None if the run is not measured (e.g. test_rule)
 
         # Import libraries
+        import time
+        from functools import partial
         import pandas as pd
+        from rule_definitions.tdq_rule_base import RULE_TYPE
 
         # Validate rules
         valid_rules, invalid_rules = self._validate_rules(tdq_rules=tdq_rules)
 
         # Prepare/Create TDQ tables
-        tdq_tables_config = self._prepare_tdq_tables()
+        if self._is_offline_execution():
+            if self._tdq_configuration is None:
+                return {"success": False, "error": "Error executing TDQ checks. TDQ configuration should be defined. Please check the configuration and try again!"}
+            self._log_info("No GCP configuration defined. TDQ tables are not prepared and TDQ results will not be saved")
+            tdq_tables_config = {"success": True}
+        else:
+            with self._measure(phase="table_prep", run_metrics=run_metrics):
+                tdq_tables_config = self._prepare_tdq_tables()
 
         # If success, start preparing and executing TDQ checks
         if tdq_tables_config["success"]:
 
-            # Prepare TDQ base config
-            self._log_info("Preparing TDQ base query config")
-            tdq_base_config = self._prepare_tdq_base_query(query=base_query, row_limit=row_limit)
-            check_uuid = tdq_base_config['check_uuid']
-            self._log_info(f"TDQ Check UUID: {check_uuid}")
-            self._log_info(f"TDQ Base Query\n{tdq_base_config['base_query'].strip()}")
-
-            # Prepare TDQ checks query for valid rules
-            self._log_info("Preparing TDQ query config (Only for valid rules)")
-            tdq_query_config = self._prepare_tdq_check_query_config(base_query_config=tdq_base_config, tdq_rules=valid_rules)
-            self._log_info(f"TDQ Checks Query\n{tdq_query_config['tdq_check_query']}")
-
-            # Execute TDQ checks query
-            self._log_info(f"Start executing valid TDQ checks. {len(valid_rules)} will be executed!")
-            execution_results = self._execute_bq_query(project_id=self.get_GCPConfiguration().getProjectId(), query=tdq_query_config['tdq_check_query'])
+            if (sample_percent is not None) and self._is_rule_execution():
+                self._log_warn("%s does not support sampling. TDQ checks will be executed on all rows", type(self._execution_backend).__name__)
+                sample_percent = None
+
+            rule_set_hash = self._get_rule_set_hash(tdq_rules=valid_rules)
+            estimated_bytes_processed = None
+            source_freshness = {"last_modified": None, "fingerprint": None}
+            cached_results = None
+            if (len(valid_rules) > 0) and result_cache and self._is_result_cache_execution(row_limit=row_limit, sample_percent=sample_percent):
+                # Stored results of the last run are returned if neither the rules nor the base query tables have changed
+                source_freshness = self._get_source_freshness(base_query=base_query)
+                if source_freshness["success"] and (source_freshness["fingerprint"] is not None):
+                    cached_tdq_results = self._get_cached_tdq_results(rule_set_hash=rule_set_hash,
+                                                                      source_fingerprint=source_freshness["fingerprint"],
+                                                                      rule_hashes=[valid_rule.getRuleHash() for valid_rule in valid_rules])
+                    cached_results = cached_tdq_results["results"] if cached_tdq_results["success"] else None
+                elif not source_freshness["success"]:
+                    source_freshness = {"last_modified": None, "fingerprint": None}
+
+            if len(valid_rules) == 0:
+                # Nothing to query, only the invalid rules are reported
+                check_uuid = str(self._get_uuid())
+                self._set_log_field(name="check_uuid", value=str(check_uuid))
+                self._log_info("TDQ Check UUID: %s", check_uuid)
+                self._log_warn("No valid TDQ checks. TDQ checks query is not executed")
+                sample_percent = None
+                execution_results = {"success": True, "results": self._generate_invalid_checks_dataset(invalid_rules=[])}
+                tdq_query_config = {"is_fused": False, "is_empty": True}
+            elif cached_results is not None:
+                check_uuid = str(self._get_uuid())
+                self._set_log_field(name="check_uuid", value=str(check_uuid))
+                self._log_info("TDQ Check UUID: %s", check_uuid)
+                self._log_info("Base query tables and TDQ rules not changed since the last run. Returning the stored TDQ check results (cache hit)")
+                for valid_rule in valid_rules:
+                    valid_rule.setCheckUUID(base_uuid=check_uuid)
+                execution_results = {"success": True, "results": cached_results}
+                tdq_query_config = {"is_fused": False, "is_cached": True}
+            elif self._is_rule_execution():
+                # Valid rules are evaluated directly on the data of the execution backend (no TDQ check query)
+                check_uuid = str(self._get_uuid())
+                self._set_log_field(name="check_uuid", value=str(check_uuid))
+                self._log_info("TDQ Check UUID: %s", check_uuid)
+                self._log_info("Start evaluating valid TDQ checks on %s. %s will be executed!", type(self._execution_backend).__name__, len(valid_rules))
+                execution_results = self._execute_tdq_rules(check_uuid=check_uuid, tdq_rules=valid_rules, row_limit=row_limit, run_metrics=run_metrics)
+                tdq_query_config = {"is_fused": True}
+            elif self._is_incremental_execution(row_limit=row_limit, sample_percent=sample_percent):
+                # The watermark partition, newer partitions and the NULL partition are checked and rolled up with the stored rule states
+                incremental_column = self._tdq_configuration.getIncrementalColumn()
+                if any(valid_rule.getRuleType() != RULE_TYPE.ROW_BASED for valid_rule in valid_rules):
+                    return {"success": False, "error": "Incremental TDQ checks only support ROW_BASED rules"}
+
+                partition_states = self._get_tdq_partition_states(rule_set_hash=rule_set_hash, tdq_rules=valid_rules)
+                if not partition_states["success"]:
+                    return {"success": False, "error": partition_states.get("error", "Unknown error")}
+                watermark = partition_states["watermark"]
+                self._log_info("TDQ incremental watermark of `%s`: %s", incremental_column, watermark if watermark is not None else 'No partitions checked yet')
+
+                # Only the rows of the checked partitions are selected from the base query
+                with self._measure(phase="sql_build", run_metrics=run_metrics):
+                    tdq_base_config = self._prepare_tdq_base_query(query=base_query, deterministic=self._is_deterministic_sql(),
+                                                                   columns=self._get_projection_columns(tdq_rules=valid_rules, extra_columns=[incremental_column]),
+                                                                   condition=self._prepare_incremental_filter(watermark=watermark))
+                    check_uuid = tdq_base_config['check_uuid']
+                    tdq_query_config = self._prepare_tdq_fused_check_query_config(base_query_config=tdq_base_config, tdq_rules=valid_rules,
+                                                                                  partition_column=incremental_column,
+                                                                                  partition_expression=self._prepare_incremental_partition_expression())
+                self._set_log_field(name="check_uuid", value=str(check_uuid))
+                self._log_info("TDQ Check UUID: %s", check_uuid)
+                tdq_query_config["is_incremental"] = True
+                self._log_tdq_check_query(tdq_query_config=tdq_query_config)
+
+                # Partition states must cover all rows, so the incremental TDQ checks query is never sampled
+                budget_result = self._enforce_tdq_bytes_budget(tdq_base_config=tdq_base_config, tdq_query_config=tdq_query_config, run_metrics=run_metrics)
+                if not budget_result["success"]:
+                    return budget_result
+                estimated_bytes_processed = budget_result["estimated_bytes_processed"]
+
+                self._log_info("Start executing valid TDQ checks on new partitions. %s will be executed!", len(valid_rules))
+                execution_results = self._execute_tdq_check_query(tdq_query_config=tdq_query_config, run_metrics=run_metrics)
+            else:
+                tdq_base_config, tdq_query_config = self._prepare_tdq_query_configs(base_query=base_query, tdq_rules=valid_rules,
+                                                                                    row_limit=row_limit, sample_percent=sample_percent, run_metrics=run_metrics)
+                # A budget sample only replaces a full scan (not a row limit or an explicit sample)
+                prepare_sampled_query_configs = None
+                if budget_sample and (row_limit is None) and (sample_percent is None):
+                    prepare_sampled_query_configs = partial(self._prepare_tdq_query_configs, base_query=base_query, tdq_rules=valid_rules, run_metrics=run_metrics)
+                budget_result = self._enforce_tdq_bytes_budget(tdq_base_config=tdq_base_config, tdq_query_config=tdq_query_config,
+                                                               prepare_sampled_query_configs=prepare_sampled_query_configs, run_metrics=run_metrics)
+                if not budget_result["success"]:
+                    return budget_result
+                tdq_base_config, tdq_query_config = budget_result["tdq_base_config"], budget_result["tdq_query_config"]
+                check_uuid = tdq_base_config['check_uuid']
+                sample_percent = budget_result["sample_percent"] if budget_result["sample_percent"] is not None else sample_percent
+                estimated_bytes_processed = budget_result["estimated_bytes_processed"]
+
+                # Execute TDQ checks query
+                self._log_info("Start executing valid TDQ checks. %s will be executed!", len(valid_rules))
+                execution_results = self._execute_tdq_check_query(tdq_query_config=tdq_query_config, run_metrics=run_metrics)
 
             # If success, append invalid rules information to results
             if execution_results["success"]:
+                result_processing_time = time.perf_counter()
                 # Get valid checks execution results dataframe
-                df_tdq_results = execution_results["results"]
+                df_partition_states = None
+                if tdq_query_config.get("is_empty", False):
+                    df_tdq_results = execution_results["results"]
+                elif tdq_query_config.get("is_cached", False):
+                    df_tdq_results = self._generate_cached_checks_dataset(check_uuid=check_uuid, tdq_rules=valid_rules, cached_results=execution_results["results"])
+                elif tdq_query_config.get("is_incremental", False):
+                    df_tdq_results, df_partition_states = self._generate_incremental_checks_dataset(check_uuid=check_uuid, tdq_rules=valid_rules,
+                                                                                                    partition_results=execution_results["results"],
+                                                                                                    rule_set_hash=rule_set_hash,
+                                                                                                    stored_rule_states=partition_states["rule_states"])
+                    self._log_info("%s new partition(s) checked", df_partition_states['partition_value'].nunique(dropna=False))
+                elif tdq_query_config["is_fused"]:
+                    df_tdq_results = self._generate_fused_checks_dataset(check_uuid=check_uuid, tdq_rules=valid_rules, fused_results=execution_results["results"])
+                else:
+                    df_tdq_results = execution_results["results"]
+                    # Attach check and rule UUIDs client-side (only differ from the SQL ones in deterministic mode)
+                    df_tdq_results["check_uuid"] = check_uuid
+                    df_tdq_results["rule_uuid"] = df_tdq_results["rule_uuid"].map(tdq_query_config["rule_uuids"])
+                    for valid_rule in valid_rules:
+                        valid_rule.setCheckUUID(check_uuid)
+                if sample_percent is not None:
+                    df_tdq_results = self._apply_sampling_confidence(df_tdq_results=df_tdq_results, confidence_level=self._tdq_configuration.getConfidenceLevel())
+                    # Sampling of every rule result, adaptive TDQ checks mix sampled and full scan results
+                    df_tdq_results["sample_percent"] = sample_percent
+                    df_tdq_results["confidence_level"] = self._tdq_configuration.getConfidenceLevel()
+                    self._log_info("TDQ checks executed on a %s%% sample. %s check(s) inconclusive at %s confidence", sample_percent,
+                                   df_tdq_results['is_passed'].isna().sum(), self._tdq_configuration.getConfidenceLevel())
                 self._log_info("Valid TDQ checks execution completed successfully")
                 self._log_info("Adding invalid TDQ checks with is_valid=False flag")
 
                 for invalid_rule in invalid_rules:
                     invalid_rule.setCheckUUID(check_uuid)
-                    df_tdq_results = pd.concat([df_tdq_results, self._generate_invalid_checks_dataset(invalid_rules=[invalid_rule])], ignore_index=True)
-
-                return {"success": True, "check_uuid": check_uuid, "tdq_results": df_tdq_results}
+                if len(invalid_rules) > 0:
+                    df_tdq_results = pd.concat([df_tdq_results, self._generate_invalid_checks_dataset(invalid_rules=invalid_rules)], ignore_index=True)
+                df_tdq_results["rule_hash"] = df_tdq_results["rule_uuid"].map({str(tdq_rule.getRuleCheckUUID()): tdq_rule.getRuleHash() for tdq_rule in tdq_rules})
+                if run_metrics is not None:
+                    run_metrics.addPhaseSeconds(phase="result_processing", seconds=time.perf_counter() - result_processing_time)
+
+                return {"success": True,
+                        "check_uuid": check_uuid,
+                        "tdq_results": df_tdq_results,
+                        "partition_states": df_partition_states,
+                        "rule_set_hash": rule_set_hash,
+                        "source_last_modified": source_freshness["last_modified"],
+                        "source_fingerprint": source_freshness["fingerprint"],
+                        "is_cache_hit": tdq_query_config.get("is_cached", False),
+                        "sample_percent": sample_percent,
+                        "estimated_bytes_processed": estimated_bytes_processed}
 
             else:
                 return {"success": False, "check_uuid": check_uuid, "error": execution_results.get("error", "Unknown error")}
@@ -367,6 +1549,58 @@ class TDQEngine:
         else:
             return {"success": False, "error": tdq_tables_config.get("error", "Unknown error")}
 
+    def _execute_adaptive_tdq_checks(self, base_query: str, tdq_rules: list[TDQRuleBase] = [], run_metrics: any = None):
+        """
+        Checks all rules on a sample of the driving table, then re-checks on all rows only the valid rules that did not
+        clearly pass (failed, inconclusive or unexpected ratio within the adaptive margin of the threshold). The full
+        scan results replace the sampled results of these rules. The sample percentage and confidence level of every
+        rule result (`sample_percent`, `confidence_level`) tell which phase decided it. The full re-check always reads
+        all rows: the result cache and the budget sample fallback are disabled for it (it fails if it exceeds the
+        bytes budget).
+
+                Parameters:
+                        base_query (str): SQL query of the data source
+                        tdq_rules (list<TDQRuleBase>) : Rules applied to the base query
+                        run_metrics (TDQRunMetrics): Metrics of the run, shared by both phases (optional)
+
+                Returns:
+                        execution_result (dict) : Same as `_execute_tdq_checks`
+        """
+        import pandas as pd
+
+        adaptive_sample_percent = self._tdq_configuration.getAdaptiveSamplePercent()
+        adaptive_margin = self._tdq_configuration.getAdaptiveMargin()
+
+        self._log_info("Adaptive TDQ checks. Phase 1: checking %s rule(s) on a %s%% sample", len(tdq_rules), adaptive_sample_percent)
+        sampled_results = self._execute_tdq_checks(base_query=base_query, tdq_rules=tdq_rules, sample_percent=adaptive_sample_percent, run_metrics=run_metrics)
+        if (not sampled_results["success"]) or (sampled_results["sample_percent"] is None):
+            # Failed, or the execution backend does not support sampling (all rows already checked)
+            return sampled_results
+
+        check_uuid = sampled_results["check_uuid"]
+        df_sampled_results = sampled_results["tdq_results"]
+        is_clear_pass = df_sampled_results["is_passed"].map(lambda is_passed: is_passed is True) & \
+            ((df_sampled_results["threshold"] - df_sampled_results["unexpected_ratio"]).abs() > adaptive_margin)
+        rechecked_rule_uuids = set(df_sampled_results.loc[df_sampled_results["is_valid"].astype(bool) & ~is_clear_pass, "rule_uuid"])
+        rechecked_rules = [tdq_rule for tdq_rule in tdq_rules if str(tdq_rule.getRuleCheckUUID()) in rechecked_rule_uuids]
+        self._log_info("Adaptive TDQ checks. %s rule(s) decided on the sample. Phase 2: checking %s rule(s) on all rows", len(tdq_rules) - len(rechecked_rules), len(rechecked_rules))
+        if len(rechecked_rules) == 0:
+            return sampled_results
+
+        full_results = self._execute_tdq_checks(base_query=base_query, tdq_rules=rechecked_rules, result_cache=False, budget_sample=False, run_metrics=run_metrics)
+        if not full_results["success"]:
+            return full_results
+
+        # Full scan results replace the sampled results of the re-checked rules, in rule order, under one check UUID
+        full_result_rows = {full_result_row["rule_uuid"]: full_result_row for full_result_row in full_results["tdq_results"].to_dict(orient="records")}
+        df_tdq_results = pd.DataFrame([full_result_rows.get(result_row["rule_uuid"], result_row) for result_row in df_sampled_results.to_dict(orient="records")],
+                                      columns=df_sampled_results.columns)
+        df_tdq_results["check_uuid"] = check_uuid
+        for rechecked_rule in rechecked_rules:
+            rechecked_rule.setCheckUUID(base_uuid=check_uuid)
+
+        return {**sampled_results, "tdq_results": df_tdq_results}
+
     def set_GCPConfiguration(self, gcp_configuration: TDQGoogleCloudConfiguration = None):
         self._gcp_configuration = gcp_configuration
 
@@ -379,12 +1613,112 @@ class TDQEngine:
     def get_GCPConfiguration(self):
         return self._gcp_configuration
 
+    def set_ClientPool(self, client_pool: TDQBigQueryClientPool = None):
+        """
+        Sets the pool of BigQuery clients used by the engine. The pool is not closed by `close()`.
+        If not defined, the engine creates (and closes) its own pool.
+        """
+        from tdq_engine.tdq_bigquery_client_pool import TDQBigQueryClientPool
+        self._client_pool = client_pool if client_pool is not None else TDQBigQueryClientPool()
+        self._is_client_pool_owned = client_pool is None
+
+    def get_ClientPool(self):
+        return self._client_pool
+
+    def set_ProvisioningCache(self, provisioning_cache: TDQProvisioningCache = None):
+        """
+        Sets the cache of the ensured TDQ tables. If not defined, the process-wide `default_provisioning_cache` is used.
+        """
+        from tdq_engine.tdq_provisioning_cache import default_provisioning_cache
+        self._provisioning_cache = provisioning_cache if provisioning_cache is not None else default_provisioning_cache
+
+    def get_ProvisioningCache(self):
+        return self._provisioning_cache
+
+    def set_ExecutionBackend(self, execution_backend: TDQExecutionBackend = None):
+        """
+        Sets the backend executing the TDQ check queries. If not defined, the queries are executed on BigQuery.
+        """
+        self._execution_backend = execution_backend
+
+    def get_ExecutionBackend(self):
+        return self._execution_backend
+
+    def set_Tracer(self, tracer: TDQTracer = None):
+        """
+        Sets the tracer receiving start/end span callbacks around the engine hot paths (e.g. TDQInMemoryTracer).
+        If not defined, spans are not recorded.
+        """
+        from tdq_engine.tdq_tracer import TDQTracer
+        self._tracer = tracer if tracer is not None else TDQTracer()
+
+    def get_Tracer(self):
+        return self._tracer
+
+    def flush_results(self) -> dict:
+        """
+        Waits for TDQ results queued for asynchronous persistence and writes buffered TDQ summary and check results
+        (LOAD_JOB/BUFFERED persistence modes) with batch load jobs.
+
+                Returns:
+                        flush_result (dict) : `success` flag and `error` list of the failed saves
+        """
+        errors = []
+
+        if self._background_writer is not None:
+            background_flush_result = self._background_writer.flush()
+            if not background_flush_result["success"]:
+                self._log_error("Error saving TDQ results asynchronously. Error message: %s", background_flush_result['error'])
+                errors.extend(background_flush_result["error"])
+
+        batch_flush_result = self._flush_batch_writer()
+        if not batch_flush_result["success"]:
+            errors.extend(batch_flush_result["error"])
+
+        if len(errors) == 0:
+            return {"success": True}
+        else:
+            return {"success": False, "error": errors}
+
+    def close(self) -> dict:
+        """
+        Flushes pending TDQ results and closes the execution backend and the BigQuery clients of the pool created by
+        the engine (a client pool passed in by the caller is left open). Clients and backend connections are
+        re-created on the next use.
+        """
+        flush_result = self.flush_results()
+        if self._background_writer is not None:
+            self._background_writer.close()
+            self._background_writer = None
+        self._unregister_exit_flush()
+        if self._is_client_pool_owned:
+            self._client_pool.close()
+        if self._execution_backend is not None:
+            self._execution_backend.close()
+        return flush_result
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def run_data_quality_checks(self, base_query: str, tdq_rules: list[TDQRuleBase] = [], save_results: bool = True):
+        from tdq_engine.tdq_run_metrics import TDQRunMetrics
+
+        with self._use_log_fields(fields={}):
+            return self._run_data_quality_checks(base_query=base_query, tdq_rules=tdq_rules, save_results=save_results, run_metrics=TDQRunMetrics())
+
+    def _run_data_quality_checks(self, base_query: str, tdq_rules: list[TDQRuleBase] = [], save_results: bool = True, run_metrics: any = None):
         from datetime import datetime
         from tdq_engine.tdq_result import TDQResult
 
+        sample_percent = self.get_TDQConfiguration().getSamplePercent() if self.get_TDQConfiguration() is not None else None
         start_time = datetime.utcnow()
-        df_tdq_results = self._execute_tdq_checks(base_query=base_query, tdq_rules=tdq_rules)
+        if (self.get_TDQConfiguration() is not None) and self.get_TDQConfiguration().isAdaptive():
+            df_tdq_results = self._execute_adaptive_tdq_checks(base_query=base_query, tdq_rules=tdq_rules, run_metrics=run_metrics)
+        else:
+            df_tdq_results = self._execute_tdq_checks(base_query=base_query, tdq_rules=tdq_rules, sample_percent=sample_percent, run_metrics=run_metrics)
         end_time = datetime.utcnow()
         if df_tdq_results["success"]:
             tdq_results = TDQResult()
@@ -392,38 +1726,58 @@ class TDQEngine:
             tdq_results.setCheckName(self.get_TDQConfiguration().getTDQCheckName())
             tdq_results.setCheckDescription(self.get_TDQConfiguration().getTDQCheckDescription())
             tdq_results.setCheckParameters(self.get_TDQConfiguration().getTDQParameters())
-            tdq_results.setGCPProjectId(self.get_GCPConfiguration().getProjectId())
-            tdq_results.setGCPDatasetId(self.get_GCPConfiguration().getDatasetId())
-            tdq_results.setGCPResultsTable(self.get_GCPConfiguration().getTDQResultsTable())
-            tdq_results.setGCPSummaryTable(self.get_GCPConfiguration().getTDQSummaryTable())
-            tdq_results.processCheckResults(df_tdq_results["tdq_results"])
+            if self.get_GCPConfiguration() is not None:
+                tdq_results.setGCPProjectId(self.get_GCPConfiguration().getProjectId())
+                tdq_results.setGCPDatasetId(self.get_GCPConfiguration().getDatasetId())
+                tdq_results.setGCPResultsTable(self.get_GCPConfiguration().getTDQResultsTable())
+                tdq_results.setGCPSummaryTable(self.get_GCPConfiguration().getTDQSummaryTable())
+            with self._measure(phase="result_processing", run_metrics=run_metrics), self._trace(name="process_check_results", result_count=len(df_tdq_results["tdq_results"])):
+                tdq_results.processCheckResults(df_tdq_results["tdq_results"])
+            tdq_results.setRunMetrics(run_metrics=run_metrics)
             tdq_results.setStartTime(start_time=start_time)
             tdq_results.setEndTime(end_time=end_time)
-            self._log_info(f"TDQ checks execution finished in {tdq_results.getDurationSeconds()} seconds!")
-
-            if save_results:
-                self._log_info(f"Saving TDQ checks summary to `{self.get_GCPConfiguration().getProjectId()}`.`{self.get_GCPConfiguration().getDatasetId()}.{self.get_GCPConfiguration().getTDQSummaryTable()}`")
-                summary_save_result = self._save_summary(tdq_result=tdq_results)
-                if summary_save_result["success"]:
-                    self._log_info(f"Saving TDQ check results summary to `{self.get_GCPConfiguration().getProjectId()}`.`{self.get_GCPConfiguration().getDatasetId()}.{self.get_GCPConfiguration().getTDQResultsTable()}`")
-                    check_results_save_result = self._save_tdq_check_results(tdq_result=tdq_results)
-                    if check_results_save_result["success"]:
-                        return {"success": True, "tdq_results": tdq_results}
-                    else:
-                        return check_results_save_result
-                else:
-                    return summary_save_result
+            tdq_results.setRuleSetHash(rule_set_hash=df_tdq_results["rule_set_hash"])
+            tdq_results.setSourceLastModified(source_last_modified=df_tdq_results["source_last_modified"])
+            tdq_results.setSourceFingerprint(source_fingerprint=df_tdq_results["source_fingerprint"])
+            tdq_results.setCacheHit(is_cache_hit=df_tdq_results["is_cache_hit"])
+            tdq_results.setEstimatedBytesProcessed(estimated_bytes_processed=df_tdq_results["estimated_bytes_processed"])
+            tdq_results.setMaximumBytesBilled(maximum_bytes_billed=self.get_TDQConfiguration().getMaximumBytesBilled())
+            if df_tdq_results["sample_percent"] is not None:
+                tdq_results.setSampling(sample_percent=df_tdq_results["sample_percent"], confidence_level=self.get_TDQConfiguration().getConfidenceLevel())
+            self._log_info("TDQ checks execution finished in %s seconds!", tdq_results.getDurationSeconds(),
+                           duration_seconds=tdq_results.getDurationSeconds(), phase_seconds=run_metrics.getPhaseSeconds(),
+                           check_count=tdq_results.getCheckItemCount(), failed_count=tdq_results.getFailedCheckItemCount())
+
+            if save_results and not self._is_offline_execution():
+                # Summary rows are prepared while saving, so the persisted phase timings do not include persistence
+                with self._measure(phase="persistence", run_metrics=run_metrics):
+                    # Partition states are saved right away, the next incremental run depends on them
+                    partition_states_save_result = self._save_tdq_partition_states(df_partition_states=df_tdq_results.get("partition_states", None))
+                    if not partition_states_save_result["success"]:
+                        return partition_states_save_result
+
+                    if self.get_GCPConfiguration().isAsyncPersistence():
+                        # Persistence overlaps with whatever the caller does next. See flush_results()
+                        self._get_background_writer().submit(tdq_result=tdq_results, log_fields=dict(self._log_context.fields))
+                        return {"success": True, "tdq_results": tdq_results, "persistence": "QUEUED"}
+
+                    save_result = self._save_tdq_result(tdq_result=tdq_results)
+                    if not save_result["success"]:
+                        return save_result
+
+            return {"success": True, "tdq_results": tdq_results}
         else:
             return {"success": False, "error": df_tdq_results.get("error", "Unknown error")}
 
-    def test_rule(self, base_query: str, tdq_rule: TDQRuleBase = None, row_limit: int = None):
+    def test_rule(self, base_query: str, tdq_rule: TDQRuleBase = None, row_limit: int = None, sample_percent: float = None):
         import json
 
         # Check if rule is valid. If the rule is invalid return False with `Rule is not valid` error
         if not tdq_rule.isValid():
             return {"success": False, "error": "Rule is not valid. Please check the rule and try again"}
 
-        df_tdq_test_rule_results = self._execute_tdq_checks(base_query=base_query, tdq_rules=[tdq_rule], row_limit=row_limit)
+        with self._use_log_fields(fields={}):
+            df_tdq_test_rule_results = self._execute_tdq_checks(base_query=base_query, tdq_rules=[tdq_rule], row_limit=row_limit, sample_percent=sample_percent)
         if df_tdq_test_rule_results["success"]:
             df_results = df_tdq_test_rule_results["tdq_results"]
             df_results = df_results.drop(columns=['check_uuid', 'rule_uuid'], axis=1)
@@ -441,12 +1795,15 @@ class TDQEngine:
             else:
                 print("Parameters: No parameters specified")
             print(f"Threshold        : {'{0:.0%}'.format(df_results.iloc[0]['threshold'])}")
-            print(f"Passed           : {df_results.iloc[0]['is_passed']}")
+            print(f"Passed           : {df_results.iloc[0]['is_passed'] if df_results.iloc[0]['is_passed'] is not None else 'Inconclusive'}")
 
             # Print statistics if valid
             print(f"Row Count        : {df_results.iloc[0]['row_count']}")
             print(f"Expected Count   : {'{0:.0%}'.format(df_results.iloc[0]['expected_ratio'])}\t{df_results.iloc[0]['expected_count']}")
             print(f"Unexpected Count : {'{0:.0%}'.format(df_results.iloc[0]['unexpected_ratio'])}\t{df_results.iloc[0]['unexpected_count']}")
+            if df_tdq_test_rule_results["sample_percent"] is not None:
+                print(f"Sample           : {df_tdq_test_rule_results['sample_percent']}% of the driving table")
+                print(f"Unexpected Ratio : [{'{0:.2%}'.format(df_results.iloc[0]['unexpected_ratio_lower'])}, {'{0:.2%}'.format(df_results.iloc[0]['unexpected_ratio_upper'])}] ({'{0:.0%}'.format(self._tdq_configuration.getConfidenceLevel())} confidence)")
 
             return {"success": True, "test_results": df_results}
         else:
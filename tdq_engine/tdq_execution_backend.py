@@ -0,0 +1,86 @@
+class TDQExecutionBackend:
+    """
+    Executes TDQ checks for TDQEngine. If no execution backend is defined, TDQEngine runs the checks on BigQuery.
+
+    Query backends (`isQueryBackend() == True`) execute the TDQ check queries generated by TDQEngine (BigQuery
+    Standard SQL). Other backends evaluate the ROW_BASED rules directly on their data (`executeRules`) and return
+    the same counters as the fused TDQ check query.
+
+    Local backends (`isLocal() == True`) can be used without GCP configuration. In that case TDQ tables are not
+    provisioned and TDQ results are not saved.
+    """
+
+    # region Private Methods
+
+    def _group_rules_by_column(self, tdq_rules: list = None) -> dict:
+        rule_indexes_by_column = {}
+        for rule_index, tdq_rule in enumerate(tdq_rules):
+            rule_indexes_by_column.setdefault(tdq_rule.getColumnName(), []).append(rule_index)
+        return rule_indexes_by_column
+
+    def _evaluate_column_rules(self, values: any = None, is_null: any = None, tdq_rules: list = None,
+                               rule_indexes: list = None, unexpected_counts: list = None, expected_counts: list = None):
+        # Evaluates all rules of one column and writes their counts to the given counters (by rule index)
+        for rule_index in rule_indexes:
+            rule_counts = tdq_rules[rule_index].evaluateCounts(values=values, is_null=is_null)
+            unexpected_counts[rule_index] = rule_counts["unexpected_count"]
+            expected_counts[rule_index] = rule_counts["expected_count"]
+
+    def _prepare_counters_results(self, row_count: int = 0, unexpected_counts: list = None, expected_counts: list = None):
+        import pandas as pd
+        # Same shape as the results of the fused TDQ check query
+        return pd.DataFrame({"row_count": [int(row_count)],
+                             "unexpected_counts": [[int(x) for x in unexpected_counts]],
+                             "expected_counts": [[int(x) for x in expected_counts]]})
+
+    # endregion
+
+    # region Public Methods
+
+    def executeQuery(self, query: str = None) -> dict:
+        """
+        Executes a TDQ check query.
+
+                Parameters:
+                        query (str): TDQ check query (BigQuery Standard SQL)
+
+                Returns:
+                        execution_result (dict)
+                            success (bool) : True if the query executed successfully
+                            results (DataFrame) : Query results (only if successful)
+                            error (str) : Error message (only if not successful)
+        """
+        return {"success": False, "error": f"{type(self).__name__} does not execute TDQ check queries"}
+
+    def executeRules(self, tdq_rules: list = None, row_limit: int = None) -> dict:
+        """
+        Evaluates ROW_BASED rules on the data of the backend.
+
+                Parameters:
+                        tdq_rules (list<TDQRuleBase>): Valid ROW_BASED rules
+                        row_limit (int): Optional row limit
+
+                Returns:
+                        execution_result (dict)
+                            success (bool) : True if the rules evaluated successfully
+                            results (DataFrame) : One row with row_count, unexpected_counts and expected_counts (in rule order)
+                            error (str) : Error message (only if not successful)
+        """
+        return {"success": False, "error": f"{type(self).__name__} does not evaluate TDQ rules"}
+
+    def isQueryBackend(self) -> bool:
+        return True
+
+    def isLocal(self) -> bool:
+        return False
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # endregion
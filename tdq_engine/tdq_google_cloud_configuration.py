@@ -1,10 +1,29 @@
+from enum import Enum
+
+
+class PERSISTENCE_MODE(Enum):
+    STREAMING = "STREAMING"
+    LOAD_JOB = "LOAD_JOB"
+    BUFFERED = "BUFFERED"
+
+
 class TDQGoogleCloudConfiguration:
 
-    def __init__(self, project_id: str = "", dataset_id: str = "", tdq_summary_table: str = "", tdq_results_table: str = ""):
+    def __init__(self, project_id: str = "", dataset_id: str = "", tdq_summary_table: str = "", tdq_results_table: str = "",
+                 persistence_mode: PERSISTENCE_MODE = PERSISTENCE_MODE.STREAMING,
+                 persistence_batch_max_rows: int = 10000, persistence_batch_max_seconds: float = 60.0,
+                 async_persistence: bool = False, async_persistence_queue_size: int = 100,
+                 tdq_partition_states_table: str = "tdq_partition_states"):
         self._project_id = project_id
         self._dataset_id = dataset_id
         self._tdq_summary_table = tdq_summary_table
         self._tdq_results_table = tdq_results_table
+        self._persistence_mode = persistence_mode
+        self._persistence_batch_max_rows = persistence_batch_max_rows
+        self._persistence_batch_max_seconds = persistence_batch_max_seconds
+        self._async_persistence = async_persistence
+        self._async_persistence_queue_size = async_persistence_queue_size
+        self._tdq_partition_states_table = tdq_partition_states_table
 
     def setProjectId(self, project_id: str = None):
         self._project_id = project_id
@@ -18,6 +37,38 @@ class TDQGoogleCloudConfiguration:
     def setTDQResultsTable(self, tdq_results_table: str = None):
         self._tdq_results_table = tdq_results_table
 
+    def setPersistenceMode(self, persistence_mode: PERSISTENCE_MODE = PERSISTENCE_MODE.STREAMING):
+        """
+        STREAMING : Summary and results are saved with streaming inserts after every run
+        LOAD_JOB  : Summary and results are saved with batch load jobs after every run
+        BUFFERED  : Summary and results of several runs are buffered and saved with batch load jobs once the buffer
+                    reaches `persistence_batch_max_rows` rows or `persistence_batch_max_seconds` seconds. Rows still
+                    buffered are written by `TDQEngine.flush_results()`, `TDQEngine.close()` or at interpreter exit
+        """
+        self._persistence_mode = persistence_mode
+
+    def setPersistenceBatchMaxRows(self, persistence_batch_max_rows: int = 10000):
+        self._persistence_batch_max_rows = persistence_batch_max_rows
+
+    def setPersistenceBatchMaxSeconds(self, persistence_batch_max_seconds: float = 60.0):
+        self._persistence_batch_max_seconds = persistence_batch_max_seconds
+
+    def setAsyncPersistence(self, async_persistence: bool = True):
+        """
+        If True, TDQ results are handed over to a background writer and saved while the caller continues.
+        Call `TDQEngine.flush_results()` or `TDQEngine.close()` to wait for pending saves.
+        """
+        self._async_persistence = async_persistence
+
+    def setAsyncPersistenceQueueSize(self, async_persistence_queue_size: int = 100):
+        self._async_persistence_queue_size = async_persistence_queue_size
+
+    def setTDQPartitionStatesTable(self, tdq_partition_states_table: str = "tdq_partition_states"):
+        """
+        Table of the per-partition rule counters of incremental TDQ checks (see `TDQConfiguration.setIncrementalColumn`)
+        """
+        self._tdq_partition_states_table = tdq_partition_states_table
+
     def getProjectId(self):
         return self._project_id
 
@@ -29,3 +80,21 @@ class TDQGoogleCloudConfiguration:
 
     def getTDQResultsTable(self):
         return self._tdq_results_table
+
+    def getPersistenceMode(self):
+        return self._persistence_mode
+
+    def getPersistenceBatchMaxRows(self):
+        return self._persistence_batch_max_rows
+
+    def getPersistenceBatchMaxSeconds(self):
+        return self._persistence_batch_max_seconds
+
+    def isAsyncPersistence(self):
+        return self._async_persistence
+
+    def getAsyncPersistenceQueueSize(self):
+        return self._async_persistence_queue_size
+
+    def getTDQPartitionStatesTable(self):
+        return self._tdq_partition_states_table
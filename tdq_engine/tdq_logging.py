@@ -0,0 +1,76 @@
+import json
+import logging
+
+LOGGER_NAME = "tdq_engine"
+
+# Structured fields of a log record are passed as `extra={"tdq": {...}}`
+FIELDS_ATTRIBUTE = "tdq"
+
+
+class TDQJSONFormatter(logging.Formatter):
+    """
+    Formats log records as single line JSON objects: time, level, logger and message, plus the structured fields
+    of the record (e.g. check_uuid, phase, duration_seconds). Exceptions are added as `exception`.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_record = {"time": self.formatTime(record, self.datefmt),
+                      "level": record.levelname,
+                      "logger": record.name,
+                      "message": record.getMessage()}
+        log_record.update(getattr(record, FIELDS_ATTRIBUTE, None) or {})
+        if record.exc_info:
+            log_record["exception"] = self.formatException(record.exc_info)
+        return json.dumps(log_record, default=str)
+
+
+class TDQTextFormatter(logging.Formatter):
+    """
+    Formats log records the way the TDQ engine used to print them (`dd.mm.YYYY HH:MM:SS [LEVEL] : message`),
+    followed by the structured fields of the record as `key=value` pairs.
+    """
+
+    def __init__(self):
+        super().__init__(fmt="%(asctime)s [%(levelname)s] : %(message)s", datefmt="%d.%m.%Y %H:%M:%S")
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        fields = getattr(record, FIELDS_ATTRIBUTE, None) or {}
+        if len(fields) > 0:
+            message = f"{message} | {' '.join(f'{key}={value}' for key, value in fields.items())}"
+        return message
+
+
+def get_logger(name: str = None) -> logging.Logger:
+    """
+    Returns the TDQ engine logger, or a child logger of it (e.g. `get_logger("batch_writer")`).
+    """
+    return logging.getLogger(LOGGER_NAME if name is None else f"{LOGGER_NAME}.{name}")
+
+
+def configure_logging(level: int = logging.INFO, json_format: bool = True, stream: any = None) -> logging.Handler:
+    """
+    Attaches a stream handler to the TDQ engine logger. The TDQ engine does not configure logging by itself, so
+    applications either call this function or configure the `tdq_engine` logger like any other library logger.
+
+            Parameters:
+                    level (int): Log level of the TDQ engine logger. Generated SQL is only logged at logging.DEBUG
+                    json_format (bool): If True, records are logged as JSON lines, otherwise as plain text
+                    stream (any): Output stream of the handler (default: sys.stderr)
+
+            Returns:
+                    handler (logging.Handler) : Attached handler
+    """
+    logger = get_logger()
+    for handler in [handler for handler in logger.handlers if getattr(handler, "_tdq_handler", False)]:
+        logger.removeHandler(handler)
+
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(TDQJSONFormatter() if json_format else TDQTextFormatter())
+    handler._tdq_handler = True
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    return handler
+
+
+get_logger().addHandler(logging.NullHandler())
@@ -0,0 +1,62 @@
+from tdq_engine.tdq_execution_backend import TDQExecutionBackend
+
+
+class TDQPandasBackend(TDQExecutionBackend):
+    """
+    Evaluates ROW_BASED rules in memory on a pandas DataFrame with the vectorized (NumPy) rule evaluators, without
+    pushing the data to BigQuery:
+
+        engine = TDQEngine(dq_check_configuration=tdq_config, execution_backend=TDQPandasBackend(dataframe=df))
+        engine.run_data_quality_checks(base_query=None, tdq_rules=rules)
+
+    The base query is not used. Rules are grouped by column, so every referenced column is converted and its NULL
+    mask computed once for all of its rules.
+    """
+
+    def __init__(self, dataframe: any = None):
+        self._dataframe = dataframe
+
+    # region Private Methods
+
+    def _evaluate_rules(self, dataframe: any = None, tdq_rules: list = None):
+        import pandas as pd
+
+        unexpected_counts = [0] * len(tdq_rules)
+        expected_counts = [0] * len(tdq_rules)
+        for column_name, rule_indexes in self._group_rules_by_column(tdq_rules=tdq_rules).items():
+            if column_name not in dataframe.columns:
+                raise Exception(f"Column `{column_name}` not found in DataFrame")
+            values = dataframe[column_name].to_numpy()
+            self._evaluate_column_rules(values=values, is_null=pd.isna(values), tdq_rules=tdq_rules, rule_indexes=rule_indexes,
+                                        unexpected_counts=unexpected_counts, expected_counts=expected_counts)
+        return unexpected_counts, expected_counts
+
+    # endregion
+
+    # region Public Methods
+
+    def setDataFrame(self, dataframe: any = None):
+        self._dataframe = dataframe
+
+    def getDataFrame(self):
+        return self._dataframe
+
+    def executeRules(self, tdq_rules: list = None, row_limit: int = None) -> dict:
+        try:
+            if self._dataframe is None:
+                raise Exception("DataFrame is not defined. Please set the DataFrame and try again")
+            dataframe = self._dataframe.head(row_limit) if row_limit is not None else self._dataframe
+            unexpected_counts, expected_counts = self._evaluate_rules(dataframe=dataframe, tdq_rules=tdq_rules)
+            return {"success": True, "results": self._prepare_counters_results(row_count=len(dataframe),
+                                                                               unexpected_counts=unexpected_counts,
+                                                                               expected_counts=expected_counts)}
+        except Exception as ex:
+            return {"success": False, "error": str(ex)}
+
+    def isQueryBackend(self) -> bool:
+        return False
+
+    def isLocal(self) -> bool:
+        return True
+
+    # endregion
@@ -0,0 +1,73 @@
+import os
+import hashlib
+import threading
+
+
+class TDQProvisioningCache:
+    """
+    Remembers which TDQ tables have already been ensured, keyed by project/dataset/table/schema hash.
+
+    The in-process registry belongs to the cache instance. Engines created without a provisioning cache share
+    `default_provisioning_cache`, so a table is ensured once per process and schema version, whatever client
+    pool the engine uses. If a cache directory is defined, a marker file is also written per key so later
+    processes skip provisioning until the schema changes.
+    """
+
+    def __init__(self, cache_dir: str = None):
+        self._cache_dir = cache_dir
+        self._provisioned_keys = set()
+        self._lock = threading.Lock()
+
+    def _get_marker_path(self, key: str) -> str:
+        return os.path.join(self._cache_dir, f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.provisioned")
+
+    def setCacheDir(self, cache_dir: str = None):
+        self._cache_dir = cache_dir
+
+    def getCacheDir(self):
+        return self._cache_dir
+
+    def getKey(self, project_id: str = None, dataset_id: str = None, table_name: str = None, schema_hash: str = None) -> str:
+        return f"{project_id}.{dataset_id}.{table_name}:{schema_hash}"
+
+    def isProvisioned(self, key: str) -> bool:
+        with self._lock:
+            if key in self._provisioned_keys:
+                return True
+
+        if (self._cache_dir is not None) and os.path.exists(self._get_marker_path(key=key)):
+            with self._lock:
+                self._provisioned_keys.add(key)
+            return True
+
+        return False
+
+    def markProvisioned(self, key: str):
+        with self._lock:
+            self._provisioned_keys.add(key)
+
+        if self._cache_dir is not None:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            with open(self._get_marker_path(key=key), "w") as marker_file:
+                marker_file.write(key)
+
+    def invalidate(self, key: str = None):
+        """
+        Forgets a provisioned key (or every key if not defined), e.g. after a TDQ table has been dropped.
+        """
+        with self._lock:
+            if key is None:
+                self._provisioned_keys.clear()
+            else:
+                self._provisioned_keys.discard(key)
+
+        if self._cache_dir is not None and os.path.isdir(self._cache_dir):
+            marker_paths = [self._get_marker_path(key=key)] if key is not None else \
+                [os.path.join(self._cache_dir, file_name) for file_name in os.listdir(self._cache_dir) if file_name.endswith(".provisioned")]
+            for marker_path in marker_paths:
+                if os.path.exists(marker_path):
+                    os.remove(marker_path)
+
+
+# Shared by the engines created without a provisioning cache
+default_provisioning_cache = TDQProvisioningCache()
@@ -0,0 +1,172 @@
+class TDQQueryRewriter:
+    """
+    Rewrites the base query of a TDQ check on its syntax tree (sqlglot) instead of with regular expressions.
+
+    The CTE chain of the base query (any number of CTEs, comments and nested WITH clauses are supported) is kept and
+    its final query becomes the base CTE of the TDQ checks, so TDQ check CTEs can be appended to it:
+
+        rewriter = TDQQueryRewriter()
+        rewriter.prepareBaseQuery(query="WITH a AS (...), b AS (...) SELECT * FROM a JOIN b USING (id)",
+                                  base_cte="cte_query_base", row_limit=1000)
+        # WITH a AS (...), b AS (...), cte_query_base AS (SELECT * FROM a JOIN b USING (id) LIMIT 1000)
+
+    Limits, projections and filters are injected into the final query, sampling into the driving table reference.
+    """
+
+    def __init__(self, dialect: str = "bigquery"):
+        self._dialect = dialect
+
+    # region Private Methods
+
+    def _get_with(self, expression: any = None):
+        from sqlglot import exp
+        # The arg key of the WITH clause differs between sqlglot versions
+        return next((value for value in expression.args.values() if isinstance(value, exp.With)), None)
+
+    def _get_driving_tables(self, expression: any = None, ctes: dict = None, visited_ctes: set = None) -> list:
+        # Source tables the rows of the query come from: the first FROM item of each SELECT, through CTEs and
+        # subqueries, and both sides of UNIONs (only the left side of EXCEPT/INTERSECT). Joined tables are not included
+        from sqlglot import exp
+
+        if isinstance(expression, exp.Subquery):
+            return self._get_driving_tables(expression=expression.this, ctes=ctes, visited_ctes=visited_ctes)
+        if isinstance(expression, exp.SetOperation):
+            driving_tables = self._get_driving_tables(expression=expression.this, ctes=ctes, visited_ctes=visited_ctes)
+            if isinstance(expression, exp.Union):
+                driving_tables += self._get_driving_tables(expression=expression.expression, ctes=ctes, visited_ctes=visited_ctes)
+            return driving_tables
+        if not isinstance(expression, exp.Select):
+            return []
+
+        # The arg key of the FROM clause differs between sqlglot versions
+        from_expression = expression.args.get("from_") or expression.args.get("from")
+        source = from_expression.this if from_expression is not None else None
+        if isinstance(source, exp.Table):
+            cte_name = source.name.lower()
+            if (not source.args.get("db")) and (cte_name in ctes):
+                if cte_name in visited_ctes:
+                    # Recursive CTE, its anchor member was already followed
+                    return []
+                return self._get_driving_tables(expression=ctes[cte_name].this, ctes=ctes, visited_ctes=visited_ctes | {cte_name})
+            return [source] if isinstance(source.this, exp.Identifier) else []
+        return self._get_driving_tables(expression=source, ctes=ctes, visited_ctes=visited_ctes)
+
+    def _wrap(self, expression: any = None):
+        from sqlglot import exp
+        return exp.select("*").from_(expression.subquery(alias="tdq_query"))
+
+    # endregion
+
+    # region Public Methods
+
+    def getDialect(self) -> str:
+        return self._dialect
+
+    def parseQuery(self, query: str = None):
+        """
+        Parses a single SELECT query (a trailing semicolon is allowed).
+
+                Parameters:
+                        query (str): SQL query
+
+                Returns:
+                        expression (sqlglot.exp.Query) : Syntax tree of the query
+        """
+        import sqlglot
+        from sqlglot import exp
+
+        try:
+            expressions = [expression for expression in sqlglot.parse(query, read=self._dialect) if expression is not None]
+        except sqlglot.errors.ParseError as ex:
+            raise Exception(f"Invalid SQL script. Please check the SQL script and try again. Error message: {str(ex)}")
+
+        if len(expressions) != 1:
+            raise Exception(f"Invalid SQL script. Base query should be a single SELECT statement, {len(expressions)} statements found")
+        if not isinstance(expressions[0], exp.Query):
+            raise Exception(f"Invalid SQL script. Base query should be a SELECT statement, `{expressions[0].key.upper()}` found")
+        return expressions[0]
+
+    def hasCTE(self, query: str = None) -> bool:
+        """
+        Returns True if the (top level) query starts with a WITH clause.
+        """
+        return self._get_with(expression=self.parseQuery(query=query)) is not None
+
+    def limit(self, expression: any = None, row_limit: int = None):
+        """
+        Limits the rows of the query. An existing LIMIT of the query is kept (the smaller limit applies).
+        """
+        from sqlglot import exp
+
+        if isinstance(expression, exp.Select) and (expression.args.get("limit") is None) and (expression.args.get("offset") is None):
+            return expression.limit(row_limit, copy=False)
+        return self._wrap(expression=expression).limit(row_limit, copy=False)
+
+    def sample(self, expression: any = None, sample_percent: float = None):
+        """
+        Reads the driving table of the query with `TABLESAMPLE SYSTEM (n PERCENT)`: the first table of the FROM
+        clause, followed through CTEs and subqueries (each branch of a UNION has its own driving table). Joined
+        tables are read in full, so every sampled row keeps all its join partners and the query returns a sample
+        of its rows instead of a join of independent samples. Tables that already define a sample are not changed.
+        """
+        from sqlglot import exp
+
+        ctes = {cte.alias_or_name.lower(): cte for cte in expression.find_all(exp.CTE)}
+        for table in self._get_driving_tables(expression=expression, ctes=ctes, visited_ctes=set()):
+            if table.args.get("sample") is None:
+                table.set("sample", exp.TableSample(method=exp.var("SYSTEM"), percent=exp.Literal.number(sample_percent)))
+        return expression
+
+    def project(self, expression: any = None, columns: list = None):
+        """
+        Selects only the given columns of the query.
+        """
+        from sqlglot import exp
+        return exp.select(*columns, dialect=self._dialect).from_(expression.subquery(alias="tdq_query"))
+
+    def filter(self, expression: any = None, condition: str = None):
+        """
+        Filters the rows of the query with the given condition.
+        """
+        return self._wrap(expression=expression).where(condition, dialect=self._dialect, copy=False)
+
+    def prepareBaseQuery(self, query: str = None, base_cte: str = None, row_limit: int = None, columns: list = None,
+                         condition: str = None, sample_percent: float = None) -> str:
+        """
+        Moves the final query of the base query into the base CTE.
+
+                Parameters:
+                        query (str): SQL query of the data source
+                        base_cte (str): Name of the base CTE
+                        row_limit (int): Optional row limit
+                        columns (list<str>): Optional projection of the base query
+                        condition (str): Optional filter condition of the base query
+                        sample_percent (float): Optional TABLESAMPLE percentage of the driving table (see `sample`)
+
+                Returns:
+                        base_query (str) : WITH clause ending with the base CTE
+        """
+        expression = self.parseQuery(query=query)
+        if sample_percent is not None:
+            expression = self.sample(expression=expression, sample_percent=sample_percent)
+
+        # Top level CTEs are kept as they are, nested WITH clauses stay inside their subqueries
+        with_expression = self._get_with(expression=expression)
+        ctes = []
+        is_recursive = False
+        if with_expression is not None:
+            ctes = [cte.sql(dialect=self._dialect) for cte in with_expression.expressions]
+            is_recursive = bool(with_expression.args.get("recursive"))
+            with_expression.pop()
+
+        if condition is not None:
+            expression = self.filter(expression=expression, condition=condition)
+        if columns is not None:
+            expression = self.project(expression=expression, columns=columns)
+        if row_limit is not None:
+            expression = self.limit(expression=expression, row_limit=row_limit)
+
+        ctes.append(f"{base_cte} AS ({expression.sql(dialect=self._dialect)})")
+        return f"WITH {'RECURSIVE ' if is_recursive else ''}{', '.join(ctes)}"
+
+    # endregion
@@ -2,116 +2,162 @@ from rule_definitions.tdq_rule_base import RULE_TYPE
 from datetime import datetime
 import uuid
 
+RESULT_COLUMNS = ["check_uuid",
+                  "rule_uuid",
+                  "type",
+                  "check_type",
+                  "column_name",
+                  "parameters",
+                  "threshold",
+                  "row_count",
+                  "unexpected_count",
+                  "expected_count",
+                  "unexpected_ratio",
+                  "expected_ratio",
+                  "is_passed",
+                  "is_valid",
+                  "unexpected_ratio_lower",
+                  "unexpected_ratio_upper",
+                  "sample_percent",
+                  "confidence_level"]
+COUNT_COLUMNS = ["row_count", "unexpected_count", "expected_count"]
+RATIO_COLUMNS = ["threshold", "unexpected_ratio", "expected_ratio", "unexpected_ratio_lower", "unexpected_ratio_upper"]
+SAMPLING_COLUMNS = ["sample_percent", "confidence_level"]
+FLAG_COLUMNS = ["is_passed", "is_valid"]
+
+
 class TDQResultItem:
+    """
+    Lightweight view on one rule result stored in the columns of a TDQResult.
+    """
 
-    def __init__(self):
-        self._result_row = None
-        self._check_uuid = None
-        self._rule_uuid = None
-        self._rule_type = None
-        self._check_type = None
-        self._column_name = None
-        self._parameters = None
-        self._threshold = None
-        self._row_count = None
-        self._unexpected_count = None
-        self._expected_count = None
-        self._unexpected_ratio = None
-        self._expected_ratio = None
-        self._is_valid = None
-        self._is_passed = None
+    __slots__ = ("_result", "_index")
+
+    def __init__(self, result: any = None, index: int = None):
+        self._result = result
+        self._index = index
+
+    def _get_value(self, column: str, default: any = None):
+        return self._result._get_value(column=column, index=self._index, default=default)
 
     def process_result_row(self, result_row: any = None) -> bool:
-        import json
         import pandas as pd
         if isinstance(result_row, pd.Series):
-            self._result_row = result_row
-            self._check_uuid = result_row.get(key="check_uuid", default=None)
-            self._rule_uuid = result_row.get(key="rule_uuid", default=None)
-            self._rule_type = RULE_TYPE(value=result_row.get(key="type", default=None))
-            self._check_type = result_row.get(key="check_type", default=None)
-            self._column_name = result_row.get(key="column_name", default=None)
-            self._parameters = json.loads(result_row.get(key="parameters", default='{}'))
-            self._threshold = result_row.get(key="threshold", default=0.0)
-            self._row_count = result_row.get(key="row_count", default=0)
-            self._unexpected_count = result_row.get(key="unexpected_count", default=0)
-            self._expected_count = result_row.get(key="expected_count", default=0)
-            self._unexpected_ratio = result_row.get(key="unexpected_ratio", default=0.0)
-            self._expected_ratio = result_row.get(key="expected_ratio", default=0.0)
-            self._is_valid = result_row.get(key="is_valid", default=False)
-            self._is_passed = result_row.get(key="is_passed", default=False)
+            self._result = TDQResult()
+            self._result.processCheckResults(pd.DataFrame([result_row]))
+            self._index = 0
             return True
         else:
             return False
 
     def getCheckUUID(self):
-        return self._check_uuid
+        return self._get_value(column="check_uuid")
 
     def getRuleCheckUUID(self):
-        return self._rule_uuid
+        return self._get_value(column="rule_uuid")
 
     def getRuleType(self) -> RULE_TYPE:
-        return self._rule_type if self._rule_type is not None else None
+        rule_type = self._get_value(column="type")
+        return RULE_TYPE(value=rule_type) if rule_type is not None else None
 
     def getCheckType(self):
-        return self._check_type
+        return self._get_value(column="check_type")
 
     def getColumnName(self):
-        return self._column_name
+        return self._get_value(column="column_name")
 
     def getParameters(self):
-        return self._parameters
+        import json
+        parameters = self._get_value(column="parameters", default='{}')
+        return json.loads(parameters) if isinstance(parameters, str) else parameters
 
     def getThreshold(self):
-        return self._threshold
+        return self._get_value(column="threshold", default=0.0)
 
     def getRowCount(self):
-        return self._row_count
+        return self._get_value(column="row_count", default=0)
 
     def getUnexpectedCount(self):
-        return self._unexpected_count
+        return self._get_value(column="unexpected_count", default=0)
 
     def getExpectedCount(self):
-        return self._expected_count
+        return self._get_value(column="expected_count", default=0)
 
     def getUnexpectedRatio(self):
-        return self._unexpected_ratio
+        return self._get_value(column="unexpected_ratio", default=0.0)
 
     def getExpectedRatio(self):
-        return self._expected_ratio
+        return self._get_value(column="expected_ratio", default=0.0)
+
+    def getUnexpectedRatioLower(self):
+        return self._get_value(column="unexpected_ratio_lower")
+
+    def getUnexpectedRatioUpper(self):
+        return self._get_value(column="unexpected_ratio_upper")
+
+    def getSamplePercent(self):
+        # None if the rule was checked on all rows
+        return self._get_value(column="sample_percent")
+
+    def getConfidenceLevel(self):
+        return self._get_value(column="confidence_level")
 
     def isValid(self):
-        return self._is_valid
+        return self._get_value(column="is_valid", default=False)
 
     def isPassed(self):
-        return self._is_passed
+        # None if a sampled check is inconclusive
+        return self._get_value(column="is_passed", default=False)
 
-    def toDataFrame(self):
+    def isInconclusive(self):
+        return self.isPassed() is None
+
+    def isSampled(self):
+        return self.getSamplePercent() is not None
+
+    def toRecord(self) -> dict:
         import json
+        return {
+            "check_uuid": str(self.getCheckUUID()),
+            "rule_uuid": str(self.getRuleCheckUUID()),
+            "type": self.getRuleType().value if self.getRuleType() is not None else "UNDEFINED",
+            "check_type": self.getCheckType(),
+            "column_name": self.getColumnName(),
+            "parameters": json.dumps(self.getParameters()) if self.getParameters() is not None else json.dumps({}),
+            "threshold": self.getThreshold(),
+            "row_count": self.getRowCount(),
+            "unexpected_count": self.getUnexpectedCount(),
+            "expected_count": self.getExpectedCount(),
+            "unexpected_ratio": self.getUnexpectedRatio(),
+            "expected_ratio": self.getExpectedRatio(),
+            "is_passed": self.isPassed(),
+            "is_valid": self.isValid(),
+            "unexpected_ratio_lower": self.getUnexpectedRatioLower(),
+            "unexpected_ratio_upper": self.getUnexpectedRatioUpper(),
+            "sample_percent": self.getSamplePercent(),
+            "confidence_level": self.getConfidenceLevel()
+        }
+
+    def toDataFrame(self):
         import pandas as pd
-        return pd.DataFrame({
-            "check_uuid": [str(self.getCheckUUID())],
-            "rule_uuid": [str(self.getRuleCheckUUID())],
-            "type": [self.getRuleType().value] if self.getRuleType() is not None else ["UNDEFINED"],
-            "check_type": [self.getCheckType()],
-            "column_name": [self.getColumnName()],
-            "parameters": [json.dumps(self.getParameters())] if self.getParameters() is not None else [json.dumps({})],
-            "threshold": [self.getThreshold()],
-            "row_count": [self.getRowCount()],
-            "unexpected_count": [self.getUnexpectedCount()],
-            "expected_count": [self.getExpectedCount()],
-            "unexpected_ratio": [self.getUnexpectedRatio()],
-            "expected_ratio": [self.getExpectedRatio()],
-            "is_passed": [self.isPassed()],
-            "is_valid": [self.isValid()]
-        })
+        return pd.DataFrame([self.toRecord()])
 
 
 class TDQResult:
 
     def __init__(self):
         self._checkUUID = None
-        self._tdqResultItems = []
+        # Rule results are stored column by column (NumPy arrays). Missing counts/ratios (invalid rules) are
+        # flagged in the `_missing` masks instead of being stored as None
+        self._columns = {}
+        self._missing = {}
+        self._rowCount = 0
+        self._passedIndexes = None
+        self._failedIndexes = None
+        self._validIndexes = None
+        self._invalidIndexes = None
+        self._inconclusiveIndexes = None
+        self._tdqResultItems = None
         self._tdqCheckName = None
         self._tdqCheckDescription = None
         self._tdqCheckParameters = None
@@ -121,6 +167,15 @@ class TDQResult:
         self._gcpSummaryTable = None
         self._tdqStartTime = None
         self._tdqEndTime = None
+        self._ruleSetHash = None
+        self._sourceLastModified = None
+        self._sourceFingerprint = None
+        self._isCacheHit = False
+        self._samplePercent = None
+        self._confidenceLevel = None
+        self._estimatedBytesProcessed = None
+        self._maximumBytesBilled = None
+        self._runMetrics = None
 
     def setCheckUUID(self, check_uuid: uuid.UUID):
         self._checkUUID = check_uuid
@@ -152,15 +207,99 @@ class TDQResult:
     def setEndTime(self, end_time: datetime = None):
         self._tdqEndTime = end_time
 
+    def setRuleSetHash(self, rule_set_hash: str = None):
+        self._ruleSetHash = rule_set_hash
+
+    def setSourceLastModified(self, source_last_modified: dict = None):
+        self._sourceLastModified = source_last_modified
+
+    def setSourceFingerprint(self, source_fingerprint: str = None):
+        self._sourceFingerprint = source_fingerprint
+
+    def setCacheHit(self, is_cache_hit: bool = True):
+        self._isCacheHit = is_cache_hit
+
+    def setEstimatedBytesProcessed(self, estimated_bytes_processed: int = None):
+        self._estimatedBytesProcessed = estimated_bytes_processed
+
+    def setMaximumBytesBilled(self, maximum_bytes_billed: int = None):
+        self._maximumBytesBilled = maximum_bytes_billed
+
+    def setRunMetrics(self, run_metrics: any = None):
+        self._runMetrics = run_metrics
+
+    def setSampling(self, sample_percent: float = None, confidence_level: float = None):
+        self._samplePercent = sample_percent
+        self._confidenceLevel = confidence_level
+
+    def _get_value(self, column: str, index: int, default: any = None):
+        values = self._columns.get(column, None)
+        if values is None:
+            return default
+        missing = self._missing.get(column, None)
+        if (missing is not None) and missing[index]:
+            return None
+        value = values[index]
+        # Return Python scalars instead of NumPy scalars
+        return value.item() if hasattr(value, "item") else value
+
+    def _prepare_columns(self, results_dataframe: any = None):
+        import numpy as np
+        import pandas as pd
+
+        columns = {}
+        missing = {}
+        for column in results_dataframe.columns:
+            series = results_dataframe[column]
+            if column in COUNT_COLUMNS or column in RATIO_COLUMNS or column in SAMPLING_COLUMNS:
+                numeric_values = pd.to_numeric(series, errors="coerce")
+                missing[column] = numeric_values.isna().to_numpy()
+                columns[column] = numeric_values.fillna(0).to_numpy(dtype=np.int64 if column in COUNT_COLUMNS else np.float64)
+            elif column in FLAG_COLUMNS:
+                # Missing flags (e.g. is_passed of inconclusive sampled checks) are kept as None
+                is_missing = series.isna().to_numpy()
+                if is_missing.any():
+                    missing[column] = is_missing
+                columns[column] = series.where(~is_missing, False).to_numpy(dtype=bool)
+            else:
+                columns[column] = series.to_numpy(dtype=object)
+        return columns, missing
+
+    def _prepare_indexes(self):
+        import numpy as np
+        is_passed = self._columns.get("is_passed", np.zeros(self._rowCount, dtype=bool))
+        is_valid = self._columns.get("is_valid", np.zeros(self._rowCount, dtype=bool))
+        is_inconclusive = self._missing.get("is_passed", np.zeros(self._rowCount, dtype=bool))
+        self._passedIndexes = np.flatnonzero(is_passed & ~is_inconclusive)
+        self._failedIndexes = np.flatnonzero(~is_passed & ~is_inconclusive)
+        self._inconclusiveIndexes = np.flatnonzero(is_inconclusive)
+        self._validIndexes = np.flatnonzero(is_valid)
+        self._invalidIndexes = np.flatnonzero(~is_valid)
+        self._tdqResultItems = None
+
+    def _get_items(self, indexes: any = None) -> list:
+        return [TDQResultItem(result=self, index=index) for index in indexes.tolist()] if indexes is not None else []
+
     def processCheckResults(self, results_dataframe: any = None):
+        import numpy as np
         import pandas as pd
         if (results_dataframe is not None) and (isinstance(results_dataframe, pd.DataFrame)):
-            for result_item_index in range(len(results_dataframe)):
-                result_item = TDQResultItem()
-                if result_item.process_result_row(result_row=results_dataframe.iloc[result_item_index]):
-                    self._tdqResultItems.append(result_item)
+            columns, missing = self._prepare_columns(results_dataframe=results_dataframe.reset_index(drop=True))
+            if self._rowCount == 0:
+                self._columns, self._missing = columns, missing
+            else:
+                # Append to the already processed results
+                for column in set(self._columns) | set(columns):
+                    existing_values = self._columns.get(column, np.full(self._rowCount, None, dtype=object))
+                    new_values = columns.get(column, np.full(len(results_dataframe), None, dtype=object))
+                    self._columns[column] = np.concatenate([existing_values, new_values])
+                    if column in self._missing or column in missing:
+                        self._missing[column] = np.concatenate([self._missing.get(column, np.zeros(self._rowCount, dtype=bool)),
+                                                                missing.get(column, np.zeros(len(results_dataframe), dtype=bool))])
+            self._rowCount += len(results_dataframe)
         else:
-            self._tdqResultItems = []
+            self._columns, self._missing, self._rowCount = {}, {}, 0
+        self._prepare_indexes()
 
     def getCheckUUID(self):
         return self._checkUUID
@@ -187,34 +326,49 @@ class TDQResult:
         return self._gcpSummaryTable
 
     def getCheckResultItems(self):
-        return self._tdqResultItems if self._tdqResultItems is not None else []
+        if self._tdqResultItems is None:
+            self._tdqResultItems = [TDQResultItem(result=self, index=index) for index in range(self._rowCount)]
+        return self._tdqResultItems
 
     def getCheckItemCount(self):
-        return len(self.getCheckResultItems())
+        return self._rowCount
 
     def getPassedCheckItemCount(self):
-        return len(self.getPassedCheckItems())
+        return len(self._passedIndexes) if self._passedIndexes is not None else 0
 
     def getFailedCheckItemCount(self):
-        return len(self.getFailedCheckItems())
+        return len(self._failedIndexes) if self._failedIndexes is not None else 0
+
+    def getInconclusiveCheckItemCount(self):
+        return len(self._inconclusiveIndexes) if self._inconclusiveIndexes is not None else 0
 
     def getValidCheckItemCount(self):
-        return len(self.getValidCheckItems())
+        return len(self._validIndexes) if self._validIndexes is not None else 0
 
     def getInvalidCheckItemCount(self):
-        return len(self.getInvalidCheckItems())
+        return len(self._invalidIndexes) if self._invalidIndexes is not None else 0
 
     def getPassedCheckItems(self):
-        return [i for i in self.getCheckResultItems() if i.isPassed()] if self.getCheckResultItems() is not None else []
+        return self._get_items(indexes=self._passedIndexes)
 
     def getFailedCheckItems(self):
-        return [i for i in self.getCheckResultItems() if not i.isPassed()] if self.getCheckResultItems() is not None else []
+        return self._get_items(indexes=self._failedIndexes)
+
+    def getInconclusiveCheckItems(self):
+        return self._get_items(indexes=self._inconclusiveIndexes)
 
     def getValidCheckItems(self):
-        return [i for i in self.getCheckResultItems() if i.isValid()] if self.getCheckResultItems() is not None else []
+        return self._get_items(indexes=self._validIndexes)
 
     def getInvalidCheckItems(self):
-        return [i for i in self.getCheckResultItems() if not i.isValid()] if self.getCheckResultItems() is not None else []
+        return self._get_items(indexes=self._invalidIndexes)
+
+    def getColumn(self, column: str = None):
+        """
+        Returns the NumPy array of a result column (e.g. `unexpected_ratio`) for vectorized processing.
+        Missing values (e.g. counts of invalid rules) are stored as 0.
+        """
+        return self._columns.get(column, None)
 
     def getStartTime(self):
         return self._tdqStartTime
@@ -222,9 +376,42 @@ class TDQResult:
     def getEndTime(self):
         return self._tdqEndTime
 
-    def getDurationSeconds(self) -> int:
+    def getRuleSetHash(self):
+        return self._ruleSetHash
+
+    def getSourceLastModified(self):
+        return self._sourceLastModified
+
+    def getSourceFingerprint(self):
+        return self._sourceFingerprint
+
+    def isCacheHit(self):
+        return self._isCacheHit
+
+    def getSamplePercent(self):
+        return self._samplePercent
+
+    def getRunMetrics(self):
+        """
+        Returns the TDQRunMetrics (phase timings and BigQuery job statistics) of the run.
+        """
+        return self._runMetrics
+
+    def getEstimatedBytesProcessed(self):
+        return self._estimatedBytesProcessed
+
+    def getMaximumBytesBilled(self):
+        return self._maximumBytesBilled
+
+    def getConfidenceLevel(self):
+        return self._confidenceLevel
+
+    def isSampled(self):
+        return self._samplePercent is not None
+
+    def getDurationSeconds(self) -> float:
         if (self.getStartTime() is not None and isinstance(self.getStartTime(), datetime)) and (self.getEndTime() is not None and isinstance(self.getEndTime(), datetime)):
-            return (self.getEndTime() - self.getStartTime()).seconds
+            return (self.getEndTime() - self.getStartTime()).total_seconds()
         else:
             return -1
 
@@ -233,6 +420,7 @@ class TDQResult:
         from datetime import datetime
         import json
 
+        run_metrics = self.getRunMetrics()
         # Prepare results dataframe
         return pd.DataFrame({
             "check_date": [datetime.now().date()],
@@ -244,24 +432,48 @@ class TDQResult:
             "invalid_rule_count": [self.getInvalidCheckItemCount()],
             "success_count": [self.getPassedCheckItemCount()],
             "failed_count": [self.getFailedCheckItemCount()],
+            "inconclusive_count": [self.getInconclusiveCheckItemCount()],
             "execution_start_time": [self.getStartTime()],
             "execution_end_time": [self.getEndTime()],
             "is_success": [True], # TODO: Should handle failed execution
             "execution_parameters": [json.dumps(self.getCheckParameters())],
-            "execution_message": [""] # TODO: Should handle failed execution exception message
+            "execution_message": [""], # TODO: Should handle failed execution exception message
+            "rule_set_hash": [self.getRuleSetHash()],
+            "source_last_modified": [json.dumps(self.getSourceLastModified()) if self.getSourceLastModified() is not None else None],
+            "source_fingerprint": [self.getSourceFingerprint()],
+            "is_cache_hit": [self.isCacheHit()],
+            "sample_percent": [self.getSamplePercent()],
+            "confidence_level": [self.getConfidenceLevel()],
+            "estimated_bytes_processed": [self.getEstimatedBytesProcessed()],
+            "maximum_bytes_billed": [self.getMaximumBytesBilled()],
+            "execution_duration_seconds": [self.getDurationSeconds() if self.getDurationSeconds() >= 0 else None],
+            "phase_seconds": [json.dumps(run_metrics.getPhaseSeconds()) if run_metrics is not None else None],
+            "job_id": [",".join(run_metrics.getJobIds()) if (run_metrics is not None) and (len(run_metrics.getJobIds()) > 0) else None],
+            "total_bytes_processed": [run_metrics.getTotalBytesProcessed() if run_metrics is not None else None],
+            "total_bytes_billed": [run_metrics.getTotalBytesBilled() if run_metrics is not None else None],
+            "slot_millis": [run_metrics.getSlotMillis() if run_metrics is not None else None],
+            "query_cache_hit": [run_metrics.isQueryCacheHit() if run_metrics is not None else None]
         })
 
     def getResultsDataFrame(self):
+        import numpy as np
         import pandas as pd
-        # Create empty DataFrame
-        df_results = pd.DataFrame()
-        # Append results
-        for result_item in self.getCheckResultItems():
-            df_results = pd.concat([df_results, result_item.toDataFrame()], ignore_index=True)
-        # Add check_date field to results DataFrame if not empty
-        if (df_results is not None) and (len(df_results) > 0):
-            df_results["check_date"] = datetime.now().date()
+
+        if self._rowCount == 0:
+            return pd.DataFrame()
+
+        # Create results DataFrame in one shot from the result columns
+        results = {}
+        for column in RESULT_COLUMNS + [c for c in self._columns if c not in RESULT_COLUMNS]:
+            values = self._columns.get(column, np.full(self._rowCount, None, dtype=object))
+            missing = self._missing.get(column, None)
+            if (missing is not None) and missing.any():
+                values = np.where(missing, None, values.astype(object))
+            results[column] = values
+        df_results = pd.DataFrame(results)
+        df_results["check_uuid"] = df_results["check_uuid"].astype(str)
+        df_results["rule_uuid"] = df_results["rule_uuid"].astype(str)
+        # Add check_date field to results DataFrame
+        df_results["check_date"] = datetime.now().date()
         # Return check results DataFrame
         return df_results
-
-
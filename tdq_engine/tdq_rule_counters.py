@@ -0,0 +1,63 @@
+class TDQRuleCounters:
+    """
+    Mergeable TDQ rule counters: the row count plus one unexpected/expected counter per rule (in rule order).
+
+    Counters of data chunks (record batches, files, row groups, ...) are accumulated with `update` and partial
+    counters of the same rules are combined with `merge`, so a rule set can be evaluated chunk by chunk or in
+    parallel without keeping the data in memory.
+    """
+
+    def __init__(self, rule_count: int = 0):
+        import numpy as np
+        self._rowCount = 0
+        self._unexpectedCounts = np.zeros(rule_count, dtype=np.int64)
+        self._expectedCounts = np.zeros(rule_count, dtype=np.int64)
+
+    def update(self, row_count: int = 0, unexpected_counts: list = None, expected_counts: list = None):
+        self._rowCount += row_count
+        self._unexpectedCounts += unexpected_counts
+        self._expectedCounts += expected_counts
+
+    def merge(self, rule_counters: any = None):
+        if len(rule_counters.getUnexpectedCounts()) != len(self._unexpectedCounts):
+            raise Exception("Rule counters of different rule sets can not be merged")
+        self.update(row_count=rule_counters.getRowCount(),
+                    unexpected_counts=rule_counters.getUnexpectedCounts(),
+                    expected_counts=rule_counters.getExpectedCounts())
+        return self
+
+    def getRuleCount(self) -> int:
+        return len(self._unexpectedCounts)
+
+    def getRowCount(self) -> int:
+        return self._rowCount
+
+    def getUnexpectedCounts(self):
+        return self._unexpectedCounts
+
+    def getExpectedCounts(self):
+        return self._expectedCounts
+
+    def toRuleStates(self, tdq_rules: list = None) -> list:
+        """
+        Returns one TDQRuleState per rule (the rules the counters were computed for, in the same order).
+        """
+        if len(tdq_rules) != len(self._unexpectedCounts):
+            raise Exception("Rule count does not match the rule counters")
+        return [tdq_rule.initState().update(row_count=self._rowCount,
+                                            unexpected_count=unexpected_count,
+                                            expected_count=expected_count)
+                for tdq_rule, unexpected_count, expected_count in zip(tdq_rules, self._unexpectedCounts, self._expectedCounts)]
+
+    def toDict(self) -> dict:
+        return {"row_count": int(self._rowCount),
+                "unexpected_counts": [int(x) for x in self._unexpectedCounts],
+                "expected_counts": [int(x) for x in self._expectedCounts]}
+
+    @staticmethod
+    def fromDict(counters: dict = None):
+        rule_counters = TDQRuleCounters(rule_count=len(counters["unexpected_counts"]))
+        rule_counters.update(row_count=counters["row_count"],
+                             unexpected_counts=counters["unexpected_counts"],
+                             expected_counts=counters["expected_counts"])
+        return rule_counters
@@ -0,0 +1,74 @@
+from contextlib import contextmanager
+
+
+class TDQRunMetrics:
+    """
+    Phase timings and BigQuery job statistics of one TDQ run.
+
+    Phases are measured with `measure(phase)` and accumulated, so phases run more than once (e.g. both phases of an
+    adaptive run) report their total time. Job statistics of all TDQ check queries of the run are summed up.
+    """
+
+    PHASES = ["table_prep", "sql_build", "cost_estimation", "query_submit", "query_wait", "fetch", "result_processing", "persistence"]
+
+    def __init__(self):
+        self._phaseSeconds = {}
+        self._jobIds = []
+        self._totalBytesProcessed = None
+        self._totalBytesBilled = None
+        self._slotMillis = None
+        self._queryCacheHit = None
+
+    @contextmanager
+    def measure(self, phase: str = None):
+        import time
+        start_time = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.addPhaseSeconds(phase=phase, seconds=time.perf_counter() - start_time)
+
+    def addPhaseSeconds(self, phase: str = None, seconds: float = 0.0):
+        self._phaseSeconds[phase] = self._phaseSeconds.get(phase, 0.0) + seconds
+
+    def addJobStatistics(self, job_id: str = None, total_bytes_processed: int = None, total_bytes_billed: int = None,
+                         slot_millis: int = None, cache_hit: bool = None):
+        def add(total, value):
+            return total if value is None else (int(value) if total is None else total + int(value))
+
+        if job_id is not None:
+            self._jobIds.append(job_id)
+        self._totalBytesProcessed = add(self._totalBytesProcessed, total_bytes_processed)
+        self._totalBytesBilled = add(self._totalBytesBilled, total_bytes_billed)
+        self._slotMillis = add(self._slotMillis, slot_millis)
+        if cache_hit is not None:
+            # Cache hit only if every TDQ check query of the run was answered from the query cache
+            self._queryCacheHit = bool(cache_hit) if self._queryCacheHit is None else (self._queryCacheHit and bool(cache_hit))
+
+    def getPhaseSeconds(self) -> dict:
+        # Known phases first, in execution order
+        return {phase: round(self._phaseSeconds[phase], 6) for phase in
+                [phase for phase in self.PHASES if phase in self._phaseSeconds] + [phase for phase in self._phaseSeconds if phase not in self.PHASES]}
+
+    def getJobIds(self) -> list:
+        return self._jobIds
+
+    def getTotalBytesProcessed(self):
+        return self._totalBytesProcessed
+
+    def getTotalBytesBilled(self):
+        return self._totalBytesBilled
+
+    def getSlotMillis(self):
+        return self._slotMillis
+
+    def isQueryCacheHit(self):
+        return self._queryCacheHit
+
+    def toDict(self) -> dict:
+        return {"phase_seconds": self.getPhaseSeconds(),
+                "job_ids": self.getJobIds(),
+                "total_bytes_processed": self.getTotalBytesProcessed(),
+                "total_bytes_billed": self.getTotalBytesBilled(),
+                "slot_millis": self.getSlotMillis(),
+                "query_cache_hit": self.isQueryCacheHit()}
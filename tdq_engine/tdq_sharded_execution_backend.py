@@ -0,0 +1,117 @@
+from tdq_engine.tdq_arrow_streaming_backend import TDQArrowStreamingBackend
+
+
+def _evaluate_shard(backend: any = None, path: str = None, row_groups: list = None, tdq_rules: list = None) -> dict:
+    # Runs in a worker process. Only the compact rule counters are sent back to the parent process
+    return backend._evaluate_file(path=path, tdq_rules=tdq_rules, row_groups=row_groups).toDict()
+
+
+class TDQShardedExecutionBackend(TDQArrowStreamingBackend):
+    """
+    Evaluates ROW_BASED rules on local Parquet and Arrow IPC files with a pool of worker processes.
+
+    The input is split into shards (Parquet row group ranges, whole Arrow files), every worker streams its shards
+    like TDQArrowStreamingBackend and returns TDQRuleCounters, and the partial counters are merged in the parent
+    process. The worker pool is created on first use and reused until `close()`:
+
+        with TDQShardedExecutionBackend(paths="/data/impression/ymd=2023-12-01/", max_workers=8) as backend:
+            engine = TDQEngine(dq_check_configuration=tdq_config, execution_backend=backend)
+            engine.run_data_quality_checks(base_query=None, tdq_rules=rules)
+
+    If a row limit is defined (e.g. `TDQEngine.test_rule`), the files are evaluated sequentially in the calling process.
+    """
+
+    def __init__(self, paths: any = None, batch_size: int = 65536, memory_map: bool = True,
+                 max_workers: int = None, shards_per_worker: int = 4):
+        super().__init__(paths=paths, batch_size=batch_size, memory_map=memory_map)
+        self._max_workers = self._get_default_max_workers(max_workers=max_workers)
+        self._shards_per_worker = shards_per_worker
+        self._executor = None
+
+    def __getstate__(self):
+        # The worker pool stays in the parent process
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
+    # region Private Methods
+
+    def _get_default_max_workers(self, max_workers: int = None) -> int:
+        import os
+        return max_workers if max_workers is not None else (os.cpu_count() or 1)
+
+    def _get_executor(self):
+        from concurrent.futures import ProcessPoolExecutor
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+        return self._executor
+
+    def _prepare_shards(self) -> list:
+        """
+        Splits the input files into (path, row_groups) shards. Parquet files are split by row groups, so that there
+        are about `max_workers * shards_per_worker` shards in total; Arrow files are not split.
+        """
+        import math
+        import pyarrow.parquet as pq
+
+        paths = self._resolve_paths()
+        row_group_counts = {path: pq.ParquetFile(path, memory_map=self._memory_map).metadata.num_row_groups
+                            for path in paths if self._is_parquet_file(path)}
+        target_shard_count = self._max_workers * self._shards_per_worker
+        row_groups_per_shard = max(1, math.ceil(sum(row_group_counts.values()) / target_shard_count)) if len(row_group_counts) > 0 else 1
+
+        shards = []
+        for path in paths:
+            if path in row_group_counts:
+                for first_row_group in range(0, row_group_counts[path], row_groups_per_shard):
+                    shards.append((path, list(range(first_row_group, min(first_row_group + row_groups_per_shard, row_group_counts[path])))))
+            else:
+                shards.append((path, None))
+        return shards
+
+    # endregion
+
+    # region Public Methods
+
+    def setMaxWorkers(self, max_workers: int = None):
+        """
+        Sets the number of worker processes. If not defined, one worker per CPU is used.
+        """
+        self.close()
+        self._max_workers = self._get_default_max_workers(max_workers=max_workers)
+
+    def getMaxWorkers(self) -> int:
+        return self._max_workers
+
+    def setShardsPerWorker(self, shards_per_worker: int = 4):
+        self._shards_per_worker = shards_per_worker
+
+    def getShardsPerWorker(self) -> int:
+        return self._shards_per_worker
+
+    def executeRules(self, tdq_rules: list = None, row_limit: int = None) -> dict:
+        from tdq_engine.tdq_rule_counters import TDQRuleCounters
+
+        if row_limit is not None:
+            return super().executeRules(tdq_rules=tdq_rules, row_limit=row_limit)
+
+        try:
+            executor = self._get_executor()
+            futures = [executor.submit(_evaluate_shard, self, path, row_groups, tdq_rules) for path, row_groups in self._prepare_shards()]
+
+            rule_counters = TDQRuleCounters(rule_count=len(tdq_rules))
+            for future in futures:
+                rule_counters.merge(TDQRuleCounters.fromDict(counters=future.result()))
+
+            return {"success": True, "results": self._prepare_counters_results(row_count=rule_counters.getRowCount(),
+                                                                               unexpected_counts=rule_counters.getUnexpectedCounts(),
+                                                                               expected_counts=rule_counters.getExpectedCounts())}
+        except Exception as ex:
+            return {"success": False, "error": str(ex)}
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    # endregion
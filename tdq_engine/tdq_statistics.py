@@ -0,0 +1,53 @@
+def get_z_score(confidence_level: float = 0.95) -> float:
+    """
+    Returns the two-sided standard normal quantile of the confidence level (e.g. 1.96 for 0.95).
+    """
+    from statistics import NormalDist
+
+    if not (0.0 < confidence_level < 1.0):
+        raise Exception(f"Confidence level should be between 0 and 1, {confidence_level} found")
+    return NormalDist().inv_cdf((1.0 + confidence_level) / 2.0)
+
+
+def wilson_interval(counts: any = None, row_counts: any = None, confidence_level: float = 0.95):
+    """
+    Wilson score confidence interval of the ratios `counts / row_counts` (vectorized).
+
+            Parameters:
+                    counts (array-like): Unexpected counts of the sample
+                    row_counts (array-like): Row counts of the sample
+                    confidence_level (float): Confidence level of the interval
+
+            Returns:
+                    lower, upper (ndarray, ndarray) : Interval bounds. The interval is [0, 1] if the sample is empty
+    """
+    import numpy as np
+
+    counts = np.asarray(counts, dtype=np.float64)
+    row_counts = np.asarray(row_counts, dtype=np.float64)
+    z = get_z_score(confidence_level=confidence_level)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = counts / row_counts
+        denominator = 1.0 + z * z / row_counts
+        center = (ratios + z * z / (2.0 * row_counts)) / denominator
+        half_width = z * np.sqrt(ratios * (1.0 - ratios) / row_counts + z * z / (4.0 * row_counts * row_counts)) / denominator
+
+    is_empty = ~(row_counts > 0)
+    lower = np.where(is_empty, 0.0, np.clip(center - half_width, 0.0, 1.0))
+    upper = np.where(is_empty, 1.0, np.clip(center + half_width, 0.0, 1.0))
+    return lower, upper
+
+
+def decide_passed(lower: any = None, upper: any = None, thresholds: any = None) -> list:
+    """
+    Decides pass/fail of sampled checks from the confidence interval of the unexpected ratio: passed if the whole
+    interval is below or at the threshold, failed if it is above the threshold and inconclusive (None) otherwise.
+    """
+    import numpy as np
+
+    lower = np.asarray(lower, dtype=np.float64)
+    upper = np.asarray(upper, dtype=np.float64)
+    thresholds = np.asarray(thresholds, dtype=np.float64)
+    return [True if is_clear_pass else (False if is_clear_fail else None)
+            for is_clear_pass, is_clear_fail in zip((upper <= thresholds).tolist(), (lower > thresholds).tolist())]
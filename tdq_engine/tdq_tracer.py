@@ -0,0 +1,186 @@
+import threading
+from contextlib import contextmanager
+
+
+class TDQTracer:
+    """
+    Receives start/end span callbacks from TDQEngine around its hot paths (base query and check query preparation,
+    BigQuery query execution, result processing and persistence). The base tracer does nothing, subclasses
+    override `startSpan` and `endSpan`:
+
+        class MyTracer(TDQTracer):
+            def startSpan(self, name: str = None, attributes: dict = None):
+                return my_tracing_library.start_span(name, attributes=attributes)
+
+            def endSpan(self, span: any = None, error: Exception = None):
+                span.end()
+
+        engine.set_Tracer(tracer=MyTracer())
+
+    Spans may be started from the background writer thread, tracers should be thread safe.
+    """
+
+    def startSpan(self, name: str = None, attributes: dict = None) -> any:
+        """
+        Called when a span starts.
+
+                Parameters:
+                        name (str): Span name (e.g. `prepare_tdq_base_query`)
+                        attributes (dict): Span attributes (e.g. rule_count, query_size)
+
+                Returns:
+                        span (any) : Span object passed to `endSpan`
+        """
+        return None
+
+    def endSpan(self, span: any = None, error: Exception = None):
+        """
+        Called when a span ends.
+
+                Parameters:
+                        span (any): Span object returned by `startSpan`
+                        error (Exception): Exception raised inside the span, if any
+        """
+        pass
+
+    @contextmanager
+    def span(self, name: str = None, **attributes):
+        span = self.startSpan(name=name, attributes=attributes)
+        try:
+            yield span
+        except Exception as ex:
+            self.endSpan(span=span, error=ex)
+            raise
+        else:
+            self.endSpan(span=span)
+
+
+class TDQInMemoryTracer(TDQTracer):
+    """
+    Keeps the last `max_spans` finished spans in memory, with their parent span, duration and error.
+
+    If `profile` is True, the outermost span of each thread is also captured with cProfile (one profiled span at a
+    time, spans started while another span is profiled are not profiled). `getProfileStats()` returns the
+    aggregated pstats.Stats of all profiled spans.
+    """
+
+    _profiler_lock = threading.Lock()
+
+    def __init__(self, max_spans: int = 10000, profile: bool = False):
+        from collections import deque
+        self._spans = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._span_count = 0
+        self._profile = profile
+        self._profile_stats = None
+
+    # region Private Methods
+
+    def _get_stack(self) -> list:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def _start_profiler(self):
+        import cProfile
+        # cProfile can not profile two spans at the same time (single active profiler on Python 3.12+)
+        if not self._profiler_lock.acquire(blocking=False):
+            return None
+        try:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            return profiler
+        except Exception:
+            self._profiler_lock.release()
+            return None
+
+    def _stop_profiler(self, profiler: any = None):
+        import pstats
+        profiler.disable()
+        self._profiler_lock.release()
+        with self._lock:
+            if self._profile_stats is None:
+                self._profile_stats = pstats.Stats(profiler)
+            else:
+                self._profile_stats.add(profiler)
+
+    # endregion
+
+    # region Public Methods
+
+    def startSpan(self, name: str = None, attributes: dict = None) -> any:
+        import time
+        stack = self._get_stack()
+        with self._lock:
+            self._span_count += 1
+            span_id = self._span_count
+        span = {"span_id": span_id,
+                "parent_span_id": stack[-1]["span_id"] if len(stack) > 0 else None,
+                "name": name,
+                "attributes": dict(attributes) if attributes is not None else {},
+                "thread": threading.current_thread().name,
+                "start_time": time.time(),
+                "duration_seconds": None,
+                "error": None,
+                "_start_counter": time.perf_counter(),
+                "_profiler": self._start_profiler() if self._profile and len(stack) == 0 else None}
+        stack.append(span)
+        return span
+
+    def endSpan(self, span: any = None, error: Exception = None):
+        import time
+        span["duration_seconds"] = time.perf_counter() - span.pop("_start_counter")
+        span["error"] = str(error) if error is not None else None
+        profiler = span.pop("_profiler")
+        if profiler is not None:
+            self._stop_profiler(profiler=profiler)
+
+        stack = self._get_stack()
+        if span in stack:
+            stack.remove(span)
+        with self._lock:
+            self._spans.append(span)
+
+    def getSpans(self, name: str = None) -> list:
+        """
+        Returns the finished spans (oldest first), optionally only the spans with the given name.
+        """
+        with self._lock:
+            return [span for span in self._spans if (name is None) or (span["name"] == name)]
+
+    def getSummary(self) -> dict:
+        """
+        Returns count, total, mean and max duration (seconds) and error count of the finished spans, by span name.
+        """
+        summary = {}
+        for span in self.getSpans():
+            span_summary = summary.setdefault(span["name"], {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0, "error_count": 0})
+            span_summary["count"] += 1
+            span_summary["total_seconds"] += span["duration_seconds"]
+            span_summary["max_seconds"] = max(span_summary["max_seconds"], span["duration_seconds"])
+            span_summary["error_count"] += 1 if span["error"] is not None else 0
+        for span_summary in summary.values():
+            span_summary["mean_seconds"] = span_summary["total_seconds"] / span_summary["count"]
+        return summary
+
+    def getProfileStats(self):
+        """
+        Returns the aggregated pstats.Stats of the profiled spans, None if profiling is disabled or nothing profiled.
+        """
+        with self._lock:
+            return self._profile_stats
+
+    def printProfileStats(self, sort_by: str = "cumulative", limit: int = 30):
+        profile_stats = self.getProfileStats()
+        if profile_stats is None:
+            print("No profiled spans")
+        else:
+            profile_stats.sort_stats(sort_by).print_stats(limit)
+
+    def clear(self):
+        with self._lock:
+            self._spans.clear()
+            self._profile_stats = None
+
+    # endregion
@@ -0,0 +1,110 @@
+import json
+
+import pandas as pd
+import pytest
+
+from tdq_engine.tdq_bigquery_client_pool import TDQBigQueryClientPool
+from tdq_engine.tdq_configuration import TDQConfiguration
+from tdq_engine.tdq_duckdb_backend import TDQDuckDBBackend
+from tdq_engine.tdq_engine import TDQEngine
+from tdq_engine.tdq_google_cloud_configuration import TDQGoogleCloudConfiguration
+from tdq_engine.tdq_provisioning_cache import default_provisioning_cache
+from benchmarks.tdq_fake_bigquery_client import TDQFakeBigQueryClient
+
+SOURCE_TABLE = "source_project.source_dataset.source_table"
+BASE_QUERY = f"SELECT * FROM `{SOURCE_TABLE}`"
+
+
+class TDQFakeBigQuery:
+    """
+    Fake BigQuery project for engine tests. Queries run on DuckDB against the source DataFrames and the rows saved
+    to the TDQ tables, which are shared by every fake client of the project. `source_tables` (table ID ->
+    bigquery.Table) are returned by `get_table`, e.g. with their last modified time.
+    """
+
+    def __init__(self, sources: dict = None, dry_run_handler: callable = None):
+        self.sources = dict(sources or {})
+        self.source_tables = {}
+        self.tables = {}
+        self.rows = {}
+        self.clients = []
+        self._dry_run_handler = dry_run_handler
+
+    def _get_table_dataframes(self) -> dict:
+        tables = {}
+        for table_id, table in self.tables.items():
+            if table_id in self.source_tables:
+                continue
+            columns = [field.name for field in table.schema]
+            # JSON values (parsed by load jobs) are read back as JSON strings, like BigQuery returns them
+            rows = [{column: json.dumps(value) if isinstance(value, (dict, list)) else value for column, value in row.items()}
+                    for row in self.rows.get(table_id, [])]
+            tables[table_id] = pd.DataFrame(rows, columns=columns)
+        return tables
+
+    def query_handler(self, query: str = None):
+        backend = TDQDuckDBBackend(sources={**self._get_table_dataframes(), **self.sources})
+        try:
+            execution_results = backend.executeQuery(query=query)
+        finally:
+            backend.close()
+        if not execution_results["success"]:
+            raise Exception(execution_results["error"])
+        return execution_results["results"]
+
+    def dry_run_handler(self, query: str = None):
+        if self._dry_run_handler is not None:
+            return self._dry_run_handler(query)
+        return {"total_bytes_processed": 0}
+
+    def create_client(self, project_id: str = None) -> TDQFakeBigQueryClient:
+        self.tables.update(self.source_tables)
+        client = TDQFakeBigQueryClient(project=project_id, query_handler=self.query_handler, dry_run_handler=self.dry_run_handler,
+                                       tables=self.tables, rows=self.rows)
+        self.clients.append(client)
+        return client
+
+    def create_client_pool(self) -> TDQBigQueryClientPool:
+        return TDQBigQueryClientPool(client_factory=self.create_client)
+
+    def getRows(self, table_name: str = None) -> list:
+        return [row for table_id, rows in self.rows.items() if table_id.endswith(f".{table_name}") for row in rows]
+
+
+@pytest.fixture(autouse=True)
+def provisioned_tables():
+    # Every test has its own fake BigQuery project, the TDQ tables ensured by earlier tests do not exist in it
+    default_provisioning_cache.invalidate()
+    yield
+    default_provisioning_cache.invalidate()
+
+
+@pytest.fixture
+def source_data():
+    return pd.DataFrame({"a": [1, None, 3, 4], "b": [1, 2, 3, 5], "c": ["x", "y", "z", "x"]})
+
+
+@pytest.fixture
+def fake_bigquery(source_data):
+    return TDQFakeBigQuery(sources={SOURCE_TABLE: source_data})
+
+
+@pytest.fixture
+def gcp_configuration():
+    return TDQGoogleCloudConfiguration(project_id="tdq_project",
+                                       dataset_id="tdq_dataset",
+                                       tdq_summary_table="tdq_summary",
+                                       tdq_results_table="tdq_results")
+
+
+@pytest.fixture
+def tdq_configuration():
+    return TDQConfiguration(tdq_check_name="test", tdq_check_description="Test", tdq_check_parameters={})
+
+
+@pytest.fixture
+def fake_engine(fake_bigquery, tdq_configuration, gcp_configuration):
+    engine = TDQEngine(dq_check_configuration=tdq_configuration, gcp_configuration=gcp_configuration,
+                       client_pool=fake_bigquery.create_client_pool())
+    yield engine
+    engine.close()
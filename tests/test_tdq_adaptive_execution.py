@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from rule_definitions import rule_definitions
+from tdq_engine.tdq_configuration import BUDGET_ACTION, TDQConfiguration
+from tdq_engine.tdq_duckdb_backend import TDQDuckDBBackend
+from tdq_engine.tdq_engine import TDQEngine
+from tests.conftest import BASE_QUERY, SOURCE_TABLE, TDQFakeBigQuery
+
+ROW_COUNT = 100000
+
+
+@pytest.fixture
+def source_data():
+    random = np.random.default_rng(seed=1)
+    return pd.DataFrame({"a": np.where(random.random(ROW_COUNT) < 0.2, None, 1.0), "b": random.integers(0, 100, ROW_COUNT)})
+
+
+def _prepare_rules() -> list:
+    return [rule_definitions.check_NULL(column_name="a", threshold=0.5),
+            rule_definitions.check_NULL(column_name="a", threshold=0.21),
+            rule_definitions.check_BETWEEN(column_name="b", min_value=0, max_value=100, threshold=0.05)]
+
+
+def test_results_carry_the_sampling_of_their_phase(source_data):
+    engine = TDQEngine(dq_check_configuration=TDQConfiguration(tdq_check_name="adaptive", adaptive_sample_percent=10, adaptive_margin=0.02),
+                       execution_backend=TDQDuckDBBackend(sources={SOURCE_TABLE: source_data}))
+    run_result = engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules())
+    assert run_result["success"], run_result.get("error")
+
+    result_items = run_result["tdq_results"].getCheckResultItems()
+    # Clear passes are decided on the sample, the rule close to its threshold is re-checked on all rows
+    assert [result_item.getSamplePercent() for result_item in result_items] == [10.0, None, 10.0]
+    assert [result_item.getConfidenceLevel() for result_item in result_items] == [0.95, None, 0.95]
+    assert [result_item.isSampled() for result_item in result_items] == [True, False, True]
+    assert result_items[1].getRowCount() == ROW_COUNT
+    assert result_items[0].getRowCount() < ROW_COUNT
+
+
+def test_full_recheck_does_not_use_the_cache_or_the_budget_sample(source_data, tdq_configuration, gcp_configuration):
+    # Only the sampled query fits the bytes budget
+    fake_bigquery = TDQFakeBigQuery(sources={SOURCE_TABLE: source_data},
+                                    dry_run_handler=lambda query: {"total_bytes_processed": 100 if "TABLESAMPLE" in query else 10000})
+    tdq_configuration.setResultCache(result_cache=True)
+    tdq_configuration.setAdaptiveExecution(sample_percent=10, margin=0.02)
+    tdq_configuration.setMaximumBytesBilled(maximum_bytes_billed=1000, budget_action=BUDGET_ACTION.SAMPLE)
+    engine = TDQEngine(dq_check_configuration=tdq_configuration, gcp_configuration=gcp_configuration, client_pool=fake_bigquery.create_client_pool())
+    try:
+        run_result = engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules())
+    finally:
+        engine.close()
+
+    assert not run_result["success"]
+    assert "refused" in run_result["error"]
+    dry_run_queries = [query for client in fake_bigquery.clients for query in client.dry_run_queries]
+    # No source freshness lookup of the result cache, and no second sampled query
+    assert BASE_QUERY not in dry_run_queries
+    assert sum("TABLESAMPLE" in query for query in dry_run_queries) == 1
@@ -0,0 +1,74 @@
+import pyarrow as pa
+import pytest
+
+from rule_definitions import rule_definitions
+from tdq_engine.tdq_arrow_streaming_backend import TDQArrowStreamingBackend
+
+TABLE = pa.table({"a": pa.array([1.0, None, 3.0, None, 5.0, 6.0, None]), "c": pa.array(["x", "y", None, "x", "z", "x", "y"])})
+
+
+def _write_arrow_file(path: str = None, table: pa.Table = None):
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=2)
+
+
+def _write_arrow_stream(path: str = None, table: pa.Table = None):
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=2)
+
+
+def _get_counts(execution_results: dict = None) -> list:
+    assert execution_results["success"], execution_results.get("error")
+    results = execution_results["results"].iloc[0]
+    return [int(results["row_count"]), [int(count) for count in results["unexpected_counts"]], [int(count) for count in results["expected_counts"]]]
+
+
+def _prepare_rules() -> list:
+    return [rule_definitions.check_NULL(column_name="a"), rule_definitions.check_IN(column_name="c", values=["x"])]
+
+
+@pytest.mark.parametrize("memory_map", [True, False])
+@pytest.mark.parametrize("write_arrow", [_write_arrow_file, _write_arrow_stream])
+def test_arrow_ipc_file_and_stream_formats(tmp_path, write_arrow, memory_map):
+    path = str(tmp_path / "data.arrow")
+    write_arrow(path=path, table=TABLE)
+    backend = TDQArrowStreamingBackend(paths=path, batch_size=3, memory_map=memory_map)
+
+    assert _get_counts(backend.executeRules(tdq_rules=_prepare_rules())) == [7, [3, 3], [4, 3]]
+
+
+def test_row_limit_across_file_boundaries(tmp_path):
+    _write_arrow_file(path=str(tmp_path / "first.arrow"), table=TABLE.slice(0, 3))
+    _write_arrow_stream(path=str(tmp_path / "second.arrows"), table=TABLE.slice(3))
+    TABLE.slice(0, 3).to_pandas().to_parquet(tmp_path / "third.parquet")
+    backend = TDQArrowStreamingBackend(paths=str(tmp_path), batch_size=2)
+
+    # 3 rows of the first file, 2 rows of the second file, the third file is not read
+    assert _get_counts(backend.executeRules(tdq_rules=_prepare_rules(), row_limit=5)) == [5, [2, 2], [3, 2]]
+    assert _get_counts(backend.executeRules(tdq_rules=_prepare_rules(), row_limit=3)) == [3, [1, 1], [2, 1]]
+    assert _get_counts(backend.executeRules(tdq_rules=_prepare_rules(), row_limit=100)) == [10, [4, 4], [6, 4]]
+
+
+def test_unsupported_extension_is_not_successful(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,c\n1,x\n")
+    execution_results = TDQArrowStreamingBackend(paths=str(path)).executeRules(tdq_rules=_prepare_rules())
+
+    assert not execution_results["success"]
+    assert "Unsupported input file" in execution_results["error"]
+
+
+def test_missing_column_is_not_successful(tmp_path):
+    path = str(tmp_path / "data.arrow")
+    _write_arrow_file(path=path, table=TABLE.drop(["c"]))
+    execution_results = TDQArrowStreamingBackend(paths=path).executeRules(tdq_rules=_prepare_rules())
+
+    assert not execution_results["success"]
+    assert "`c` not found" in execution_results["error"]
+
+
+def test_no_input_files_is_not_successful(tmp_path):
+    execution_results = TDQArrowStreamingBackend(paths=str(tmp_path / "*.parquet")).executeRules(tdq_rules=_prepare_rules())
+
+    assert not execution_results["success"]
+    assert "No input files found" in execution_results["error"]
@@ -0,0 +1,62 @@
+import logging
+import threading
+
+from rule_definitions import rule_definitions
+from tdq_engine.tdq_logging import get_logger, FIELDS_ATTRIBUTE
+from tests.conftest import BASE_QUERY
+
+
+class _RecordingHandler(logging.Handler):
+
+    def __init__(self):
+        super().__init__(level=logging.INFO)
+        self.records = []
+
+    def emit(self, record: logging.LogRecord):
+        self.records.append(record)
+
+
+def test_queued_results_are_logged_with_their_own_check_uuid(fake_engine, fake_bigquery, gcp_configuration):
+    gcp_configuration.setAsyncPersistence(async_persistence=True)
+    tdq_rules = [rule_definitions.check_NULL(column_name="a")]
+    # Tables are provisioned before saving is blocked
+    assert fake_engine._prepare_tdq_tables()["success"]
+
+    # Saves are held back until both checks have finished (and the check log fields have been reset)
+    save_allowed = threading.Event()
+    client = fake_bigquery.clients[0]
+    insert_rows_from_dataframe = client.insert_rows_from_dataframe
+    client.insert_rows_from_dataframe = lambda table=None, dataframe=None: save_allowed.wait() and insert_rows_from_dataframe(table=table, dataframe=dataframe)
+
+    handler = _RecordingHandler()
+    logger = get_logger()
+    logger.addHandler(handler)
+    previous_level = logger.level
+    logger.setLevel(logging.INFO)
+    try:
+        check_uuids = [fake_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=tdq_rules)["tdq_results"].getCheckUUID() for _ in range(2)]
+        save_allowed.set()
+        assert fake_engine.flush_results()["success"]
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(previous_level)
+
+    saved_records = [record for record in handler.records if record.getMessage().startswith("TDQ summary results saved")]
+    assert [getattr(record, FIELDS_ATTRIBUTE).get("check_uuid") for record in saved_records] == [str(check_uuid) for check_uuid in check_uuids]
+
+
+def test_batch_writer_is_created_once_across_threads(fake_engine):
+    barrier = threading.Barrier(8)
+    batch_writers = []
+
+    def get_batch_writer():
+        barrier.wait()
+        batch_writers.append(fake_engine._get_batch_writer())
+
+    threads = [threading.Thread(target=get_batch_writer) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(batch_writer) for batch_writer in batch_writers}) == 1
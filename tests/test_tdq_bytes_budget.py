@@ -0,0 +1,81 @@
+import pytest
+
+from rule_definitions import rule_definitions
+from tdq_engine.tdq_configuration import BUDGET_ACTION
+from tests.conftest import BASE_QUERY, SOURCE_TABLE, TDQFakeBigQuery
+
+
+def _prepare_rules() -> list:
+    return [rule_definitions.check_NULL(column_name="a"), rule_definitions.check_BETWEEN(column_name="b", min_value=1, max_value=5)]
+
+
+def _get_dry_run_queries(fake_bigquery) -> list:
+    return [query for client in fake_bigquery.clients for query in client.dry_run_queries]
+
+
+def _fail_dry_run(query: str = None):
+    raise Exception("Access Denied: dry run")
+
+
+@pytest.fixture
+def fake_bigquery(source_data, request):
+    return TDQFakeBigQuery(sources={SOURCE_TABLE: source_data}, dry_run_handler=getattr(request, "param", None))
+
+
+def test_no_dry_run_without_a_budget(fake_engine, fake_bigquery):
+    run_result = fake_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules())
+
+    assert run_result["success"]
+    assert _get_dry_run_queries(fake_bigquery) == []
+    assert run_result["tdq_results"].getEstimatedBytesProcessed() is None
+
+
+@pytest.mark.parametrize("fake_bigquery", [_fail_dry_run], indirect=True)
+def test_failed_estimate_is_unknown(fake_engine, fake_bigquery, tdq_configuration):
+    tdq_configuration.setMaximumBytesBilled(maximum_bytes_billed=1000)
+    run_result = fake_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules())
+
+    assert run_result["success"], run_result.get("error")
+    assert len(_get_dry_run_queries(fake_bigquery)) == 1
+    assert run_result["tdq_results"].getEstimatedBytesProcessed() is None
+
+
+@pytest.mark.parametrize("fake_bigquery", [lambda query: {"total_bytes_processed": 10000}], indirect=True)
+@pytest.mark.parametrize("is_incremental", [False, True])
+def test_refused_runs_are_logged(fake_engine, fake_bigquery, tdq_configuration, is_incremental, caplog):
+    tdq_configuration.setMaximumBytesBilled(maximum_bytes_billed=1000, budget_action=BUDGET_ACTION.REFUSE)
+    if is_incremental:
+        tdq_configuration.setIncrementalColumn(incremental_column="b", incremental_column_type="INT64")
+    run_result = fake_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules())
+
+    assert not run_result["success"]
+    assert "refused" in run_result["error"]
+    assert any(("refused" in record.getMessage()) and (record.levelname == "ERROR") for record in caplog.records)
+
+
+def _estimate_sampled_query_within_budget(query: str = None) -> dict:
+    return {"total_bytes_processed": 100 if "TABLESAMPLE" in query else 10000}
+
+
+@pytest.mark.parametrize("fake_bigquery", [_estimate_sampled_query_within_budget], indirect=True)
+def test_budget_sample_replaces_a_full_scan_over_the_budget(fake_engine, fake_bigquery, tdq_configuration):
+    tdq_configuration.setMaximumBytesBilled(maximum_bytes_billed=1000, budget_action=BUDGET_ACTION.SAMPLE)
+    run_result = fake_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules())
+
+    assert run_result["success"], run_result.get("error")
+    assert run_result["tdq_results"].getSamplePercent() == 9.0
+    assert run_result["tdq_results"].getEstimatedBytesProcessed() == 100
+    assert len(_get_dry_run_queries(fake_bigquery)) == 2
+    assert "TABLESAMPLE SYSTEM (9.0 PERCENT)" in fake_bigquery.clients[0].queries[-1]
+
+
+@pytest.mark.parametrize("fake_bigquery", [_estimate_sampled_query_within_budget], indirect=True)
+def test_incremental_checks_are_refused_instead_of_sampled(fake_engine, fake_bigquery, tdq_configuration):
+    # Partition states must cover all rows of a partition
+    tdq_configuration.setMaximumBytesBilled(maximum_bytes_billed=1000, budget_action=BUDGET_ACTION.SAMPLE)
+    tdq_configuration.setIncrementalColumn(incremental_column="b", incremental_column_type="INT64")
+    run_result = fake_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules())
+
+    assert not run_result["success"]
+    assert "refused" in run_result["error"]
+    assert len(_get_dry_run_queries(fake_bigquery)) == 1
@@ -0,0 +1,128 @@
+import pandas as pd
+import pytest
+
+from rule_definitions import rule_definitions
+from rule_definitions.tdq_rule_base import RULE_TYPE
+from tdq_engine.tdq_configuration import TDQConfiguration
+from tdq_engine.tdq_duckdb_backend import TDQDuckDBBackend
+from tdq_engine.tdq_engine import TDQEngine
+
+
+class check_TABLE_NULL(rule_definitions.check_NULL):
+    # Custom TABLE_BASED rule, forces the UNION ALL plan
+
+    def __init__(self, column_name: str = None, threshold: float = 0.0):
+        super().__init__(column_name=column_name, threshold=threshold)
+        self._ruleType = RULE_TYPE.TABLE_BASED
+
+
+def _prepare_engine() -> TDQEngine:
+    data = pd.DataFrame({"a": [1, None, 3, 4], "b": [1, 2, 3, 5], "s": ["x", "", None, " "]})
+    return TDQEngine(dq_check_configuration=TDQConfiguration(tdq_check_name="test", tdq_check_description="Test"),
+                     execution_backend=TDQDuckDBBackend(sources={"source": data}))
+
+
+def _get_counts(run_result: dict) -> list:
+    df_results = run_result["tdq_results"].getResultsDataFrame()
+    return df_results[["check_type", "column_name", "row_count", "unexpected_count", "expected_count"]].values.tolist()
+
+
+def test_no_valid_rules_skips_the_check_query():
+    engine = _prepare_engine()
+    run_result = engine.run_data_quality_checks(base_query="SELECT * FROM source", tdq_rules=[rule_definitions.check_NULL(column_name=None)])
+
+    assert run_result["success"]
+    df_results = run_result["tdq_results"].getResultsDataFrame()
+    assert len(df_results) == 1
+    assert not df_results.iloc[0]["is_valid"]
+
+
+def test_no_rules_are_rejected_by_the_query_builder():
+    engine = _prepare_engine()
+    base_query_config = engine._prepare_tdq_base_query(query="SELECT * FROM source")
+    with pytest.raises(Exception):
+        engine._prepare_tdq_fused_check_query_config(base_query_config=base_query_config, tdq_rules=[])
+    with pytest.raises(Exception):
+        engine._prepare_tdq_check_query_config(base_query_config=base_query_config, tdq_rules=[])
+
+
+def test_table_based_rules_fall_back_to_union_all():
+    engine = _prepare_engine()
+    base_query_config = engine._prepare_tdq_base_query(query="SELECT * FROM source")
+    tdq_query_config = engine._prepare_tdq_check_query_config(base_query_config=base_query_config,
+                                                              tdq_rules=[check_TABLE_NULL(column_name="a"), rule_definitions.check_NULL(column_name="a")])
+    assert not tdq_query_config["is_fused"]
+    assert " UNION ALL " in tdq_query_config["tdq_check_query"]
+
+    fused_result = _prepare_engine().run_data_quality_checks(base_query="SELECT * FROM source", tdq_rules=[rule_definitions.check_NULL(column_name="a"),
+                                                                                                          rule_definitions.check_NULL_OR_EMPTY(column_name="s", is_trimmed=True)])
+    union_all_result = _prepare_engine().run_data_quality_checks(base_query="SELECT * FROM source", tdq_rules=[check_TABLE_NULL(column_name="a"),
+                                                                                                              rule_definitions.check_NULL_OR_EMPTY(column_name="s", is_trimmed=True)])
+    assert fused_result["success"] and union_all_result["success"]
+    assert [counts[1:] for counts in _get_counts(fused_result)] == [counts[1:] for counts in _get_counts(union_all_result)]
+
+
+def test_null_or_empty_expected_ratio_matches_expected_count():
+    run_result = _prepare_engine().run_data_quality_checks(base_query="SELECT * FROM source",
+                                                           tdq_rules=[rule_definitions.check_NULL_OR_EMPTY(column_name="s", is_trimmed=True)])
+    df_results = run_result["tdq_results"].getResultsDataFrame()
+    # NULL, '' and ' ' (trimmed) are expected
+    assert df_results.iloc[0]["expected_count"] == 3
+    assert df_results.iloc[0]["expected_ratio"] == 0.75
+
+
+def test_projection_is_only_added_on_local_execution_backends():
+    tdq_rules = [rule_definitions.check_NULL(column_name="a")]
+    _, local_query_config = _prepare_engine()._prepare_tdq_query_configs(base_query="SELECT * FROM source", tdq_rules=tdq_rules)
+    assert "AS (SELECT a FROM (SELECT * FROM source) AS tdq_query)" in local_query_config["tdq_check_query"]
+
+    bigquery_engine = TDQEngine(dq_check_configuration=TDQConfiguration(tdq_check_name="test", tdq_check_description="Test"))
+    _, bigquery_query_config = bigquery_engine._prepare_tdq_query_configs(base_query="SELECT * FROM source", tdq_rules=tdq_rules)
+    assert "AS (SELECT * FROM source)" in bigquery_query_config["tdq_check_query"]
+
+    # TABLE_BASED rules read the whole base CTE
+    _, union_all_query_config = _prepare_engine()._prepare_tdq_query_configs(base_query="SELECT * FROM source", tdq_rules=[check_TABLE_NULL(column_name="a")])
+    assert "AS (SELECT * FROM source)" in union_all_query_config["tdq_check_query"]
+
+
+@pytest.mark.filterwarnings("error::FutureWarning")
+def test_invalid_rule_results_are_concatenated_without_a_dtype_change():
+    engine = _prepare_engine()
+    execution_results = engine._execute_tdq_checks(base_query="SELECT * FROM source",
+                                                   tdq_rules=[rule_definitions.check_NULL(column_name="a"), rule_definitions.check_NULL(column_name=None)])
+
+    assert execution_results["success"], execution_results.get("error")
+    df_results = execution_results["tdq_results"]
+    assert df_results["unexpected_ratio"].dtype == "float64"
+    assert df_results["is_valid"].tolist() == [True, False]
+    assert pd.isna(df_results["unexpected_ratio"].iloc[1])
+
+
+def _prepare_deterministic_query_config(tdq_rules: list = None) -> dict:
+    # A new engine per query, nothing is shared between the two runs but the rule definitions
+    engine = TDQEngine(dq_check_configuration=TDQConfiguration(tdq_check_name="test", deterministic_sql=True),
+                       execution_backend=TDQDuckDBBackend(sources={"source": pd.DataFrame({"a": [1, None], "b": [1, 2]})}))
+    _, tdq_query_config = engine._prepare_tdq_query_configs(base_query="SELECT * FROM source", tdq_rules=tdq_rules)
+    return tdq_query_config
+
+
+@pytest.mark.parametrize("prepare_rules", [lambda: [rule_definitions.check_NULL(column_name="a"), rule_definitions.check_BETWEEN(column_name="b", min_value=1, max_value=4)],
+                                           lambda: [check_TABLE_NULL(column_name="a"), rule_definitions.check_BETWEEN(column_name="b", min_value=1, max_value=4)]])
+def test_deterministic_sql_is_identical_across_engines(prepare_rules):
+    tdq_query_config = _prepare_deterministic_query_config(tdq_rules=prepare_rules())
+    other_tdq_query_config = _prepare_deterministic_query_config(tdq_rules=prepare_rules())
+
+    assert tdq_query_config["tdq_check_query"] == other_tdq_query_config["tdq_check_query"]
+    assert list(tdq_query_config.get("rule_uuids", {})) == list(other_tdq_query_config.get("rule_uuids", {}))
+
+
+def test_deterministic_rule_uuids_change_with_the_rule_parameters():
+    tdq_query_config = _prepare_deterministic_query_config(tdq_rules=[check_TABLE_NULL(column_name="a"),
+                                                                      rule_definitions.check_BETWEEN(column_name="b", min_value=1, max_value=4)])
+    other_tdq_query_config = _prepare_deterministic_query_config(tdq_rules=[check_TABLE_NULL(column_name="a"),
+                                                                            rule_definitions.check_BETWEEN(column_name="b", min_value=1, max_value=5)])
+
+    rule_uuids, other_rule_uuids = list(tdq_query_config["rule_uuids"]), list(other_tdq_query_config["rule_uuids"])
+    assert rule_uuids[0] == other_rule_uuids[0]
+    assert rule_uuids[1] != other_rule_uuids[1]
+    assert tdq_query_config["tdq_check_query"] != other_tdq_query_config["tdq_check_query"]
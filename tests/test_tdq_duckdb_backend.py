@@ -0,0 +1,54 @@
+import pandas as pd
+import pytest
+
+from tdq_engine.tdq_duckdb_backend import TDQDuckDBBackend
+
+
+@pytest.fixture
+def backend():
+    source = pd.DataFrame({"a": [1, None, 3, 4], "b": [2, 0, 0, 4], "c": ["x1", "y", "z22", "x"],
+                           "countif": [1, 2, 3, 4], "safe_divide": [5, 6, 7, 8]})
+    backend = TDQDuckDBBackend(sources={"project.dataset.source": source})
+    yield backend
+    backend.close()
+
+
+def _get_values(backend: TDQDuckDBBackend = None, query: str = None) -> list:
+    execution_results = backend.executeQuery(query=query)
+    assert execution_results["success"], execution_results.get("error")
+    return execution_results["results"].astype(object).where(execution_results["results"].notna(), None).values.tolist()
+
+
+def test_countif(backend):
+    results = backend.executeQuery(query="SELECT COUNTIF(a IS NULL) AS null_count, [COUNTIF(b = 0), COUNTIF(b > 0)] AS counts FROM `project.dataset.source`")["results"]
+    assert results["null_count"].tolist() == [1]
+    assert list(results["counts"][0]) == [2, 2]
+
+
+def test_countif_of_no_rows_is_zero(backend):
+    assert _get_values(backend, "SELECT COUNT(1) AS row_count, COUNTIF(a IS NULL) AS null_count FROM `project.dataset.source` WHERE b > 10") == [[0, 0]]
+
+
+def test_safe_divide_by_zero(backend):
+    assert _get_values(backend, "SELECT SAFE_DIVIDE(a, b) AS ratio FROM `project.dataset.source`") == [[0.5], [None], [None], [1.0]]
+
+
+def test_regexp_contains(backend):
+    assert _get_values(backend, r"SELECT COUNTIF(REGEXP_CONTAINS(c, r'\d')) AS digit_count FROM `project.dataset.source`") == [[2]]
+
+
+def test_raw_and_double_quoted_strings(backend):
+    assert _get_values(backend, r"""SELECT "it's" AS double_quoted, r'\d+' AS raw, 'a\'b' AS escaped""") == [["it's", "\\d+", "a'b"]]
+
+
+def test_backtick_identifiers(backend):
+    assert _get_values(backend, "SELECT `a` FROM `project.dataset.source` WHERE `c` = 'x'") == [[4.0]]
+    assert _get_values(backend, "SELECT a FROM `project`.`dataset`.`source` WHERE c = 'y'") == [[None]]
+
+
+def test_columns_named_like_functions(backend):
+    assert _get_values(backend, "SELECT SUM(countif) AS countif_sum, SUM(safe_divide) AS safe_divide_sum FROM `project.dataset.source`") == [[10, 26]]
+
+
+def test_invalid_query_is_not_successful(backend):
+    assert not backend.executeQuery(query="SELECT FROM WHERE")["success"]
@@ -0,0 +1,88 @@
+import pandas as pd
+import pytest
+
+from rule_definitions import rule_definitions
+from tdq_engine.tdq_configuration import TDQConfiguration
+from tdq_engine.tdq_duckdb_backend import TDQDuckDBBackend
+from tdq_engine.tdq_engine import TDQEngine
+from tdq_engine.tdq_google_cloud_configuration import PERSISTENCE_MODE
+from tests.conftest import BASE_QUERY, SOURCE_TABLE
+
+RESULT_COLUMNS = ["check_type", "row_count", "unexpected_count", "expected_count", "unexpected_ratio", "expected_ratio", "is_passed"]
+
+
+def _prepare_source(days: list = None, rows_per_day: int = 24, hour_offset: int = 0) -> pd.DataFrame:
+    event_times = [pd.Timestamp(day) + pd.Timedelta(hours=hour + hour_offset) for day in days for hour in range(rows_per_day)]
+    return pd.DataFrame({"event_time": event_times,
+                         "amount": [None if index % 5 == 0 else index % 7 for index in range(len(event_times))]})
+
+
+def _prepare_rules() -> list:
+    return [rule_definitions.check_NULL(column_name="amount", threshold=0.1),
+            rule_definitions.check_BETWEEN(column_name="amount", min_value=1, max_value=5)]
+
+
+def _get_results(run_result: dict) -> list:
+    assert run_result["success"], run_result.get("error")
+    return run_result["tdq_results"].getResultsDataFrame()[RESULT_COLUMNS].astype(str).values.tolist()
+
+
+def _get_full_scan_results(source_data: pd.DataFrame = None) -> list:
+    engine = TDQEngine(dq_check_configuration=TDQConfiguration(tdq_check_name="reference"),
+                       execution_backend=TDQDuckDBBackend(sources={SOURCE_TABLE: source_data}))
+    return _get_results(engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules()))
+
+
+@pytest.fixture
+def incremental_engine(fake_engine, tdq_configuration):
+    tdq_configuration.setIncrementalColumn(incremental_column="event_time", incremental_column_type="TIMESTAMP")
+    return fake_engine
+
+
+def _get_partition_states(fake_bigquery) -> pd.DataFrame:
+    return pd.DataFrame(fake_bigquery.getRows(table_name="tdq_partition_states"))
+
+
+def test_timestamp_columns_are_stored_per_day(incremental_engine, fake_bigquery):
+    fake_bigquery.sources[SOURCE_TABLE] = _prepare_source(days=["2023-12-01", "2023-12-02"])
+    _get_results(incremental_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules()))
+
+    partition_states = _get_partition_states(fake_bigquery)
+    assert sorted(partition_states["partition_value"].unique()) == ["2023-12-01", "2023-12-02"]
+    assert len(partition_states) == 2 * len(_prepare_rules())
+
+
+@pytest.mark.parametrize("persistence_mode", [PERSISTENCE_MODE.STREAMING, PERSISTENCE_MODE.LOAD_JOB, PERSISTENCE_MODE.BUFFERED])
+def test_late_and_null_rows_are_rechecked(incremental_engine, fake_bigquery, gcp_configuration, persistence_mode):
+    gcp_configuration.setPersistenceMode(persistence_mode=persistence_mode)
+    first_source = _prepare_source(days=["2023-12-01", "2023-12-02"], rows_per_day=12)
+    fake_bigquery.sources[SOURCE_TABLE] = first_source
+    assert _get_results(incremental_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules())) == _get_full_scan_results(first_source)
+
+    # Late rows of the watermark day, a new day and rows without event time
+    null_rows = pd.DataFrame({"event_time": [pd.NaT] * 3, "amount": [None, 2, 9]})
+    second_source = pd.concat([first_source, _prepare_source(days=["2023-12-02"], rows_per_day=12, hour_offset=12),
+                               _prepare_source(days=["2023-12-03"]), null_rows], ignore_index=True)
+    fake_bigquery.sources[SOURCE_TABLE] = second_source
+    assert _get_results(incremental_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules())) == _get_full_scan_results(second_source)
+
+    # Unchanged source, the re-checked partitions replace their stored states
+    assert _get_results(incremental_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules())) == _get_full_scan_results(second_source)
+
+    partition_states = _get_partition_states(fake_bigquery)
+    assert partition_states["sketches"].map(lambda sketches: sketches in ("{}", {})).all()
+    if persistence_mode != PERSISTENCE_MODE.STREAMING:
+        assert any(table_id.endswith(".tdq_partition_states") for table_id in fake_bigquery.clients[0].load_jobs)
+
+
+def test_rule_sketches_are_stored(incremental_engine, fake_bigquery):
+
+    class check_NULL_WITH_SKETCHES(rule_definitions.check_NULL):
+
+        def _init_state_sketches(self) -> dict:
+            return {"distinct_values": []}
+
+    fake_bigquery.sources[SOURCE_TABLE] = _prepare_source(days=["2023-12-01"])
+    _get_results(incremental_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=[check_NULL_WITH_SKETCHES(column_name="amount")]))
+
+    assert _get_partition_states(fake_bigquery)["sketches"].tolist() == ['{"distinct_values": []}']
@@ -0,0 +1,125 @@
+import io
+import json
+import logging
+import sys
+import threading
+
+from rule_definitions import rule_definitions
+from tdq_engine.tdq_logging import get_logger, configure_logging, TDQJSONFormatter, FIELDS_ATTRIBUTE
+from tests.conftest import BASE_QUERY
+
+
+class TDQRecordingHandler(logging.Handler):
+    """
+    Records the log records of the TDQ engine logger. `on_handle` is called with each record before the handler
+    lock is acquired.
+    """
+
+    def __init__(self, on_handle: callable = None):
+        super().__init__(level=logging.DEBUG)
+        self.records = []
+        self.on_handle = on_handle
+
+    def handle(self, record: logging.LogRecord):
+        if self.on_handle is not None:
+            self.on_handle(record)
+        return super().handle(record)
+
+    def emit(self, record: logging.LogRecord):
+        self.records.append(record)
+
+
+def _record_logs(handler: logging.Handler = None):
+    logger = get_logger()
+    previous_level = logger.level
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    return lambda: (logger.removeHandler(handler), logger.setLevel(previous_level))
+
+
+def test_concurrent_runs_log_their_own_check_uuid(fake_engine):
+    # Both runs set their check_uuid before either of them logs anything else
+    barrier = threading.Barrier(2, timeout=10)
+    waiting_threads = set()
+
+    def wait_for_other_run(record: logging.LogRecord):
+        if ("check_uuid" in getattr(record, FIELDS_ATTRIBUTE, {})) and (record.thread not in waiting_threads):
+            waiting_threads.add(record.thread)
+            barrier.wait()
+
+    handler = TDQRecordingHandler(on_handle=wait_for_other_run)
+    stop_recording = _record_logs(handler=handler)
+    run_results = {}
+
+    def run_checks(column_name: str = None):
+        run_results[threading.get_ident()] = fake_engine.run_data_quality_checks(base_query=BASE_QUERY, save_results=False,
+                                                                                  tdq_rules=[rule_definitions.check_NULL(column_name=column_name)])
+
+    try:
+        threads = [threading.Thread(target=run_checks, args=(column_name,)) for column_name in ["a", "b"]]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        stop_recording()
+
+    check_uuids = {thread_id: str(run_result["tdq_results"].getCheckUUID()) for thread_id, run_result in run_results.items()}
+    assert len(set(check_uuids.values())) == 2
+    logged_check_uuids = [(record.thread, getattr(record, FIELDS_ATTRIBUTE)["check_uuid"]) for record in handler.records
+                          if "check_uuid" in getattr(record, FIELDS_ATTRIBUTE, {})]
+    assert {thread_id for thread_id, _ in logged_check_uuids} == set(check_uuids)
+    assert all(check_uuid == check_uuids[thread_id] for thread_id, check_uuid in logged_check_uuids)
+
+
+def test_check_fields_are_not_kept_after_the_run(fake_engine):
+    handler = TDQRecordingHandler()
+    stop_recording = _record_logs(handler=handler)
+    try:
+        assert fake_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=[rule_definitions.check_NULL(column_name="a")])["success"]
+        fake_engine._log_info("After the run")
+    finally:
+        stop_recording()
+
+    assert "check_uuid" in getattr(handler.records[-2], FIELDS_ATTRIBUTE)
+    assert getattr(handler.records[-1], FIELDS_ATTRIBUTE) == {}
+
+
+def test_json_formatter_adds_the_structured_fields():
+    record = logging.LogRecord(name="tdq_engine", level=logging.INFO, pathname=__file__, lineno=1, msg="Checked %s rules", args=(3,), exc_info=None)
+    setattr(record, FIELDS_ATTRIBUTE, {"check_uuid": "1234", "phase_seconds": {"sql_build": 0.5}})
+    log_record = json.loads(TDQJSONFormatter().format(record))
+
+    assert {key: log_record[key] for key in ["level", "logger", "message", "check_uuid", "phase_seconds"]} == \
+        {"level": "INFO", "logger": "tdq_engine", "message": "Checked 3 rules", "check_uuid": "1234", "phase_seconds": {"sql_build": 0.5}}
+    assert "time" in log_record
+
+
+def test_json_formatter_adds_the_exception():
+    try:
+        raise ValueError("Broken")
+    except ValueError:
+        record = logging.LogRecord(name="tdq_engine", level=logging.ERROR, pathname=__file__, lineno=1, msg="Failed", args=None, exc_info=sys.exc_info())
+    log_record = json.loads(TDQJSONFormatter().format(record))
+
+    assert log_record["message"] == "Failed"
+    assert "ValueError: Broken" in log_record["exception"]
+
+
+def test_configured_json_logging_of_a_run(fake_engine):
+    stream = io.StringIO()
+    previous_level = get_logger().level
+    handler = configure_logging(level=logging.INFO, json_format=True, stream=stream)
+    try:
+        run_result = fake_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=[rule_definitions.check_NULL(column_name="a")])
+    finally:
+        get_logger().removeHandler(handler)
+        get_logger().setLevel(previous_level)
+
+    log_records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    check_uuid = str(run_result["tdq_results"].getCheckUUID())
+    finished_record = next(log_record for log_record in log_records if log_record["message"].startswith("TDQ checks execution finished"))
+    assert finished_record["check_uuid"] == check_uuid
+    assert (finished_record["check_count"], finished_record["failed_count"]) == (1, 1)
+    assert "query_wait" in finished_record["phase_seconds"]
+    assert all(log_record["check_uuid"] == check_uuid for log_record in log_records if "check_uuid" in log_record)
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from rule_definitions import rule_definitions
+from tdq_engine.tdq_configuration import TDQConfiguration
+from tdq_engine.tdq_engine import TDQEngine
+from tdq_engine.tdq_pandas_backend import TDQPandasBackend
+
+
+@pytest.fixture
+def dataframe():
+    return pd.DataFrame({"a": [1.0, np.nan, 3.0, np.nan, 5.0], "c": ["x", "y", None, "x", "z"]})
+
+
+def _get_counts(execution_results: dict = None) -> list:
+    results = execution_results["results"].iloc[0]
+    return [int(results["row_count"]), [int(count) for count in results["unexpected_counts"]], [int(count) for count in results["expected_counts"]]]
+
+
+def test_rules_are_evaluated_on_the_dataframe(dataframe):
+    execution_results = TDQPandasBackend(dataframe=dataframe).executeRules(tdq_rules=[rule_definitions.check_NULL(column_name="a"),
+                                                                                      rule_definitions.check_IN(column_name="c", values=["x", "y"])])
+
+    assert execution_results["success"], execution_results.get("error")
+    assert _get_counts(execution_results) == [5, [2, 1], [3, 3]]
+
+
+def test_row_limit_is_honored(dataframe):
+    execution_results = TDQPandasBackend(dataframe=dataframe).executeRules(tdq_rules=[rule_definitions.check_NULL(column_name="a")], row_limit=2)
+
+    assert execution_results["success"], execution_results.get("error")
+    assert _get_counts(execution_results) == [2, [1], [1]]
+
+
+def test_missing_column_is_not_successful(dataframe):
+    execution_results = TDQPandasBackend(dataframe=dataframe).executeRules(tdq_rules=[rule_definitions.check_NULL(column_name="a"),
+                                                                                      rule_definitions.check_NULL(column_name="missing")])
+
+    assert not execution_results["success"]
+    assert "`missing` not found" in execution_results["error"]
+
+
+def test_missing_dataframe_is_not_successful():
+    execution_results = TDQPandasBackend().executeRules(tdq_rules=[rule_definitions.check_NULL(column_name="a")])
+
+    assert not execution_results["success"]
+    assert "DataFrame is not defined" in execution_results["error"]
+
+
+def test_engine_run_fails_on_a_missing_column(dataframe):
+    engine = TDQEngine(dq_check_configuration=TDQConfiguration(tdq_check_name="test"), execution_backend=TDQPandasBackend(dataframe=dataframe))
+    run_result = engine.run_data_quality_checks(base_query=None, tdq_rules=[rule_definitions.check_NULL(column_name="missing")])
+
+    assert not run_result["success"]
+    assert "`missing` not found" in run_result["error"]
@@ -0,0 +1,117 @@
+from rule_definitions import rule_definitions
+from tdq_engine.tdq_engine import TDQEngine
+from tdq_engine.tdq_google_cloud_configuration import PERSISTENCE_MODE
+from tests.conftest import BASE_QUERY
+
+
+def _prepare_rules() -> list:
+    return [rule_definitions.check_NULL(column_name="a"),
+            rule_definitions.check_BETWEEN(column_name="b", min_value=1, max_value=4),
+            rule_definitions.check_IN(column_name="c", values=["x", "y"]),
+            rule_definitions.check_NULL(column_name=None)]
+
+
+def test_results_are_saved_with_streaming_inserts(fake_engine, fake_bigquery):
+    run_result = fake_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules())
+
+    assert run_result["success"]
+    assert len(fake_bigquery.getRows(table_name="tdq_summary")) == 1
+    result_rows = fake_bigquery.getRows(table_name="tdq_results")
+    assert [(row["check_type"], row["unexpected_count"]) for row in result_rows if row["is_valid"]] == [("NULL", 1), ("BETWEEN", 2), ("IN", 1)]
+    assert fake_bigquery.clients[0].load_jobs == []
+
+
+def test_results_are_saved_with_load_jobs(fake_engine, fake_bigquery, gcp_configuration):
+    gcp_configuration.setPersistenceMode(persistence_mode=PERSISTENCE_MODE.LOAD_JOB)
+    run_result = fake_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules())
+
+    assert run_result["success"]
+    assert len(fake_bigquery.getRows(table_name="tdq_summary")) == 1
+    assert len(fake_bigquery.getRows(table_name="tdq_results")) == 4
+    assert len(fake_bigquery.clients[0].load_jobs) == 2
+
+
+def test_close_keeps_a_client_pool_passed_in_open(fake_bigquery, tdq_configuration, gcp_configuration):
+    client_pool = fake_bigquery.create_client_pool()
+    engine = TDQEngine(dq_check_configuration=tdq_configuration, gcp_configuration=gcp_configuration, client_pool=client_pool)
+    assert engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules())["success"]
+    engine.close()
+
+    assert not fake_bigquery.clients[0].closed
+    assert client_pool.getClientCount() == 1
+
+
+def test_close_closes_the_client_pool_created_by_the_engine(fake_bigquery, tdq_configuration, gcp_configuration):
+    engine = TDQEngine(dq_check_configuration=tdq_configuration, gcp_configuration=gcp_configuration)
+    engine.get_ClientPool().setClientFactory(client_factory=fake_bigquery.create_client)
+    assert engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules())["success"]
+    engine.close()
+
+    assert fake_bigquery.clients[0].closed
+    assert engine.get_ClientPool().getClientCount() == 0
+
+
+def test_buffered_results_are_written_at_interpreter_exit():
+    import os
+    import subprocess
+    import sys
+    import textwrap
+
+    # The exit hook registered first runs last, after the engine flushed its buffer
+    script = textwrap.dedent("""
+        import atexit
+        import pandas as pd
+        from rule_definitions import rule_definitions
+        from tdq_engine.tdq_configuration import TDQConfiguration
+        from tdq_engine.tdq_engine import TDQEngine
+        from tdq_engine.tdq_google_cloud_configuration import TDQGoogleCloudConfiguration, PERSISTENCE_MODE
+        from tests.conftest import TDQFakeBigQuery, SOURCE_TABLE, BASE_QUERY
+
+        fake_bigquery = TDQFakeBigQuery(sources={SOURCE_TABLE: pd.DataFrame({"a": [1, None]})})
+        atexit.register(lambda: print("saved_rows", len(fake_bigquery.getRows(table_name="tdq_results"))))
+        engine = TDQEngine(dq_check_configuration=TDQConfiguration(tdq_check_name="test"),
+                           gcp_configuration=TDQGoogleCloudConfiguration(project_id="tdq_project", dataset_id="tdq_dataset",
+                                                                         tdq_summary_table="tdq_summary", tdq_results_table="tdq_results",
+                                                                         persistence_mode=PERSISTENCE_MODE.BUFFERED),
+                           client_pool=fake_bigquery.create_client_pool())
+        run_result = engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=[rule_definitions.check_NULL(column_name="a")])
+        print("buffered_rows", len(fake_bigquery.getRows(table_name="tdq_results")))
+    """)
+    output = subprocess.run([sys.executable, "-c", script], cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            capture_output=True, text=True, check=True).stdout.split()
+
+    assert output == ["buffered_rows", "0", "saved_rows", "1"]
+
+
+def test_close_writes_buffered_results(fake_engine, fake_bigquery, gcp_configuration):
+    gcp_configuration.setPersistenceMode(persistence_mode=PERSISTENCE_MODE.BUFFERED)
+    assert fake_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules())["success"]
+    assert len(fake_bigquery.getRows(table_name="tdq_results")) == 0
+
+    assert fake_engine.close()["success"]
+    assert len(fake_bigquery.getRows(table_name="tdq_results")) == 4
+
+
+def test_failed_load_jobs_keep_their_rows_buffered(fake_engine, fake_bigquery, gcp_configuration):
+    gcp_configuration.setPersistenceMode(persistence_mode=PERSISTENCE_MODE.BUFFERED)
+    assert fake_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules())["success"]
+    batch_writer = fake_engine._get_batch_writer()
+    client = fake_bigquery.clients[0]
+    load_table_from_json = client.load_table_from_json
+
+    def fail_results_load(json_rows: list = None, destination: any = None, job_config: any = None):
+        if destination.endswith(".tdq_results"):
+            raise Exception("Load job failed")
+        return load_table_from_json(json_rows=json_rows, destination=destination, job_config=job_config)
+
+    client.load_table_from_json = fail_results_load
+    flush_result = batch_writer.flush()
+    assert not flush_result["success"]
+    assert flush_result["row_count"] == 1
+    assert len(fake_bigquery.getRows(table_name="tdq_summary")) == 1
+    assert batch_writer.getBufferedRowCount() == 4
+
+    client.load_table_from_json = load_table_from_json
+    assert batch_writer.flush() == {"success": True, "row_count": 4}
+    assert len(fake_bigquery.getRows(table_name="tdq_summary")) == 1
+    assert len(fake_bigquery.getRows(table_name="tdq_results")) == 4
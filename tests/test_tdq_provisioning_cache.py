@@ -0,0 +1,49 @@
+from rule_definitions import rule_definitions
+from tdq_engine.tdq_engine import TDQEngine
+from tdq_engine.tdq_provisioning_cache import TDQProvisioningCache
+from tests.conftest import BASE_QUERY
+
+
+def test_tables_are_provisioned_once(fake_engine, fake_bigquery):
+    assert fake_engine._prepare_tdq_tables()["success"]
+    client = fake_bigquery.clients[0]
+    created_table_count = len(client.created_tables)
+
+    # Skipped, nothing is created again
+    assert fake_engine._prepare_tdq_tables()["success"]
+    assert len(client.created_tables) == created_table_count
+
+
+def test_new_engine_does_not_provision_the_tables_again(fake_bigquery, tdq_configuration, gcp_configuration):
+    tdq_rules = [rule_definitions.check_NULL(column_name="a")]
+    first_engine = TDQEngine(dq_check_configuration=tdq_configuration, gcp_configuration=gcp_configuration,
+                             client_pool=fake_bigquery.create_client_pool())
+    assert first_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=tdq_rules)["success"]
+
+    # Another engine (own client pool, default provisioning cache), e.g. the next suite of the process
+    second_engine = TDQEngine(dq_check_configuration=tdq_configuration, gcp_configuration=gcp_configuration,
+                              client_pool=fake_bigquery.create_client_pool())
+    assert second_engine.get_ProvisioningCache() is first_engine.get_ProvisioningCache()
+    assert second_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=tdq_rules)["success"]
+    assert len(fake_bigquery.clients) == 2
+    assert len(fake_bigquery.clients[0].created_tables) > 0
+    assert fake_bigquery.clients[1].created_tables == []
+    assert len(fake_bigquery.getRows(table_name="tdq_summary")) == 2
+
+
+def test_provisioned_keys_are_per_instance():
+    first_cache = TDQProvisioningCache()
+    second_cache = TDQProvisioningCache()
+    key = first_cache.getKey(project_id="project", dataset_id="dataset", table_name="table", schema_hash="hash")
+    first_cache.markProvisioned(key=key)
+
+    assert first_cache.isProvisioned(key=key)
+    assert not first_cache.isProvisioned(key=first_cache.getKey(project_id="project", dataset_id="dataset", table_name="table", schema_hash="other_hash"))
+    assert not second_cache.isProvisioned(key=key)
+
+
+def test_marker_files_are_shared_across_processes(tmp_path):
+    key = TDQProvisioningCache().getKey(project_id="project", dataset_id="dataset", table_name="table", schema_hash="hash")
+    TDQProvisioningCache(cache_dir=str(tmp_path)).markProvisioned(key=key)
+
+    assert TDQProvisioningCache(cache_dir=str(tmp_path)).isProvisioned(key=key)
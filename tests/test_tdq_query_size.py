@@ -0,0 +1,34 @@
+import pytest
+
+from benchmarks.bench_sql_generation import BASE_QUERY, _prepare_rules
+from tdq_engine.tdq_engine import TDQEngine
+
+RULE_COUNTS = [10, 100, 1000, 10000]
+# Bytes added to the TDQ checks query per rule (every rule on its own column, no shared condition)
+MAX_FUSED_BYTES_PER_RULE = 100
+MAX_RULE_SQL_BYTES_PER_RULE = 1000
+
+
+@pytest.fixture(scope="module")
+def base_query_config():
+    return TDQEngine()._prepare_tdq_base_query(query=BASE_QUERY)
+
+
+def _get_bytes_per_rule(query: str = None, base_query_config: dict = None, rule_count: int = None) -> float:
+    return (len(query.encode("utf-8")) - len(base_query_config["base_query"].encode("utf-8"))) / rule_count
+
+
+@pytest.mark.parametrize("rule_count", RULE_COUNTS)
+def test_fused_check_query_size_per_rule(base_query_config, rule_count):
+    engine = TDQEngine()
+    query = engine._prepare_tdq_fused_check_query_config(base_query_config=base_query_config, tdq_rules=_prepare_rules(rule_count=rule_count))["tdq_check_query"]
+
+    assert _get_bytes_per_rule(query=query, base_query_config=base_query_config, rule_count=rule_count) <= MAX_FUSED_BYTES_PER_RULE
+    assert len(query.encode("utf-8")) <= TDQEngine.MAX_QUERY_LENGTH
+
+
+@pytest.mark.parametrize("rule_count", RULE_COUNTS)
+def test_rule_sql_size_per_rule(base_query_config, rule_count):
+    query = ",".join(tdq_rule.getRuleSQL(check_uuid=base_query_config["check_uuid"]) for tdq_rule in _prepare_rules(rule_count=rule_count))
+
+    assert len(query.encode("utf-8")) / rule_count <= MAX_RULE_SQL_BYTES_PER_RULE
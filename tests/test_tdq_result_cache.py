@@ -0,0 +1,64 @@
+from datetime import date, timedelta
+
+import pytest
+from google.cloud import bigquery
+
+from rule_definitions import rule_definitions
+from tests.conftest import BASE_QUERY, SOURCE_TABLE, TDQFakeBigQuery
+
+
+def _prepare_rules() -> list:
+    return [rule_definitions.check_NULL(column_name="a", threshold=0.3),
+            rule_definitions.check_BETWEEN(column_name="b", min_value=1, max_value=5)]
+
+
+@pytest.fixture
+def fake_bigquery(source_data):
+    fake_bigquery = TDQFakeBigQuery(sources={SOURCE_TABLE: source_data},
+                                    dry_run_handler=lambda query: {"total_bytes_processed": 1000,
+                                                                   "referenced_tables": [bigquery.TableReference.from_string(SOURCE_TABLE)]})
+    source_table = bigquery.Table(SOURCE_TABLE)
+    source_table._properties["lastModifiedTime"] = "1700000000000"
+    fake_bigquery.source_tables[SOURCE_TABLE] = source_table
+    return fake_bigquery
+
+
+@pytest.fixture
+def cached_engine(fake_engine, tdq_configuration):
+    tdq_configuration.setResultCache(result_cache=True, result_cache_days=7)
+    run_result = fake_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules())
+    assert run_result["success"] and (not run_result["tdq_results"].isCacheHit())
+    return fake_engine
+
+
+def _is_cache_hit(engine) -> bool:
+    run_result = engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules())
+    assert run_result["success"], run_result.get("error")
+    return run_result["tdq_results"].isCacheHit()
+
+
+def test_unchanged_run_is_a_cache_hit(cached_engine, fake_bigquery):
+    assert _is_cache_hit(cached_engine)
+    cache_query = next(query for query in fake_bigquery.clients[0].queries if "source_fingerprint" in query)
+    assert cache_query.count("check_date >=") == 2
+    assert "is_success" not in cache_query
+
+
+def test_runs_older_than_the_cache_days_are_not_used(cached_engine, fake_bigquery):
+    for table_name in ("tdq_summary", "tdq_results"):
+        for row in fake_bigquery.getRows(table_name=table_name):
+            row["check_date"] = date.today() - timedelta(days=8)
+    assert not _is_cache_hit(cached_engine)
+
+
+def test_sampled_runs_are_not_used(cached_engine, fake_bigquery):
+    for row in fake_bigquery.getRows(table_name="tdq_summary"):
+        row["sample_percent"] = 10.0
+    assert not _is_cache_hit(cached_engine)
+
+
+def test_incompletely_saved_results_are_not_used(cached_engine, fake_bigquery):
+    for table_id, rows in fake_bigquery.rows.items():
+        if table_id.endswith(".tdq_results"):
+            del rows[-1]
+    assert not _is_cache_hit(cached_engine)
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from rule_definitions import rule_definitions
+from rule_definitions.tdq_rule_state import TDQRuleState
+from tdq_engine.tdq_rule_counters import TDQRuleCounters
+
+VALUES = np.array([1.0, np.nan, 3.0, 4.0, 7.0, np.nan, 2.0], dtype=object)
+
+
+class check_MAX_BETWEEN(rule_definitions.check_BETWEEN):
+    # Custom rule keeping the maximum value in the state sketches
+
+    def _init_state_sketches(self) -> dict:
+        return {"max_value": None}
+
+    def _update_state_sketches(self, sketches: dict = None, values: any = None, is_null: any = None) -> dict:
+        chunk_values = [float(value) for value, value_is_null in zip(values, is_null) if not value_is_null]
+        return self._merge_state_sketches(sketches=sketches, other_sketches={"max_value": max(chunk_values, default=None)})
+
+    def _merge_state_sketches(self, sketches: dict = None, other_sketches: dict = None) -> dict:
+        max_values = [value for value in [sketches["max_value"], other_sketches["max_value"]] if value is not None]
+        return {"max_value": max(max_values, default=None)}
+
+
+def test_init_state_is_empty():
+    tdq_rule = rule_definitions.check_NULL(column_name="a")
+    state = tdq_rule.initState()
+
+    assert state.getRuleHash() == tdq_rule.getRuleHash()
+    assert (state.getRowCount(), state.getUnexpectedCount(), state.getExpectedCount()) == (0, 0, 0)
+    assert tdq_rule.finalizeState(state=state) == {"row_count": 0, "unexpected_count": 0, "expected_count": 0,
+                                                   "unexpected_ratio": 0.0, "expected_ratio": 0.0, "is_passed": True}
+
+
+def test_update_and_finalize_state():
+    tdq_rule = rule_definitions.check_NULL(column_name="a", threshold=0.25)
+    state = tdq_rule.updateState(state=tdq_rule.initState(), values=VALUES)
+
+    assert tdq_rule.finalizeState(state=state) == {"row_count": 7, "unexpected_count": 2, "expected_count": 5,
+                                                   "unexpected_ratio": 0.2857, "expected_ratio": 0.7143, "is_passed": False}
+
+
+@pytest.mark.parametrize("tdq_rule", [rule_definitions.check_NULL(column_name="a"),
+                                      rule_definitions.check_BETWEEN(column_name="a", min_value=2, max_value=4),
+                                      check_MAX_BETWEEN(column_name="a", min_value=2, max_value=4)])
+def test_merged_partial_states_match_a_single_pass(tdq_rule):
+    single_pass_state = tdq_rule.updateState(state=tdq_rule.initState(), values=VALUES)
+    first_state = tdq_rule.updateState(state=tdq_rule.initState(), values=VALUES[:3])
+    second_state = tdq_rule.updateState(state=tdq_rule.initState(), values=VALUES[3:])
+    merged_state = tdq_rule.mergeStates(state=first_state, other_state=second_state)
+
+    assert merged_state.toDict() == single_pass_state.toDict()
+    assert tdq_rule.finalizeState(state=merged_state) == tdq_rule.finalizeState(state=single_pass_state)
+
+
+def test_states_of_different_rules_can_not_be_merged():
+    tdq_rule = rule_definitions.check_BETWEEN(column_name="a", min_value=2, max_value=4)
+    other_rule = rule_definitions.check_BETWEEN(column_name="a", min_value=2, max_value=5)
+
+    with pytest.raises(Exception, match="different rule definitions"):
+        tdq_rule.mergeStates(state=tdq_rule.initState(), other_state=other_rule.initState())
+
+
+def test_state_json_round_trip():
+    tdq_rule = check_MAX_BETWEEN(column_name="a", min_value=2, max_value=4)
+    state = tdq_rule.updateState(state=tdq_rule.initState(), values=VALUES)
+    restored_state = TDQRuleState.fromJSON(state=state.toJSON())
+
+    assert restored_state.toDict() == state.toDict()
+    assert restored_state.getSketches() == {"max_value": 7.0}
+    assert tdq_rule.finalizeState(state=restored_state) == tdq_rule.finalizeState(state=state)
+
+
+def test_rule_counters_merge():
+    rule_counters = TDQRuleCounters(rule_count=2)
+    rule_counters.update(row_count=3, unexpected_counts=[1, 0], expected_counts=[2, 3])
+    other_rule_counters = TDQRuleCounters.fromDict(counters={"row_count": 2, "unexpected_counts": [1, 1], "expected_counts": [1, 1]})
+
+    assert rule_counters.merge(rule_counters=other_rule_counters).toDict() == {"row_count": 5, "unexpected_counts": [2, 1], "expected_counts": [3, 4]}
+
+
+def test_rule_counters_of_different_rule_counts_can_not_be_merged():
+    rule_counters = TDQRuleCounters(rule_count=2)
+
+    with pytest.raises(Exception, match="different rule sets"):
+        rule_counters.merge(rule_counters=TDQRuleCounters(rule_count=3))
+    assert rule_counters.toDict() == {"row_count": 0, "unexpected_counts": [0, 0], "expected_counts": [0, 0]}
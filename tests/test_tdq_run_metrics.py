@@ -0,0 +1,39 @@
+import json
+
+from rule_definitions import rule_definitions
+from tests.conftest import BASE_QUERY
+
+
+def _prepare_rules() -> list:
+    return [rule_definitions.check_NULL(column_name="a"),
+            rule_definitions.check_BETWEEN(column_name="b", min_value=1, max_value=4)]
+
+
+def test_run_metrics_are_saved_in_the_summary_row(fake_engine, fake_bigquery):
+    run_result = fake_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules())
+    assert run_result["success"]
+
+    summary_rows = fake_bigquery.getRows(table_name="tdq_summary")
+    assert len(summary_rows) == 1
+    phase_seconds = json.loads(summary_rows[0]["phase_seconds"])
+    assert list(phase_seconds) == ["table_prep", "sql_build", "query_submit", "query_wait", "fetch", "result_processing"]
+    assert all(seconds >= 0 for seconds in phase_seconds.values())
+    assert summary_rows[0]["job_id"] == f"fake_job_{len(fake_bigquery.clients[0].queries)}"
+    assert summary_rows[0]["total_bytes_processed"] == 0
+    assert summary_rows[0]["query_cache_hit"] is False
+
+
+def test_each_run_has_its_own_run_metrics(fake_engine):
+    first_run_metrics = fake_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules())["tdq_results"].getRunMetrics()
+    second_run_metrics = fake_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=_prepare_rules())["tdq_results"].getRunMetrics()
+
+    assert first_run_metrics is not second_run_metrics
+    assert len(first_run_metrics.getJobIds()) == 1
+    assert len(second_run_metrics.getJobIds()) == 1
+    assert first_run_metrics.getJobIds() != second_run_metrics.getJobIds()
+
+
+def test_test_rule_is_not_measured(fake_engine, capsys):
+    fake_engine.test_rule(base_query=BASE_QUERY, tdq_rule=rule_definitions.check_NULL(column_name="a"))
+
+    assert "Passed" in capsys.readouterr().out
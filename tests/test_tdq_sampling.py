@@ -0,0 +1,66 @@
+import pytest
+
+from tdq_engine.tdq_query_rewriter import TDQQueryRewriter
+from tdq_engine.tdq_statistics import get_z_score, wilson_interval, decide_passed
+
+SAMPLE = "TABLESAMPLE SYSTEM (10 PERCENT)"
+
+
+def _sample(query: str = None) -> str:
+    return TDQQueryRewriter().prepareBaseQuery(query=query, base_cte="cte_query_base", sample_percent=10)
+
+
+def test_z_score():
+    assert get_z_score(confidence_level=0.95) == pytest.approx(1.96, abs=1e-3)
+    assert get_z_score(confidence_level=0.99) == pytest.approx(2.576, abs=1e-3)
+    with pytest.raises(Exception, match="between 0 and 1"):
+        get_z_score(confidence_level=1.0)
+
+
+def test_wilson_interval():
+    lower, upper = wilson_interval(counts=[10, 0, 100], row_counts=[100, 100, 100], confidence_level=0.95)
+
+    assert lower.tolist() == pytest.approx([0.0552, 0.0, 0.9630], abs=1e-4)
+    assert upper.tolist() == pytest.approx([0.1744, 0.0370, 1.0], abs=1e-4)
+
+
+def test_wilson_interval_of_an_empty_sample_is_unknown():
+    lower, upper = wilson_interval(counts=[0], row_counts=[0])
+
+    assert (lower.tolist(), upper.tolist()) == ([0.0], [1.0])
+
+
+def test_wilson_interval_narrows_with_the_sample_size():
+    lower, upper = wilson_interval(counts=[10, 1000], row_counts=[100, 10000])
+
+    assert (upper - lower)[1] < (upper - lower)[0]
+
+
+def test_decide_passed():
+    # Clear pass, clear fail, interval across the threshold, upper bound at the threshold
+    assert decide_passed(lower=[0.01, 0.2, 0.05, 0.0], upper=[0.04, 0.3, 0.15, 0.1], thresholds=[0.1, 0.1, 0.1, 0.1]) == [True, False, None, True]
+
+
+def test_the_driving_table_is_sampled():
+    assert _sample("SELECT * FROM `p.d.a`") == f"WITH cte_query_base AS (SELECT * FROM `p.d.a` {SAMPLE})"
+
+
+def test_joined_tables_are_not_sampled():
+    assert _sample("SELECT * FROM `p.d.a` AS a JOIN `p.d.b` AS b USING (id) LEFT JOIN `p.d.c` AS c USING (id)") == \
+        f"WITH cte_query_base AS (SELECT * FROM `p.d.a` AS a {SAMPLE} JOIN `p.d.b` AS b USING (id) LEFT JOIN `p.d.c` AS c USING (id))"
+
+
+def test_the_driving_table_is_followed_through_ctes_and_subqueries():
+    assert _sample("WITH x AS (SELECT * FROM (SELECT * FROM `p.d.a`) JOIN `p.d.b` USING (id)) SELECT * FROM x JOIN `p.d.c` USING (id)") == \
+        f"WITH x AS (SELECT * FROM (SELECT * FROM `p.d.a` {SAMPLE}) JOIN `p.d.b` USING (id)), " \
+        f"cte_query_base AS (SELECT * FROM x JOIN `p.d.c` USING (id))"
+
+
+def test_each_union_branch_is_sampled():
+    assert _sample("SELECT id FROM `p.d.a` UNION ALL SELECT id FROM `p.d.b` JOIN `p.d.c` USING (id)") == \
+        f"WITH cte_query_base AS (SELECT id FROM `p.d.a` {SAMPLE} UNION ALL SELECT id FROM `p.d.b` {SAMPLE} JOIN `p.d.c` USING (id))"
+
+
+def test_filter_subqueries_and_existing_samples_are_not_changed():
+    assert _sample("SELECT * FROM `p.d.a` TABLESAMPLE SYSTEM (1 PERCENT) WHERE id IN (SELECT id FROM `p.d.b`)") == \
+        "WITH cte_query_base AS (SELECT * FROM `p.d.a` TABLESAMPLE SYSTEM (1 PERCENT) WHERE id IN (SELECT id FROM `p.d.b`))"
@@ -0,0 +1,69 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from rule_definitions import rule_definitions
+from tdq_engine.tdq_arrow_streaming_backend import TDQArrowStreamingBackend
+from tdq_engine.tdq_configuration import TDQConfiguration
+from tdq_engine.tdq_engine import TDQEngine
+from tdq_engine.tdq_pandas_backend import TDQPandasBackend
+from tdq_engine.tdq_sharded_execution_backend import TDQShardedExecutionBackend
+
+RESULT_COLUMNS = ["check_type", "column_name", "row_count", "unexpected_count", "expected_count", "unexpected_ratio", "expected_ratio", "is_passed"]
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    import pyarrow.feather as feather
+
+    random = np.random.default_rng(seed=12)
+    row_count = 5000
+    data = pd.DataFrame({"amount": np.where(random.random(row_count) < 0.1, np.nan, random.integers(-50, 150, row_count).astype(float)),
+                         "country": pd.Series(random.choice(["DE", "NL", "", " ", None], row_count), dtype=object),
+                         "is_active": pd.Series(random.choice([True, False, None], row_count), dtype=object)})
+    os.makedirs(tmp_path / "part")
+    data.iloc[:2000].to_parquet(tmp_path / "first.parquet", row_group_size=150)
+    data.iloc[2000:3500].to_parquet(tmp_path / "part" / "second.parquet", row_group_size=400)
+    feather.write_feather(data.iloc[3500:].reset_index(drop=True), str(tmp_path / "third.arrow"), chunksize=321)
+    return data, str(tmp_path)
+
+
+def _prepare_rules() -> list:
+    return [rule_definitions.check_NULL(column_name="amount", threshold=0.05),
+            rule_definitions.check_NOT_NULL(column_name="amount"),
+            rule_definitions.check_BETWEEN(column_name="amount", min_value=0, max_value=100),
+            rule_definitions.check_GREATER_THAN(column_name="amount", value=10, or_equal=True),
+            rule_definitions.check_IN(column_name="country", values=["DE", "NL"]),
+            rule_definitions.check_NULL_OR_EMPTY(column_name="country", is_trimmed=True),
+            rule_definitions.check_STRING_CONTAINS(column_name="country", search_value="d", case_sensitive=False),
+            rule_definitions.check_IS_TRUE(column_name="is_active"),
+            rule_definitions.check_IS_FALSE(column_name="is_active")]
+
+
+def _run(execution_backend: any = None) -> list:
+    with TDQEngine(dq_check_configuration=TDQConfiguration(tdq_check_name="test"), execution_backend=execution_backend) as engine:
+        run_result = engine.run_data_quality_checks(base_query=None, tdq_rules=_prepare_rules())
+    assert run_result["success"], run_result.get("error")
+    return run_result["tdq_results"].getResultsDataFrame()[RESULT_COLUMNS].astype(str).values.tolist()
+
+
+def test_sharded_counts_match_single_process_backends(dataset):
+    data, path = dataset
+    sharded_execution_backend = TDQShardedExecutionBackend(paths=path, batch_size=100, max_workers=2, shards_per_worker=3)
+    # Row groups of both Parquet files are split over several shards
+    assert len(sharded_execution_backend._prepare_shards()) > 3
+
+    sharded_results = _run(execution_backend=sharded_execution_backend)
+    assert sharded_results == _run(execution_backend=TDQArrowStreamingBackend(paths=path, batch_size=100))
+    assert sharded_results == _run(execution_backend=TDQPandasBackend(dataframe=data))
+
+
+def test_max_workers_defaults_to_cpu_count(dataset):
+    _, path = dataset
+    sharded_execution_backend = TDQShardedExecutionBackend(paths=path, max_workers=1)
+    sharded_execution_backend.setMaxWorkers(max_workers=None)
+
+    assert sharded_execution_backend.getMaxWorkers() == (os.cpu_count() or 1)
+    assert len(sharded_execution_backend._prepare_shards()) > 0
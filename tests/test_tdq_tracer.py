@@ -0,0 +1,66 @@
+import pytest
+
+from rule_definitions import rule_definitions
+from tdq_engine.tdq_tracer import TDQTracer, TDQInMemoryTracer
+from tests.conftest import BASE_QUERY
+
+
+def _run_checks(fake_engine=None, tracer: TDQTracer = None) -> dict:
+    fake_engine.set_Tracer(tracer=tracer)
+    run_result = fake_engine.run_data_quality_checks(base_query=BASE_QUERY, tdq_rules=[rule_definitions.check_NULL(column_name="a")])
+    assert run_result["success"], run_result.get("error")
+    return run_result
+
+
+def test_engine_spans_are_recorded(fake_engine):
+    tracer = TDQInMemoryTracer()
+    _run_checks(fake_engine=fake_engine, tracer=tracer)
+
+    span_names = [span["name"] for span in tracer.getSpans()]
+    assert span_names[:4] == ["prepare_tdq_base_query", "prepare_tdq_check_query_config", "execute_bq_query", "process_check_results"]
+    assert {"save_tdq_result", "save_summary", "save_tdq_check_results"} <= set(span_names)
+    assert tracer.getSpans(name="prepare_tdq_check_query_config")[0]["attributes"] == {"rule_count": 1}
+    assert all((span["duration_seconds"] >= 0) and (span["error"] is None) for span in tracer.getSpans())
+    assert tracer.getSummary()["execute_bq_query"]["count"] == 1
+
+
+def test_nested_spans_have_a_parent():
+    tracer = TDQInMemoryTracer()
+    with tracer.span(name="outer"):
+        with tracer.span(name="inner", rule_count=2):
+            pass
+
+    inner_span, outer_span = tracer.getSpans()
+    assert (inner_span["name"], outer_span["name"]) == ("inner", "outer")
+    assert inner_span["parent_span_id"] == outer_span["span_id"]
+    assert outer_span["parent_span_id"] is None
+
+
+def test_span_errors_are_recorded_and_raised():
+    tracer = TDQInMemoryTracer()
+    with pytest.raises(ValueError):
+        with tracer.span(name="failing"):
+            raise ValueError("Broken")
+
+    assert tracer.getSpans(name="failing")[0]["error"] == "Broken"
+    assert tracer.getSummary()["failing"]["error_count"] == 1
+
+
+def test_spans_are_not_profiled_by_default(fake_engine):
+    tracer = TDQInMemoryTracer()
+    _run_checks(fake_engine=fake_engine, tracer=tracer)
+
+    assert tracer.getProfileStats() is None
+
+
+def test_profiled_spans_are_captured_with_cprofile(fake_engine):
+    tracer = TDQInMemoryTracer(profile=True)
+    _run_checks(fake_engine=fake_engine, tracer=tracer)
+
+    profile_stats = tracer.getProfileStats()
+    assert profile_stats is not None
+    profiled_functions = {function_name for _, _, function_name in profile_stats.stats}
+    assert "_prepare_tdq_fused_check_query_config" in profiled_functions
+
+    tracer.clear()
+    assert (tracer.getSpans(), tracer.getProfileStats()) == ([], None)